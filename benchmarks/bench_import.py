@@ -0,0 +1,90 @@
+"""
+Measures how long `import rlpy` takes with `python -X importtime`, and checks it against a time budget.
+
+Every run starts a fresh interpreter, and the fastest run is reported along with the slowest modules it imported. The
+check also fails if importing rlpy loaded any of the heavy dependencies that should only load on first use:
+
+	python benchmarks/bench_import.py --budget 60
+	python benchmarks/bench_import.py -m rlpy.sync_api --allow-deferred --budget 400
+
+The check exits with status 1 if the import took longer than the budget, or loaded a deferred dependency.
+"""
+from argparse import ArgumentParser
+from os import environ
+from os.path import dirname, realpath
+from subprocess import run
+from sys import argv, executable
+
+
+ROOT = dirname(dirname(realpath(__file__)))
+DEFERRED_MODULES = ("playwright", "bs4", "tabulate", "pytz", "numpy", "httpx", "lxml", "selectolax")
+
+
+def parse_importtime(output:str) -> dict[str, tuple[int, int]]:
+	"""
+	Reads the report `-X importtime` writes to stderr.
+
+	:param str output:
+	:return: The self and cumulative import time, in microseconds, of each module.
+	"""
+	times = {}
+	for line in output.splitlines():
+		if not line.startswith("import time:") or "[us]" in line:
+			continue
+		own, cumulative, name = line.removeprefix("import time:").split("|")
+		times[name.strip()] = (int(own), int(cumulative))
+	return times
+
+
+def time_import(module:str) -> tuple[dict[str, tuple[int, int]], list[str]]:
+	"""
+	Imports a module in a new interpreter.
+
+	:param str module:
+	:return: The import times of every module that was imported, and the deferred dependencies that were loaded.
+	"""
+	code = f"import sys, {module}; print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+	process = run([executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True,
+				  env={**environ, "PYTHONPATH": ROOT})
+	if process.returncode != 0:
+		raise RuntimeError(f"Could not import {module}:\n{process.stderr}")
+	loaded = process.stdout.strip()
+	return parse_importtime(process.stderr), loaded.split(",") if loaded else []
+
+
+def create_argument_parser() -> ArgumentParser:
+	parser = ArgumentParser(prog="bench_import", description="Benchmarks how long importing rlpy takes.")
+	parser.add_argument("-m", "--module", default="rlpy", help="The module to import.")
+	parser.add_argument("-r", "--repeat", type=int, default=5, help="The number of imports. The fastest one is reported.")
+	parser.add_argument("-t", "--top", type=int, default=10, help="The number of slowest modules to list.")
+	parser.add_argument("--budget", type=float, help="The most milliseconds the import may take.")
+	parser.add_argument("--allow-deferred", action="store_true",
+						help="Do not fail when the import loads a dependency that should only load on first use.")
+	return parser
+
+
+def main(args=None) -> int:
+	arguments = create_argument_parser().parse_args(args)
+	runs = [time_import(arguments.module) for _ in range(arguments.repeat)]
+	times, loaded = min(runs, key=lambda result: result[0][arguments.module][1])
+	total = times[arguments.module][1] / 1000
+
+	slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)[:arguments.top]
+	width = max(len(name) for name, _ in slowest)
+	print(f"{'Module':<{width}}  {'Self ms':>8}  {'Cumulative ms':>13}")
+	for name, (own, cumulative) in slowest:
+		print(f"{name:<{width}}  {own / 1000:>8.1f}  {cumulative / 1000:>13.1f}")
+	print(f"\nimport {arguments.module}: {total:.1f} ms")
+
+	failed = False
+	if loaded and not arguments.allow_deferred:
+		print(f"Importing {arguments.module} loaded deferred dependencies: {', '.join(loaded)}.")
+		failed = True
+	if arguments.budget is not None and total > arguments.budget:
+		print(f"Importing {arguments.module} took {total:.1f} ms, over the budget of {arguments.budget:.1f} ms.")
+		failed = True
+	return 1 if failed else 0
+
+
+if __name__ == "__main__":
+	exit(main(argv[1:]))
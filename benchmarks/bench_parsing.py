@@ -0,0 +1,167 @@
+"""
+Offline benchmarks for the scraping hot path, run against the saved RLStats pages in `benchmarks/fixtures`.
+
+Every operation is timed with `timeit` and reported as operations per second, along with the peak memory allocated
+by one call. Results can be saved as a baseline and later runs compared against it:
+
+	python benchmarks/bench_parsing.py --save-baseline baseline.json
+	python benchmarks/bench_parsing.py --baseline baseline.json
+
+The comparison exits with status 1 if any operation got slower, or used more memory, than the tolerance allows.
+"""
+from argparse import ArgumentParser
+from importlib.util import find_spec
+from json import dump, load
+from os.path import dirname, join, realpath
+from sys import argv, path
+from timeit import Timer
+from tracemalloc import get_traced_memory, reset_peak, start, stop
+
+path.insert(0, dirname(dirname(realpath(__file__))))
+
+from rlpy import Playlist, UserPlaylist, UserScrapeError, available_parsers
+from rlpy.sync_api import User
+
+
+FIXTURE_DIR = join(dirname(realpath(__file__)), "fixtures")
+FIXTURES = ("ranked", "unranked", "casual_only", "error")
+
+
+def load_fixture(name:str) -> str:
+	with open(join(FIXTURE_DIR, f"{name}.html"), encoding="utf-8") as f:
+		return f.read()
+
+
+def _process(html:str, **kwargs):
+	try:
+		User("SomePlayer", "Epic")._process_html(html, **kwargs)
+	except UserScrapeError:
+		pass
+
+
+def create_benchmarks(parsers:list[str], partial:bool) -> dict[str, "Callable[[], Any]"]:
+	"""
+	Builds every benchmark that will be run.
+
+	:param parsers: The parser backends to time `_process_data` with.
+	:param bool partial: If `_process_data` should also be timed with partial parsing.
+	:return: The benchmarks, by name.
+	"""
+	benchmarks = {}
+	for fixture in FIXTURES:
+		html = load_fixture(fixture)
+		for parser in parsers:
+			benchmarks[f"_process_data[{fixture}, {parser}]"] = lambda html=html, parser=parser: _process(html, parser=parser)
+			if partial:
+				benchmarks[f"_process_data[{fixture}, {parser}, partial]"] = lambda html=html, parser=parser: _process(html, parser=parser, partial_parse=True)
+
+	standard = Playlist.PLAYLISTS["Ranked Standard 3v3"]
+	champion = standard.get_rank("Champion II")
+	benchmarks.update({
+		"UserPlaylist.from_text[ranked]": lambda: UserPlaylist.from_text("3v3 Standard", "Champion II", "Division II", "1,219", 4, "2,012"),
+		"UserPlaylist.from_text[casual]": lambda: UserPlaylist.from_text("Casual", "Unranked", "Division I", 1003, None, None),
+		"Playlist.get_rank[full name]": lambda: standard.get_rank("Champion II"),
+		"Playlist.get_rank[GC 1]": lambda: standard.get_rank("GC 1"),
+		"Playlist.get_rank[Unranked]": lambda: standard.get_rank("Unranked"),
+		"Rank.get_division[inside]": lambda: champion.get_division(champion.division_2.lower_bound),
+		"Rank.get_division[tolerance]": lambda: champion.get_division(champion.division_1.lower_bound - 10),
+		"Rank.get_division[default]": lambda: champion.get_division(0, default_div=3),
+	})
+	if find_spec("numpy") is not None:
+		mmrs = list(range(-100, 2000)) * 5
+		benchmarks["Playlist.classify_many[10,500 MMRs]"] = lambda: standard.classify_many(mmrs)
+	return benchmarks
+
+
+def run_benchmark(func:"Callable[[], Any]", number:int, repeat:int) -> dict[str, float]:
+	"""
+	Times one benchmark.
+
+	:param func:
+	:param int number: The number of calls in each timing run.
+	:param int repeat: The number of timing runs. The fastest run is reported.
+	:return: The operations per second and the peak number of bytes allocated by one call.
+	"""
+	best = min(Timer(func).repeat(repeat=repeat, number=number)) / number
+
+	start()
+	reset_peak()
+	func()
+	peak = get_traced_memory()[1]
+	stop()
+	return {"ops_per_sec": 1 / best, "peak_bytes": peak}
+
+
+def compare(results:dict[str, dict[str, float]], baseline:dict[str, dict[str, float]], tolerance:float) -> list[str]:
+	"""
+	Finds the benchmarks that regressed against a baseline.
+
+	:return: A description of each regression.
+	"""
+	regressions = []
+	for name, result in results.items():
+		old = baseline.get(name, None)
+		if old is None:
+			continue
+		if result["ops_per_sec"] < old["ops_per_sec"] * (1 - tolerance):
+			regressions.append(f"{name} is slower: {result['ops_per_sec']:,.0f} ops/s, was {old['ops_per_sec']:,.0f} ops/s.")
+		if result["peak_bytes"] > old["peak_bytes"] * (1 + tolerance):
+			regressions.append(f"{name} uses more memory: {result['peak_bytes']:,} bytes, was {old['peak_bytes']:,} bytes.")
+	return regressions
+
+
+def create_argument_parser() -> ArgumentParser:
+	parser = ArgumentParser(prog="bench_parsing", description="Benchmarks the rlpy parsing hot path offline.")
+	parser.add_argument("-p", "--parser", action="append", choices=available_parsers(),
+						help="A parser backend to benchmark. May be given more than once. Defaults to every installed backend.")
+	parser.add_argument("--partial", action="store_true", help="Also benchmark partial-document parsing.")
+	parser.add_argument("-k", "--filter", default="", help="Only run benchmarks whose name contains this text.")
+	parser.add_argument("-n", "--number", type=int, default=200, help="The number of calls in each timing run.")
+	parser.add_argument("-r", "--repeat", type=int, default=5, help="The number of timing runs for each benchmark.")
+	parser.add_argument("--save-baseline", metavar="FILE", help="Save the results as a baseline.")
+	parser.add_argument("--baseline", metavar="FILE", help="Compare the results against a saved baseline.")
+	parser.add_argument("--tolerance", type=float, default=0.10,
+						help="The fraction an operation can regress by before the comparison fails.")
+	return parser
+
+
+def main(args=None) -> int:
+	from tabulate import tabulate
+
+	arguments = create_argument_parser().parse_args(args)
+	User.CACHE = None
+	benchmarks = create_benchmarks(arguments.parser or available_parsers(), arguments.partial)
+	baseline = None
+	if arguments.baseline:
+		with open(arguments.baseline) as f:
+			baseline = load(f)
+
+	results = {}
+	rows = []
+	for name, func in benchmarks.items():
+		if arguments.filter not in name:
+			continue
+		results[name] = result = run_benchmark(func, arguments.number, arguments.repeat)
+		row = [name, f"{result['ops_per_sec']:,.0f}", f"{result['peak_bytes'] / 1024:,.1f}"]
+		if baseline is not None:
+			old = baseline.get(name, None)
+			row.append("new" if old is None else f"{result['ops_per_sec'] / old['ops_per_sec'] - 1:+.1%}")
+		rows.append(row)
+
+	headers = ["Benchmark", "ops/s", "Peak KiB"] + (["vs. baseline"] if baseline is not None else [])
+	print(tabulate(rows, headers=headers, tablefmt="simple"))
+
+	if arguments.save_baseline:
+		with open(arguments.save_baseline, "w") as f:
+			dump(results, f, indent="\t")
+
+	if baseline is not None:
+		regressions = compare(results, baseline, arguments.tolerance)
+		for regression in regressions:
+			print(regression)
+		return 1 if regressions else 0
+	return 0
+
+
+if __name__ == "__main__":
+	exit(main(argv[1:]))
@@ -1,6 +1,37 @@
 from ._enum_classes import *
 from ._exceptions import *
-from .match import *
-from .season_tools import scrape_skill_distributions
-from .tools import *
+from .cache import ProfileCache, UserCache
+from .parsers import ParserBackend, PARSER_BACKENDS, available_parsers, get_parser
+from .rate_limit import RateLimiter, DEFAULT_RATE_LIMITER
+from .scrape_profile import ScrapeProfile, SCRAPE_PROFILES, get_scrape_profile
 from .user_playlist import UserPlaylist
+
+
+# Names from modules that are only imported the first time one of them is used, since they pull in heavier modules
+_LAZY_NAMES = {
+	"RLTeam": ".match", "Match": ".match", "StarLeague": ".match",
+	"BaseUser": ".user", "ScrapeResult": ".user",
+	"RequestClient": ".request_api", "AsyncRequestClient": ".request_api",
+	"scrape_skill_distributions": ".season_tools",
+	"get_timezone": ".tools", "storage_state_expired": ".tools", "save_storage_state": ".tools",
+}
+
+
+__all__ = [*_enum_classes.__ALL__, *_exceptions.__ALL__, "ProfileCache", "UserCache", "ParserBackend", "PARSER_BACKENDS",
+		   "available_parsers", "get_parser", "RateLimiter", "DEFAULT_RATE_LIMITER", "ScrapeProfile", "SCRAPE_PROFILES",
+		   "get_scrape_profile", "UserPlaylist", *_LAZY_NAMES]
+
+
+def __getattr__(name:str):
+	module = _LAZY_NAMES.get(name, None)
+	if module is None:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	from importlib import import_module
+
+	value = getattr(import_module(module, __name__), name)
+	globals()[name] = value
+	return value
+
+
+def __dir__() -> list[str]:
+	return sorted({*globals(), *_LAZY_NAMES})
@@ -1,12 +1,18 @@
 from argparse import ArgumentParser
 from os import getenv
 from sys import argv
-from .sync_api import User
 from ._enum_classes import *
 
 
 def _add_common_options(parser):
-	pass
+	parser.add_argument("--socket", default=getenv("RLPY_SOCKET", None),
+						help="Forward the command to the rlpy daemon listening on this socket. Defaults to $RLPY_SOCKET.")
+
+
+def _add_starleague_options(parser):
+	parser.add_argument("--nsl-username", default=getenv("nsl_username", None), help="The NACE StarLeague username.")
+	parser.add_argument("--nsl-password", default=getenv("nsl_password", None), help="The NACE StarLeague password.")
+	parser.add_argument("--storage-state", help="A file the NACE StarLeague session is saved to and reused from.")
 
 
 def _create_user_parser(parser_factory):
@@ -25,6 +31,182 @@ def _create_playvs_parser(parser_factory):
 	return parser
 
 
+def _create_batch_parser(parser_factory):
+	from .scrape_profile import SCRAPE_PROFILES
+
+	parser = parser_factory("batch", help="Collecting data for many users at once, written as one JSON object per line")
+	_add_common_options(parser)
+	parser.add_argument("input", nargs="?", default="-",
+						help="A file of `username,console` rows. Reads from stdin if it is `-` or not given.")
+	parser.add_argument("-o", "--output", default="-", help="The file the JSON lines are written to. Defaults to stdout.")
+	parser.add_argument("-n", "--concurrency", type=int, default=4, help="The number of users scraped at the same time.")
+	parser.add_argument("--profile", choices=list(SCRAPE_PROFILES), help="The scrape profile used by the shared browser.")
+	parser.add_argument("--request-api", action="store_true",
+						help="Download the pages over plain HTTP instead of loading them in a browser. Requires httpx.")
+	return parser
+
+
+def _read_batch_users(rows, on_error):
+	"""
+	Reads `username,console` rows, skipping blank lines, `#` comments, and a `username,console` header.
+
+	:param rows: The lines of the input.
+	:param on_error: Called with the line number, row, and error for each row that does not name a valid console.
+	:return: The username and console of each valid row.
+	"""
+	from csv import reader
+
+	for line_number, row in enumerate(reader(rows), 1):
+		row = [value.strip() for value in row]
+		if not any(row) or row[0].startswith("#"):
+			continue
+		if line_number == 1 and [value.lower() for value in row[:2]] == ["username", "console"]:
+			continue
+		try:
+			if len(row) != 2:
+				raise ValueError(f"Expected `username,console` but found {len(row)} values.")
+			yield row[0], convert_str_to_console(row[1])
+		except (ValueError, ConsoleNotFoundError) as e:
+			on_error(line_number, row, e)
+
+
+def _run_batch(arguments) -> int:
+	"""
+	Scrapes every user in the batch input, through the daemon if there is one, and streams the results as JSON lines.
+
+	:return: 0 if every user was scraped, and 1 if any of them failed.
+	"""
+	from json import dumps
+	from sys import stdin, stdout
+
+	failures = 0
+
+	def write(record):
+		nonlocal failures
+		if not record["ok"]:
+			failures += 1
+		output.write(dumps(record) + "\n")
+		output.flush()
+
+	def invalid_row(line_number, row, error):
+		write({"username": row[0] if row else None, "console": row[1] if len(row) > 1 else None, "ok": False,
+			   "elapsed": 0.0, "error": f"Line {line_number}: {error}", "error_type": type(error).__name__, "data": None})
+
+	async def scrape():
+		from .async_api import iter_users
+
+		async for result in iter_users(_read_batch_users(rows, invalid_row), concurrency=arguments.concurrency,
+									   profile=arguments.profile, use_request_api=arguments.request_api):
+			write(result.to_dict())
+
+	rows = stdin if arguments.input == "-" else open(arguments.input, newline="", encoding="utf-8")
+	output = stdout if arguments.output == "-" else open(arguments.output, "w", encoding="utf-8")
+	try:
+		if arguments.socket:
+			from .daemon import DaemonClient
+
+			users = [(username, console.value) for username, console in _read_batch_users(rows, invalid_row)]
+			for record in DaemonClient(arguments.socket).batch(users, arguments.concurrency, use_request_api=arguments.request_api):
+				write(record)
+		else:
+			from asyncio import run
+			run(scrape())
+	finally:
+		if rows is not stdin:
+			rows.close()
+		if output is not stdout:
+			output.close()
+	return 1 if failures else 0
+
+
+def _create_report_parser(parser_factory):
+	parser = parser_factory("report", help="Showing the players in a team's next NACE StarLeague match")
+	_add_common_options(parser)
+	_add_starleague_options(parser)
+	parser.add_argument("-t", "--team", required=True, help="The team's id, the hexadecimal numbers after `https://nsl.leaguespot.gg/teams/`.")
+	parser.add_argument("-m", "--match-index", type=int, default=0, help="The index of the match on the team's page.")
+	return parser
+
+
+def _create_daemon_parser(parser_factory):
+	from .scrape_profile import SCRAPE_PROFILES
+
+	parser = parser_factory("daemon", help="Keeping a warm browser running to answer other rlpy commands quickly")
+	_add_starleague_options(parser)
+	parser.add_argument("--socket", help="The socket to listen on. Defaults to $RLPY_SOCKET, or one in $XDG_RUNTIME_DIR.")
+	parser.add_argument("-n", "--max-pages", type=int, default=4, help="The number of profiles scraped at the same time.")
+	parser.add_argument("--profile", choices=list(SCRAPE_PROFILES), help="The scrape profile used by the browser.")
+	parser.add_argument("--cache", metavar="FILE", help="An SQLite file profiles are cached in across restarts.")
+	parser.add_argument("--request-api", action="store_true",
+						help="Download the pages over plain HTTP instead of keeping a browser. Requires httpx.")
+	return parser
+
+
+def _run_report(arguments) -> int:
+	"""
+	Prints the player table for a team's next match, through the daemon if there is one.
+
+	:return: 0 once the table is printed, and 1 if the team has no upcoming match.
+	"""
+	if arguments.socket:
+		from .daemon import DaemonClient
+
+		report = DaemonClient(arguments.socket).report(arguments.team, arguments.match_index)
+	else:
+		from asyncio import run
+		from .daemon import ScrapeDaemon
+
+		async def make_report():
+			daemon = await ScrapeDaemon(max_pages=6, nsl_username=arguments.nsl_username,
+										nsl_password=arguments.nsl_password, storage_state=arguments.storage_state).start()
+			try:
+				return await daemon.report(arguments.team, arguments.match_index)
+			finally:
+				await daemon.close()
+
+		report = run(make_report())
+
+	if report is None:
+		print(f"Team {arguments.team} does not have an upcoming match.")
+		return 1
+	print(report["report"])
+	return 0
+
+
+def _run_daemon(arguments) -> int:
+	from .daemon import ScrapeDaemon
+
+	cache = None
+	if arguments.cache:
+		from .cache import ProfileCache
+		cache = ProfileCache(arguments.cache)
+	ScrapeDaemon(socket_path=arguments.socket, max_pages=arguments.max_pages, profile=arguments.profile, cache=cache,
+				 nsl_username=arguments.nsl_username, nsl_password=arguments.nsl_password,
+				 storage_state=arguments.storage_state, use_request_api=arguments.request_api).run()
+	return 0
+
+
+def _get_user(username:str, console:str, socket:str=None) -> "rlpy.sync_api.User | str":
+	"""
+	Scrapes one user, through the daemon if there is one. Playwright is only loaded when there is no daemon.
+
+	:param str console: The console's name, which is converted by whichever process scrapes the user.
+	:return: The scraped user, or the daemon's record of the user as JSON.
+	:raises rlpy.UserScrapeError: If the daemon could not scrape the user.
+	"""
+	if not socket:
+		from .sync_api import User
+		return User(username, convert_str_to_console(console)).get_data()
+
+	from json import dumps
+	from .daemon import DaemonClient
+
+	result = DaemonClient(socket).user(username, console)
+	if not result["ok"]:
+		raise UserScrapeError(result["error"])
+	return dumps(result["data"], indent=4)
+
+
 def create_argument_parser():
 	parser = ArgumentParser(prog="Rocket League Bot")
 	subparsers = parser.add_subparsers()
@@ -32,24 +214,36 @@ def create_argument_parser():
 	subparsers.required = False
 	_create_user_parser(subparsers.add_parser)
 	_create_playvs_parser(subparsers.add_parser)
+	_create_batch_parser(subparsers.add_parser)
+	_create_report_parser(subparsers.add_parser)
+	_create_daemon_parser(subparsers.add_parser)
 	return parser
 
 
 def main(args=None):
+	parser = create_argument_parser()
+	arguments = parser.parse_args(args)
 	try:
-		parser = create_argument_parser()
-		arguments = parser.parse_args(args)
 		if arguments.command == "user":
-			user = arguments.user
-			console = convert_str_to_console(arguments.console)
-			print(User(user,console).get_data())
+			print(_get_user(arguments.user, arguments.console, arguments.socket))
 		elif arguments.command == "playvs":
 			pass
+		elif arguments.command == "batch":
+			return _run_batch(arguments)
+		elif arguments.command == "report":
+			return _run_report(arguments)
+		elif arguments.command == "daemon":
+			return _run_daemon(arguments)
 		else:
-			print(User(getenv("user_name"), convert_str_to_console(getenv("console"))).get_data())
-	except ValueError as e:
+			print(_get_user(getenv("user_name"), getenv("console"), getenv("RLPY_SOCKET", None)))
+	except (ValueError, DaemonError) as e:
 		print(repr(e))
+		return 1
+	except OSError as e:  # Such as a missing batch file, or no daemon listening on the socket
+		path = e.filename or getattr(arguments, "socket", None) or getenv("RLPY_SOCKET", None)
+		print(f"{e.strerror or e}: {path}" if path else repr(e))
+		return 1
 
 
 if __name__ == "__main__":
-	main(argv[1:])
+	exit(main(argv[1:]))
@@ -1,9 +1,14 @@
 from enum import Enum as IntEnum, Enum as StrEnum
+from bisect import bisect_left
+from logging import getLogger
+from re import compile
+from sys import intern
+from threading import RLock
 from ._exceptions import *
 
 
 __ALL__ = ["PlaylistNumber", "Console", "convert_str_to_console", "Division", "Rank", "Playlist", "PlayListNames",
-			"UnrankedDivision", "Unranked", "UnrankedPlaylist"]
+			"UnrankedDivision", "Unranked", "UnrankedPlaylist", "season_cache_dir", "SeasonRegistry", "SEASONS"]
 
 
 class PlaylistNumber(IntEnum):
@@ -104,6 +109,7 @@ class Rank(object):
 		self.division_2 = kwargs.get("division_2", None)
 		self.division_3 = kwargs.get("division_3", None)
 		self.division_4 = kwargs.get("division_4", None)
+		self.playlist_name = kwargs.get("playlist_name", None)
 
 	# region Rank Properties
 
@@ -146,6 +152,7 @@ class Rank(object):
 		if not isinstance(div, Division | None):
 			raise ValueError(f"rlpy.Playlist.division_1 property must be of type rlpy.Division or None, not {type(div).__name__}")
 		self._div_1 = div
+		self._division_index = None
 
 	@property
 	def division_2(self):
@@ -156,6 +163,7 @@ class Rank(object):
 		if not isinstance(div, Division | None):
 			raise ValueError(f"rlpy.Playlist.division_2 property must be of type rlpy.Division or None, not {type(div).__name__}")
 		self._div_2 = div
+		self._division_index = None
 
 	@property
 	def division_3(self):
@@ -166,6 +174,7 @@ class Rank(object):
 		if not isinstance(div, Division | None):
 			raise ValueError(f"rlpy.Playlist.division_3 property must be of type rlpy.Division or None, not {type(div).__name__}")
 		self._div_3 = div
+		self._division_index = None
 
 	@property
 	def division_4(self):
@@ -176,23 +185,29 @@ class Rank(object):
 		if not isinstance(div, Division | None):
 			raise ValueError(f"rlpy.Playlist.division_4 property must be of type rlpy.Division or None, not {type(div).__name__}")
 		self._div_4 = div
+		self._division_index = None
 
 	# endregion
 
 	def __repr__(self):
 		return f"Rank(name={self.name}, players={self.players:,}, player_percentage={self.player_percentage})"
 
-	def get_division(self, mmr:int, default_div:int=None) -> Division:
+	def get_division(self, mmr:int, default_div:int=None, season:"int | str | None" = None) -> Division:
 		"""
 		Returns the Division within this rank
 		:param int mmr: The Match-Making Rating (MMR) of the user
+		:param season: The season, in `SEASONS`, to use the bounds of this rank from. Defaults to this rank's own season.
 		:return:
 		:raise: MMROutOfBoundError: The mmr would not be ranked in this rank.
+		:raise: SeasonNotFoundError: If the season is not in `SEASONS`.
 		"""
-		for div in (self.division_1, self.division_2, self.division_3, self.division_4):
-			if div is not None:
-				if div.lower_bound <= mmr <= div.upper_bound:
-					return div
+		if season is not None:
+			if self.playlist_name is None:
+				raise ValueError(f"The rank {self.name} is not part of a playlist, so it cannot be found in season {season}.")
+			return SEASONS.get_playlist(self.playlist_name, season).get_rank(self.name).get_division(mmr, default_div=default_div)
+		div = self._find_division(mmr)
+		if div is not None:
+			return div
 		if self.division_1 is not None:
 			if 0 <= self.division_1.lower_bound - mmr <= 15:
 				return self.division_1
@@ -205,52 +220,321 @@ class Rank(object):
 				return div
 		raise MMROutOfBoundError(f"The MMR: {mmr} is not found in {self.name}.")
 
+	def _find_division(self, mmr:int) -> Division | None:
+		"""The first division, in order, whose bounds hold the MMR, found by bisecting `_division_index`."""
+		if self._division_index is None:
+			self._index_divisions()
+		bounds, at_bound, between = self._division_index
+		i = bisect_left(bounds, mmr)
+		if i < len(bounds) and bounds[i] == mmr:
+			return at_bound[i]
+		return between[i]
+
+	def _index_divisions(self):
+		"""
+		Splits the MMR line at every division bound, and records which division holds each bound and each gap between
+		two bounds. Divisions can overlap, so each piece keeps the first division, in order, that holds it.
+		"""
+		divisions = [div for div in (self.division_1, self.division_2, self.division_3, self.division_4) if div is not None]
+
+		def first_holding(mmr:float) -> Division | None:
+			for div in divisions:
+				if div.lower_bound <= mmr <= div.upper_bound:
+					return div
+			return None
+
+		bounds = sorted({bound for div in divisions for bound in (div.lower_bound, div.upper_bound)})
+		at_bound = [first_holding(bound) for bound in bounds]
+		between = [None, *(first_holding((low + high) / 2) for low, high in zip(bounds, bounds[1:])), None]
+		self._division_index = (bounds, at_bound, between)
+
+
+_ROMAN_DIGITS = str.maketrans({"3": "III", "2": "II", "1": "I"})
+_COMPACT_CHAMPION = compile(r"(g?c) ?(i{1,3})")
+
+
+def _normalize_rank_name(rank_name:str) -> str:
+	"""
+	The key a rank name is stored under in `Playlist._rank_index`. Case, surrounding whitespace and digits are ignored,
+	and the short forms of Champion and Grand Champion ("C2", "c ii", "GC1") are expanded, so "Champion II", "champion 2"
+	and "C2" share a key. Spaces inside a name still have to match.
+	"""
+	lowered = rank_name.translate(_ROMAN_DIGITS).strip().lower()
+	compact = _COMPACT_CHAMPION.fullmatch(lowered)
+	if compact is not None:
+		return f"{'grand champion' if compact[1] == 'gc' else 'champion'} {compact[2]}"
+	return lowered
+
+
+_season_lock = RLock()
+_SEASON_CACHE_VERSION = 3  # Increase whenever the pickled classes or rank name keys change, so old caches are rebuilt
+
+
+def season_cache_dir() -> str:
+	"""The directory compiled season data is kept in: `$RLPY_CACHE_DIR`, else `rlpy` in `$XDG_CACHE_HOME` or `~/.cache`."""
+	from os import getenv
+	from os.path import expanduser, join
+
+	path = getenv("RLPY_CACHE_DIR", None)
+	if path:
+		return path
+	return join(getenv("XDG_CACHE_HOME", None) or expanduser("~/.cache"), "rlpy")
+
+
+def _season_cache_path(file_path:str) -> str:
+	from hashlib import sha1
+	from os.path import basename, join, realpath, splitext
+
+	file_path = realpath(file_path)
+	return join(season_cache_dir(), f"{splitext(basename(file_path))[0]}-{sha1(file_path.encode()).hexdigest()[:12]}.pickle")
+
+
+def _season_cache_key(file_path:str) -> tuple[int, int, int]:
+	from os import stat
+
+	info = stat(file_path)
+	return _SEASON_CACHE_VERSION, info.st_mtime_ns, info.st_size
+
+
+def _read_season_cache(file_path:str) -> "dict[str, Playlist] | None":
+	"""The playlists compiled from a season's JSON file, or None if they were never compiled or the file has changed."""
+	from pickle import load
+
+	try:
+		with open(_season_cache_path(file_path), "rb") as f:
+			if load(f) != _season_cache_key(file_path):
+				return None
+			return load(f)
+	except Exception:  # A missing, stale, or corrupt cache is rebuilt from the JSON
+		return None
+
+
+def _write_season_cache(file_path:str, playlists:"dict[str, Playlist]"):
+	from os import makedirs, replace
+	from pickle import dump, HIGHEST_PROTOCOL
+	from tempfile import NamedTemporaryFile
+
+	try:
+		makedirs(season_cache_dir(), exist_ok=True)
+		with NamedTemporaryFile("wb", dir=season_cache_dir(), suffix=".tmp", delete=False) as f:
+			dump(_season_cache_key(file_path), f, HIGHEST_PROTOCOL)
+			dump(playlists, f, HIGHEST_PROTOCOL)
+		replace(f.name, _season_cache_path(file_path))
+	except OSError:  # The data is still loaded, only the next start has to parse the JSON again
+		getLogger(__name__).debug("Could not save the compiled season data.", exc_info=True)
+
+
+class _LazyPlaylists(dict):
+	"""
+	`Playlist.PLAYLISTS`, which loads the current season the first time it is read. Readers wait on the season lock
+	until a load in progress has finished, and a load that fails is tried again on the next read.
+	"""
+	loaded = False
+
+	def _load(self):
+		if not self.loaded:
+			with _season_lock:
+				if not self.loaded:
+					Playlist.load_data()
+
+	def __getitem__(self, key):
+		self._load()
+		return super().__getitem__(key)
+
+	def __contains__(self, key) -> bool:
+		self._load()
+		return super().__contains__(key)
+
+	def __iter__(self):
+		self._load()
+		return super().__iter__()
+
+	def __len__(self) -> int:
+		self._load()
+		return super().__len__()
+
+	def __repr__(self) -> str:
+		self._load()
+		return super().__repr__()
+
+	def get(self, key, default=None):
+		self._load()
+		return super().get(key, default)
+
+	def keys(self):
+		self._load()
+		return super().keys()
+
+	def values(self):
+		self._load()
+		return super().values()
+
+	def items(self):
+		self._load()
+		return super().items()
+
+	def copy(self) -> dict:
+		self._load()
+		return dict(super().items())
+
 
 class Playlist(object):
-	PLAYLISTS = {}
+	PLAYLISTS = _LazyPlaylists()
+	PLAYLIST_ALIASES = {  # The names RLStats gives playlists
+		"Casual": "Un-Ranked",
+		"1v1 Solo Duel": "Ranked Duel 1v1",
+		"2v2 Doubles": "Ranked Doubles 2v2",
+		"3v3 Standard": "Ranked Standard 3v3",
+		"3v3 Tournament": "Tournament Matches",
+		"2v2 Hoops": "Hoops",
+		"3v3 Rumble": "Rumble",
+		"3v3 Dropshot": "Dropshot",
+		"3v3 Snow Day": "Snowday"
+	}
 
 	def __init__(self, name:str, **kwargs):
 		self.name = name
 		self.ranks = kwargs
+		self._rank_index = {_normalize_rank_name(rank_name): rank for rank_name, rank in kwargs.items()}
+		self._classifier = None
 
 	def __repr__(self):
 		return f"{self.name}"
 
 	def add_rank(self, rank:Rank):
+		rank.playlist_name = self.name
 		self.ranks[rank.name] = rank
+		self._rank_index[_normalize_rank_name(rank.name)] = rank
+		self._classifier = None
 
-	def get_rank(self, rank_name:str) -> Rank:
+	def get_rank(self, rank_name:str, season:"int | str | None" = None) -> Rank:
 		"""
 		Finds the rank object related to the given rank name. For Champion and Grand Champion, ranks can be found using C1, GC2, etc...
 		:param rank_name: The name of the rank
+		:param season: The season, in `SEASONS`, to find the rank in. Defaults to this playlist's own season.
 		:return: The rank object
 		:raises: RankNotFoundError
+		:raises: SeasonNotFoundError: If the season is not in `SEASONS`.
 		"""
-		rank_name = rank_name.replace("3", "III").replace("2", "II").replace("1", "I")
-		lowered = rank_name.strip().lower().replace("gc", "grand champion")
-		for key in self.ranks.keys():
-			if lowered == key.lower():
-				return self.ranks[key]
-		if lowered.startswith("c"):
-			lowered = lowered.replace("c", "champion")
-			for key in self.ranks.keys():
-				if lowered == key.lower():
-					return self.ranks[key]
-		if rank_name == "Unranked":
+		if season is not None:
+			return SEASONS.get_playlist(self.name, season).get_rank(rank_name)
+		rank = self._rank_index.get(_normalize_rank_name(rank_name), None)
+		if rank is not None:
+			return rank
+		rank_name = rank_name.translate(_ROMAN_DIGITS)
+		if rank_name in ("Unranked", "Un-Ranked"):  # Unranked().name is "Un-Ranked", which to_dict stores
 			rank = Unranked()
-			self.ranks[rank_name] = rank
+			self.ranks["Unranked"] = rank
+			self._rank_index[_normalize_rank_name("Unranked")] = self._rank_index[_normalize_rank_name(rank.name)] = rank
 			return rank
 		raise RankNotFoundError(f"The rank \"{repr(rank_name)}\" could not be found in {self.name}")
 
+	def classify_many(self, mmrs:"ArrayLike", as_objects:bool=False) -> "tuple[numpy.ndarray, numpy.ndarray]":
+		"""
+		Finds the rank and division of many MMRs at once. An MMR inside a division's bounds gets the first rank and
+		division, in order, that holds it. Otherwise, it gets the first rank whose lowest division starts at most 15
+		MMR above it, or whose highest division ends at most 15 MMR below it, the same as `Rank.get_division`. The
+		season data's "Unranked" tier is never given, since it overlaps the ranked tiers.
+
+		:param mmrs: The Match-Making Ratings (MMRs), as anything NumPy can turn into an array of numbers.
+		:param bool as_objects: If the Rank and Division objects should be returned instead of their indices.
+		:return: Arrays, shaped like `mmrs`, of the index of each rank in `list(self.ranks.values())` and the index of
+		each division (0 for division_1 through 3 for division_4), with -1 for MMRs that fit no rank. With `as_objects`,
+		object arrays of the Rank and Division, with None for MMRs that fit no rank.
+		:raises ImportError: If NumPy is not installed.
+		"""
+		try:
+			import numpy as np
+		except ImportError as e:
+			raise ImportError("Classifying many MMRs at once requires NumPy. Install it with `pip install rlpy[numpy]`.") from e
+
+		if self._classifier is None:
+			self._classifier = self._build_classifier(np)
+		bounds, at_bound, between = self._classifier
+		mmrs = np.asarray(mmrs, dtype=np.float64)
+		i = np.searchsorted(bounds, mmrs, side="left")
+		if len(bounds):
+			on_bound = bounds[np.minimum(i, len(bounds) - 1)] == mmrs
+			found = np.where(on_bound[..., np.newaxis], at_bound[np.minimum(i, len(bounds) - 1)], between[i])
+		else:
+			found = between[i]
+		ranks, divisions = found[..., 0], found[..., 1]
+		if not as_objects:
+			return ranks, divisions
+
+		rank_objects = np.array([*self.ranks.values(), None], dtype=object)
+		division_objects = np.array([[*(getattr(rank, f"division_{n}") for n in range(1, 5))] for rank in self.ranks.values()]
+									+ [[None] * 4], dtype=object)
+		return rank_objects[ranks], division_objects[ranks, np.maximum(divisions, 0)]
+
+	def _build_classifier(self, np) -> "tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]":
+		"""
+		Splits the MMR line at every division bound and tolerance edge, then classifies each bound and each gap between
+		two bounds once, so `classify_many` only has to find which piece each MMR falls in.
+
+		:return: The sorted bounds, the (rank, division) indices at each bound, and those for each gap, with one gap below
+		the first bound and one above the last.
+		"""
+		ranks = []
+		for rank_index, rank in enumerate(self.ranks.values()):
+			if isinstance(rank, Unranked) or rank.name == "Unranked":
+				continue
+			divisions = [(n, div) for n, div in enumerate((rank.division_1, rank.division_2, rank.division_3, rank.division_4)) if div is not None]
+			ranks.append((rank_index, rank, divisions))
+
+		def classify(mmr:float) -> tuple[int, int]:
+			for rank_index, _, divisions in ranks:
+				for n, div in divisions:
+					if div.lower_bound <= mmr <= div.upper_bound:
+						return rank_index, n
+			for rank_index, rank, _ in ranks:
+				if rank.division_1 is not None and 0 <= rank.division_1.lower_bound - mmr <= 15:
+					return rank_index, 0
+				if rank.division_4 is not None and 0 <= mmr - rank.division_4.upper_bound <= 15:
+					return rank_index, 3
+			return -1, -1
+
+		bounds = set()
+		for _, rank, divisions in ranks:
+			bounds.update(bound for _, div in divisions for bound in (div.lower_bound, div.upper_bound))
+			if rank.division_1 is not None:
+				bounds.add(rank.division_1.lower_bound - 15)
+			if rank.division_4 is not None:
+				bounds.add(rank.division_4.upper_bound + 15)
+		bounds = sorted(bounds)
+		at_bound = [classify(bound) for bound in bounds]
+		between = [(-1, -1), *(classify((low + high) / 2) for low, high in zip(bounds, bounds[1:])), (-1, -1)]
+		return (np.array(bounds, dtype=np.float64), np.array(at_bound, dtype=np.intp).reshape(-1, 2),
+				np.array(between, dtype=np.intp))
+
 	@staticmethod
-	def load_data(file_path=None):  # Unranked isn't in here
-		from json import load
+	def load_data(file_path=None, use_cache:bool=True):  # Unranked isn't in here
+		"""
+		Loads a season's ranks into `Playlist.PLAYLISTS`, replacing any playlists with the same names. The current
+		season is loaded the first time `Playlist.PLAYLISTS` is read, so this only has to be called to load a different
+		season.
+
+		:param str file_path: The season's JSON file. Defaults to the current season.
+		:param bool use_cache: If the playlists should be read from, and saved to, the compiled copy of the file in
+		`season_cache_dir()`, instead of being built from the JSON every time.
+		:return: `Playlist.PLAYLISTS`
+		"""
 		if file_path is None:
-			from os.path import join, dirname, realpath
-			file_path = join(dirname(realpath(__file__)), "extra/current_season.json")
+			file_path = SEASONS.files["current"]
+		with _season_lock:
+			Playlist.PLAYLISTS.update(_load_season_file(file_path, use_cache))
+			Playlist.PLAYLISTS.loaded = True  # Only once the data is in, since readers check it without the lock
+		return Playlist.PLAYLISTS
+
+	@staticmethod
+	def _parse_season(file_path:str) -> dict[str, "Playlist"]:
+		from json import load
 		with open(file_path, ) as f:  # No mode given on purpose
-			data = load(f)["info"]
-		Playlist.PLAYLISTS["Un-Ranked"] = UnrankedPlaylist("Un-Ranked")
+			data = load(f)
+		if "info" not in data:
+			return Playlist._parse_ranked_lists(data)
+		data = data["info"]
+		playlists = {"Un-Ranked": UnrankedPlaylist("Un-Ranked")}
 		ranks = {}
 		for row in data["data"]:
 			div = Division(data['divisions'][row['division']], row["minMMR"], row["maxMMR"])
@@ -272,13 +556,143 @@ class Playlist(object):
 				case _:
 					raise RankNotFoundError(f"There is no division numbered {row['division']}.")
 
-			playlist = Playlist.PLAYLISTS.get(data["playlists"][str(row["playlist"])], None)
+			playlist = playlists.get(data["playlists"][str(row["playlist"])], None)
 			if playlist is None:
 				playlist = Playlist(name=data["playlists"][str(row["playlist"])])
-				Playlist.PLAYLISTS[playlist.name] = playlist
+				playlists[playlist.name] = playlist
 
 			playlist.add_rank(rank)
-		return Playlist.PLAYLISTS
+		for rank in ranks.values():
+			rank._index_divisions()
+		return playlists
+
+	@staticmethod
+	def _parse_ranked_lists(data:dict[str, "Any"]) -> dict[str, "Playlist"]:
+		"""Builds the playlists from the older season files, which list each playlist's ranks from highest to lowest."""
+		playlists = {"Un-Ranked": UnrankedPlaylist("Un-Ranked")}
+		for name, ranked_list in data.items():
+			playlist = playlists[name] = Playlist(name)
+			for row in reversed(ranked_list["Ranks"]):
+				rank = Rank(row["Rank"], row["Players"], row["Player_Percentage"])
+				for division_name, bounds in row["Divisions"].items():
+					number = ("Division I", "Division II", "Division III", "Division IV").index(division_name) + 1
+					setattr(rank, f"division_{number}", Division(division_name, bounds["lower_bound"], bounds["upper_bound"]))
+				rank._index_divisions()
+				playlist.add_rank(rank)
+		return playlists
+
+
+def _load_season_file(file_path:str, use_cache:bool=True) -> dict[str, Playlist]:
+	"""
+	Builds the playlists in a season file, or reads them from its compiled copy, with every name interned so that
+	seasons loaded side by side share them.
+	"""
+	playlists = _read_season_cache(file_path) if use_cache else None
+	if playlists is None:
+		playlists = Playlist._parse_season(file_path)
+		if use_cache:
+			_write_season_cache(file_path, playlists)
+
+	for playlist in playlists.values():
+		playlist.name = intern(playlist.name)
+		for rank in playlist.ranks.values():
+			rank._name = intern(rank.name)
+			rank.playlist_name = playlist.name
+			for div in (rank.division_1, rank.division_2, rank.division_3, rank.division_4):
+				if div is not None:
+					div._name = intern(div.name)
+	return playlists
+
+
+class SeasonRegistry(object):
+	"""
+	Season data by season, loaded side by side the first time each season is used. Seasons are named by their number,
+	from the `season_<number>.json` files in the data directory, and "current" is `Playlist.PLAYLISTS`.
+	"""
+	def __init__(self, directory:str=None, use_cache:bool=True):
+		"""
+		:param str directory: The directory holding the season files. Defaults to the data shipped with rlpy.
+		:param bool use_cache: If seasons should be read from, and saved to, their compiled copies in `season_cache_dir()`.
+		"""
+		from os import listdir
+		from os.path import join, dirname, realpath
+		from re import fullmatch
+
+		self.directory = join(dirname(realpath(__file__)), "extra") if directory is None else directory
+		self.use_cache = use_cache
+		self.files = {"current": join(self.directory, "current_season.json")}
+		matches = (fullmatch(r"season_(\w+)\.json", file_name) for file_name in listdir(self.directory))
+		for match in sorted(filter(None, matches), key=lambda match: (not match.group(1).isdigit(), match.group(1).zfill(8))):
+			self.files[match.group(1)] = join(self.directory, match.group(0))
+		self._seasons: dict[str, dict[str, Playlist]] = {}
+		self._lock = RLock()
+
+	def __repr__(self) -> str:
+		return f"rlpy.SeasonRegistry(seasons={self.seasons}, loaded={list(self._seasons)})"
+
+	def __contains__(self, season:"int | str | None") -> bool:
+		return self._key(season) in self.files
+
+	def __getitem__(self, season:"int | str | None") -> dict[str, Playlist]:
+		"""
+		The playlists of a season, by name.
+
+		:param season: The season's number, or None or "current" for the current season.
+		:return:
+		:raises rlpy.SeasonNotFoundError: If there is no data for the season.
+		"""
+		key = self._key(season)
+		if key == "current" and self is SEASONS:
+			return Playlist.PLAYLISTS
+		playlists = self._seasons.get(key, None)
+		if playlists is None:
+			file_path = self.files.get(key, None)
+			if file_path is None:
+				raise SeasonNotFoundError(f"There is no data for season {season}. Choose one of: {', '.join(self.seasons)}.")
+			with self._lock:
+				playlists = self._seasons.get(key, None)
+				if playlists is None:
+					playlists = self._seasons[key] = _load_season_file(file_path, self.use_cache)
+		return playlists
+
+	@staticmethod
+	def _key(season:"int | str | None") -> str:
+		if season is None:
+			return "current"
+		return str(season).strip().lower().removeprefix("season").strip(" _")
+
+	@property
+	def seasons(self) -> list[str]:
+		"""The names of every season that can be loaded."""
+		return list(self.files)
+
+	def register(self, season:"int | str", file_path:str):
+		"""
+		Adds, or replaces, the file a season is loaded from.
+
+		:param season: The season's name.
+		:param str file_path: The season's JSON file, in either format the shipped files use.
+		"""
+		key = self._key(season)
+		with self._lock:
+			self.files[key] = file_path
+			self._seasons.pop(key, None)
+
+	def get_playlist(self, playlist_name:str, season:"int | str | None" = None) -> Playlist:
+		"""
+		Finds a playlist in a season, by its name or by the name RLStats gives it.
+
+		:param str playlist_name:
+		:param season: The season's number, or None or "current" for the current season.
+		:return:
+		:raises rlpy.PlaylistNotFoundError: If the season does not have the playlist.
+		:raises rlpy.SeasonNotFoundError: If there is no data for the season.
+		"""
+		name = Playlist.PLAYLIST_ALIASES.get(playlist_name, playlist_name)
+		playlist = self[season].get(name, None)
+		if playlist is None:
+			raise PlaylistNotFoundError(f"Playlist name: {name} could not be found in season {self._key(season)}.", playlist_name=name)
+		return playlist
 
 
 # region Unranked classes
@@ -293,17 +707,17 @@ class Unranked(Rank):
 		super().__init__("Un-Ranked", 0, 0)
 		self.division_1 = UnrankedDivision()
 
-	def get_division(self, mmr:int, **kwargs) -> Division:
+	def get_division(self, mmr:int, *args, **kwargs) -> Division:
 		return self.division_1
 
 
 class UnrankedPlaylist(Playlist):
-	def get_rank(self, rank_name:str) -> Rank:
+	def get_rank(self, rank_name:str, season:"int | str | None" = None) -> Rank:
 		return Unranked()
 # endregion
 
 
-Playlist.load_data()
+SEASONS = SeasonRegistry()
 
 
 class PlayListNames(StrEnum):
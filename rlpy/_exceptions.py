@@ -1,4 +1,4 @@
-__ALL__ = ["PlayerNotFoundError", "ConsoleNotFoundError", "RankNotFoundError", "MMROutOfBoundError", "PlaylistNotFoundError", "UserScrapeError"]
+__ALL__ = ["PlayerNotFoundError", "ConsoleNotFoundError", "RankNotFoundError", "MMROutOfBoundError", "PlaylistNotFoundError", "UserScrapeError", "BrowserPoolError", "DaemonError", "SeasonNotFoundError"]
 
 
 class PlayerNotFoundError(BaseException):
@@ -25,3 +25,15 @@ class PlaylistNotFoundError(BaseException):
 
 class UserScrapeError(BaseException):
     pass
+
+
+class BrowserPoolError(BaseException):
+    pass
+
+
+class DaemonError(BaseException):
+    pass
+
+
+class SeasonNotFoundError(BaseException):
+    pass
@@ -1,2 +1,4 @@
+from .browser_pool import BrowserPool
 from .user import User
 from .starleague import *
+from .batch import fetch_users, iter_users
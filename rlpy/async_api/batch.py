@@ -0,0 +1,130 @@
+from asyncio import CancelledError, Queue, Semaphore, create_task, gather
+from collections.abc import AsyncIterator, Iterable
+from logging import getLogger
+from time import perf_counter
+from .._enum_classes import Console
+from ..user import ScrapeResult
+from .browser_pool import BrowserPool
+from .user import User
+
+
+__ALL__ = ["fetch_users", "iter_users"]
+
+
+def _as_user(user:User | tuple[str, Console | str]) -> User:
+	if isinstance(user, User):
+		return user
+	username, console = user
+	return User(username, console)
+
+
+async def _fetch_user(user:User, pool:BrowserPool, semaphore:Semaphore, **kwargs) -> ScrapeResult:
+	logger = kwargs.get("logger", getLogger(__name__))
+	async with semaphore:
+		start = perf_counter()
+		try:
+			await user.get_data(pool=pool, **kwargs)
+		except (KeyboardInterrupt, SystemExit, CancelledError) as e:
+			raise e
+		except BaseException as e:
+			logger.warning(f"Could not scrape {user.link}: {e!r}", extra=user.log_extra)
+			return ScrapeResult(user, error=e, elapsed=perf_counter() - start)
+		return ScrapeResult(user, elapsed=perf_counter() - start)
+
+
+def _create_pool(concurrency:int, kwargs:dict[str, "Any"]) -> BrowserPool | None:
+	if kwargs.get("use_request_api", False):
+		return None
+	return BrowserPool(max_pages=concurrency, headless=kwargs.pop("headless", True),
+					   slow_mo=kwargs.pop("slow_mo", None), timeout=kwargs.pop("timeout", None),
+					   profile=kwargs.pop("profile", None), logger=kwargs.get("logger", getLogger(__name__)))
+
+
+async def fetch_users(users:Iterable[User | tuple[str, Console | str]], concurrency:int=8, pool:BrowserPool=None,
+					  **kwargs) -> list[ScrapeResult]:
+	"""
+	Scrapes many users at once through one shared browser. A failure for one user is recorded in its result instead of
+	cancelling the rest of the batch.
+
+	:param users: rlpy.async_api.User objects, or (username, console) pairs.
+	:param int concurrency: The maximum number of profiles being scraped at the same time.
+	:param pool: The BrowserPool to check pages out of. If none is given, one is started for the batch and closed
+	afterwards, using the `headless`, `slow_mo`, `timeout` and `profile` keywords. No browser is started with `use_request_api`.
+	:param kwargs: Passed on to every `User.get_data` call.
+	:return: One rlpy.ScrapeResult per user, in the same order as the users were given.
+	"""
+	if concurrency < 1:
+		raise ValueError(f"The concurrency must be at least 1, not {concurrency}.")
+	users = [_as_user(user) for user in users]
+
+	owned_pool = pool is None
+	if owned_pool:
+		pool = _create_pool(concurrency, kwargs)
+	semaphore = Semaphore(concurrency)
+
+	try:
+		if pool is not None:
+			await pool.start()
+		return list(await gather(*(_fetch_user(user, pool, semaphore, **kwargs) for user in users)))
+	finally:
+		if owned_pool and pool is not None:
+			await pool.close()
+
+
+async def iter_users(users:Iterable[User | tuple[str, Console | str]], concurrency:int=8, pool:BrowserPool=None,
+					 buffer:int=None, **kwargs) -> AsyncIterator[ScrapeResult]:
+	"""
+	Scrapes many users at once through one shared browser, yielding each result as soon as its scrape finishes. Users
+	are only taken from `users` when a scraper is free, so it can be a lazy iterable of any length. When the results
+	are not being consumed, the scrapers stop once `buffer` results are waiting, so memory stays bounded.
+
+	:param users: rlpy.async_api.User objects, or (username, console) pairs.
+	:param int concurrency: The maximum number of profiles being scraped at the same time.
+	:param pool: The BrowserPool to check pages out of. If none is given, one is started for the batch and closed
+	afterwards, using the `headless`, `slow_mo`, `timeout` and `profile` keywords. No browser is started with `use_request_api`.
+	:param int buffer: The maximum number of finished results waiting to be consumed. Defaults to the concurrency.
+	:param kwargs: Passed on to every `User.get_data` call.
+	:return: One rlpy.ScrapeResult per user, in the order the scrapes finished.
+	"""
+	if concurrency < 1:
+		raise ValueError(f"The concurrency must be at least 1, not {concurrency}.")
+	users = iter(users)
+	results = Queue(maxsize=concurrency if buffer is None else buffer)
+	finished = object()
+	errors = []
+
+	owned_pool = pool is None
+	if owned_pool:
+		pool = _create_pool(concurrency, kwargs)
+	semaphore = Semaphore(concurrency)
+
+	async def scrape():
+		try:
+			for user in users:
+				await results.put(await _fetch_user(_as_user(user), pool, semaphore, **kwargs))
+		except CancelledError as e:
+			raise e
+		except BaseException as e:
+			errors.append(e)
+		await results.put(finished)
+
+	workers = []
+	try:
+		if pool is not None:
+			await pool.start()
+		workers = [create_task(scrape()) for _ in range(concurrency)]
+		running = len(workers)
+		while running:
+			result = await results.get()
+			if result is finished:
+				running -= 1
+				if errors:
+					raise errors[0]
+				continue
+			yield result
+	finally:
+		for worker in workers:
+			worker.cancel()
+		await gather(*workers, return_exceptions=True)
+		if owned_pool and pool is not None:
+			await pool.close()
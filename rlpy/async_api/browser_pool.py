@@ -0,0 +1,183 @@
+from asyncio import Semaphore
+from contextlib import asynccontextmanager
+from logging import getLogger
+from playwright.async_api import Browser, Page, Playwright, Route, async_playwright
+from ..scrape_profile import ScrapeProfile, get_scrape_profile
+
+
+__ALL__ = ["BrowserPool", "apply_scrape_profile"]
+
+
+async def apply_scrape_profile(page:Page, profile:str | ScrapeProfile=None, timeout:float=None):
+	"""
+	Applies the timeouts and request blocking of a scrape profile to a page.
+
+	:param page:
+	:param profile: The rlpy.ScrapeProfile, or its name. Defaults to the "default" profile.
+	:param float timeout: Overrides the profile's default timeout for page actions, in milliseconds.
+	"""
+	profile = get_scrape_profile(profile)
+	timeout = profile.timeout if timeout is None else timeout
+	page.set_default_timeout(timeout)
+	page.set_default_navigation_timeout(profile.navigation_timeout if timeout == profile.timeout else timeout)
+	if not profile.intercepts_requests:
+		return
+
+	async def handle_route(route:Route):
+		request = route.request
+		if profile.should_block(request.resource_type, request.url, request.frame.url):
+			await route.abort()
+		else:
+			await route.continue_()
+
+	await page.route("**/*", handle_route)
+
+
+class BrowserPool(object):
+	"""
+	Holds one launched Firefox browser and a bounded set of warm pages. Pages are checked out with `acquire` (or the
+	`page` context manager) and handed back with `release`. Unlike the synchronous pool, `acquire` waits for a page to
+	be released when every page is already in use, so the pool can be shared by many concurrent tasks.
+	"""
+	def __init__(self, max_pages:int=4, headless:bool=True, slow_mo:float=None, timeout:float=None,
+				 profile:str | ScrapeProfile=None, **kwargs):
+		"""
+		:param int max_pages: The maximum number of pages that can be open in the browser at once.
+		:param bool headless: If the browser should be launched without a window.
+		:param float slow_mo: The number of milliseconds Playwright waits between operations. Defaults to the profile's.
+		:param float timeout: The default timeout given to every page, in milliseconds. 0 disables timeouts. Defaults
+		to the profile's.
+		:param profile: The rlpy.ScrapeProfile, or its name, applied to every page. Defaults to the "default" profile.
+		"""
+		self.max_pages = max_pages
+		self.headless = headless
+		self.profile = get_scrape_profile(profile)
+		self.slow_mo = self.profile.slow_mo if slow_mo is None else slow_mo
+		self.timeout = self.profile.timeout if timeout is None else timeout
+		self.logger = kwargs.get("logger", getLogger(__name__))
+
+		self._playwright: Playwright | None = None
+		self._browser: Browser | None = None
+		self._available: Semaphore | None = None
+		self._pages: list[Page] = []
+		self._idle: list[Page] = []
+
+	async def __aenter__(self) -> "BrowserPool":
+		return await self.start()
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		await self.close()
+
+	def __repr__(self) -> str:
+		return f"rlpy.async_api.BrowserPool(max_pages={self.max_pages}, open_pages={len(self._pages)}, in_use={self.in_use})"
+
+	# region Pool Properties
+	@property
+	def max_pages(self) -> int:
+		return self._max_pages
+
+	@max_pages.setter
+	def max_pages(self, max_pages:int):
+		if not isinstance(max_pages, int):
+			max_pages = int(max_pages)
+		if max_pages < 1:
+			raise ValueError(f"A browser pool must be allowed at least one page, not {max_pages}.")
+		self._max_pages = max_pages
+
+	@property
+	def is_running(self) -> bool:
+		"""If the browser for this pool has been launched and not closed."""
+		return self._browser is not None
+
+	@property
+	def browser(self) -> Browser | None:
+		"""The launched browser, for opening pages or contexts that are not part of the pool. None if not running."""
+		return self._browser
+
+	@property
+	def in_use(self) -> int:
+		"""The number of pages that are currently checked out of the pool."""
+		return len(self._pages) - len(self._idle)
+	# endregion
+
+	async def start(self) -> "BrowserPool":
+		"""
+		Starts Playwright and launches the browser. Calling this on a running pool does nothing.
+
+		:return: This pool, for chaining
+		"""
+		if self.is_running:
+			return self
+		self._available = Semaphore(self.max_pages)
+		self._playwright = await async_playwright().start()
+		self._browser = await self._playwright.firefox.launch(headless=self.headless, slow_mo=self.slow_mo)
+		self.logger.debug("Launched the browser for the page pool.")
+		return self
+
+	async def close(self):
+		"""Closes every page, the browser, and Playwright. The pool can be started again afterwards."""
+		for page in self._pages:
+			if not page.is_closed():
+				await page.close()
+		self._pages.clear()
+		self._idle.clear()
+
+		if self._browser is not None:
+			await self._browser.close()
+			self._browser = None
+		if self._playwright is not None:
+			await self._playwright.stop()
+			self._playwright = None
+		self._available = None
+		self.logger.debug("Closed the browser for the page pool.")
+
+	async def acquire(self) -> Page:
+		"""
+		Checks a page out of the pool, waiting for one to be released if all of them are in use. Idle pages are reused
+		before new pages are opened.
+
+		:return: A page that belongs to the pool until it is released.
+		"""
+		await self.start()
+		await self._available.acquire()
+		try:
+			while self._idle:
+				page = self._idle.pop()
+				if not page.is_closed():
+					return page
+				self._pages.remove(page)
+
+			page = await self._browser.new_page()
+			await apply_scrape_profile(page, self.profile, timeout=self.timeout)
+			self._pages.append(page)
+			self.logger.debug(f"Opened page {len(self._pages):,} of {self.max_pages:,} in the pool.")
+			return page
+		except BaseException as e:
+			self._available.release()
+			raise e
+
+	def release(self, page:Page):
+		"""
+		Returns a page to the pool. Closed pages are dropped so a new page will be opened in their place.
+
+		:param page: A page that was checked out with `acquire`.
+		:raises ValueError: If the page does not belong to this pool.
+		"""
+		if page not in self._pages:
+			raise ValueError("The page being released does not belong to this pool.")
+		if page in self._idle:
+			return
+		if page.is_closed():
+			self._pages.remove(page)
+		else:
+			self._idle.append(page)
+		self._available.release()
+
+	@asynccontextmanager
+	async def page(self):
+		"""Checks a page out for the length of an `async with` block and releases it afterwards."""
+		page = await self.acquire()
+		try:
+			yield page
+		finally:
+			self.release(page)
@@ -0,0 +1,58 @@
+from asyncio import CancelledError, Future, get_running_loop, shield
+from collections.abc import Awaitable, Callable, Hashable
+
+
+__ALL__ = ["SingleFlight"]
+
+
+class _LeaderCancelled(Exception):
+	"""Given to the callers waiting on a call when the caller running it was cancelled, so one of them runs it instead."""
+
+
+class SingleFlight(object):
+	"""
+	Coalesces concurrent calls that share a key. The first caller runs the call, and every caller that arrives while it
+	is still running awaits the same result (or exception) instead of starting its own.
+	"""
+	def __init__(self):
+		self._calls: dict[tuple[int, Hashable], Future] = {}
+
+	def __len__(self) -> int:
+		return len(self._calls)
+
+	def __contains__(self, key:Hashable) -> bool:
+		return (id(get_running_loop()), key) in self._calls
+
+	async def run(self, key:Hashable, func:Callable[[], Awaitable]):
+		"""
+		Runs `func` unless a call with the same key is already running, in which case that call's result is returned. If
+		the caller running the call is cancelled, a caller that was waiting on it runs `func` itself.
+
+		:param key: The key shared by calls that can be coalesced.
+		:param func: A function that returns the awaitable to run.
+		:return: The result of the call.
+		"""
+		loop = get_running_loop()
+		key = (id(loop), key)
+		while (future := self._calls.get(key, None)) is not None:
+			try:
+				return await shield(future)
+			except _LeaderCancelled:
+				continue
+
+		future = self._calls[key] = loop.create_future()
+		try:
+			result = await func()
+		except CancelledError as e:
+			future.set_exception(_LeaderCancelled())
+			future.exception()  # Marks the exception as retrieved when nobody else was waiting on it
+			raise e
+		except BaseException as e:
+			future.set_exception(e)
+			future.exception()  # Marks the exception as retrieved when nobody else was waiting on it
+			raise e
+		else:
+			future.set_result(result)
+			return result
+		finally:
+			del self._calls[key]
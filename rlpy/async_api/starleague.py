@@ -1,65 +1,199 @@
 from .._enum_classes import Console, Playlist
-from .._exceptions import UserScrapeError
 from ..match import RLTeam, StarLeague
-from ..tools import get_timezone
+from ..rate_limit import DEFAULT_RATE_LIMITER
+from ..tools import get_timezone, save_storage_state, storage_state_expired
+from ..user import ScrapeResult
 from .user import User
+from asyncio import Lock, Queue, Task, create_task, gather
+from collections.abc import Iterable
 import logging
-from playwright.async_api import Locator, Page, expect, async_playwright, TimeoutError
+from time import perf_counter
+from playwright.async_api import Browser, Locator, Page, expect, async_playwright, TimeoutError
 from pytz import timezone
 
 
-__ALL__ = ["nace_starleague_login", "create_team", "team_next_match"]
+__ALL__ = ["nace_starleague_login", "nace_starleague_session", "create_team", "team_next_match", "crawl_league"]
 
 
-async def nace_starleague_login(page:Page, username:str, password:str):
-	await page.goto("https://nsl.leaguespot.gg/login/")
+STARLEAGUE_URL = "https://nsl.leaguespot.gg/"
+
+
+async def _submit_login(page:Page, username:str, password:str):
 	await page.locator("input#username").type(username)
 	await page.locator("input#password").type(password)
 	await page.locator("button.login-button.button.button--primary.button--wide.button--round").click(force=True)
-	await page.wait_for_url("https://nsl.leaguespot.gg/")
-
-
-async def create_team(locator:Locator, name:str, info_page:Page) -> RLTeam:
-	team = RLTeam(name)
-	users = locator.locator("li.match-user")
-	
-	for team_li in await users.all():
-		handles = team_li.locator("div.match-user__handle")
-		for div_handle in await handles.all():
-			verified = await div_handle.get_by_alt_text("Verified").count() == 1
-			if not verified:
-				continue
+	await page.wait_for_url(STARLEAGUE_URL)
+
+
+async def nace_starleague_login(page:Page, username:str, password:str, **kwargs):
+	"""
+	Logs in to NACE StarLeague.
+
+	:param page:
+	:param str username:
+	:param str password:
+	:keyword str storage_state: A file the logged in session is saved to, so `nace_starleague_session` can reuse it.
+	"""
+	limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
+	await limiter.goto_async(page, f"{STARLEAGUE_URL}login/")
+	await _submit_login(page, username, password)
+	if kwargs.get("storage_state", None) is not None:
+		save_storage_state(await page.context.storage_state(), kwargs["storage_state"])
 
+
+async def nace_starleague_session(browser:Browser, username:str, password:str, storage_state:str, **kwargs) -> Page:
+	"""
+	Opens a page in a new browser context that is logged in to NACE StarLeague. A session saved by an earlier login is
+	loaded instead of logging in again. The login form is only filled in when there is no saved session, or the site no
+	longer accepts it, and the new session is then saved for the next context. Many contexts can be opened from one
+	saved session at the same time.
+
+	:param browser:
+	:param str username:
+	:param str password:
+	:param str storage_state: The file the session is saved to and loaded from.
+	:keyword float verify_timeout: The number of milliseconds to wait for the site to accept a saved session. Defaults to 5000.
+	:keyword context_options: Other keywords passed to `Browser.new_context`.
+	:return: A logged in page. Its context can be found with `page.context`.
+	"""
+	logger = kwargs.get("logger", logging.getLogger(__name__))
+	limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
+	context_options = kwargs.get("context_options", {})
+	saved = not storage_state_expired(storage_state)
+
+	context = await browser.new_context(storage_state=storage_state if saved else None, **context_options)
+	page = await context.new_page()
+	await limiter.goto_async(page, f"{STARLEAGUE_URL}login/")
+	if saved:
+		try:  # A logged in session is sent straight on from the login page
+			await page.wait_for_url(STARLEAGUE_URL, timeout=kwargs.get("verify_timeout", 5000))
+			logger.debug("Reused the saved NACE StarLeague session.")
+			return page
+		except TimeoutError:
+			logger.info("The saved NACE StarLeague session has expired. Logging in again.")
+
+	await _submit_login(page, username, password)
+	save_storage_state(await context.storage_state(), storage_state)
+	return page
+
+
+class _RosterScraper(object):
+	"""
+	Scrapes the players on match rosters. Each player's profile starts loading as soon as their handle is read from the
+	match page, and the profiles load at the same time through a pool of info pages.
+	"""
+	def __init__(self, info_page:Page=None, **kwargs):
+		self.info_page = info_page
+		self.pool = kwargs.pop("pool", None)
+		self.kwargs = kwargs
+		self.logger = kwargs.get("logger", logging.getLogger(__name__))
+		self._owned_pool = None
+		self._page_lock = Lock()
+		self._players: dict[tuple[str, ...], Task] = {}
+
+	async def __aenter__(self) -> "_RosterScraper":
+		if self.pool is None and self.info_page is None and not self.kwargs.get("use_request_api", False):
+			from .browser_pool import BrowserPool
+
+			self.pool = self._owned_pool = await BrowserPool(max_pages=self.kwargs.get("concurrency", 6),
+															 headless=self.kwargs.get("headless", True),
+															 profile=self.kwargs.get("profile", None),
+															 logger=self.logger).start()
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		for task in self._players.values():
+			task.cancel()
+		await gather(*self._players.values(), return_exceptions=True)
+		if self._owned_pool is not None:
+			await self._owned_pool.close()
+
+	async def _scrape_player(self, handles:list[str]) -> ScrapeResult:
+		"""Scrapes the first of a player's handles that can be scraped. If none can, the last handle's error is returned."""
+		for handle in handles:
+			user = User(handle, Console.EPIC_GAMES)
+			start = perf_counter()
 			try:
-				user = User(await div_handle.locator("span").inner_text(), Console.EPIC_GAMES)
-				await user.get_data(page=info_page)
-			except UserScrapeError:
-				logging.getLogger(__name__).exception(f"An error occurred when scraping information for `{user.player_name}` on `{user.console}`")
+				if self.info_page is None or self.pool is not None:
+					await user.get_data(pool=self.pool, **self.kwargs)
+				else:  # A single info page can only load one profile at a time
+					async with self._page_lock:
+						await user.get_data(page=self.info_page, **self.kwargs)
+			except Exception as e:
+				self.logger.exception(f"An error occurred when scraping information for `{user.player_name}` on `{user.console}`")
+				result = ScrapeResult(user, error=e, elapsed=perf_counter() - start)
 				continue
+			return ScrapeResult(user, elapsed=perf_counter() - start)
+		return result
+
+	async def prefetch(self, locator:Locator) -> list[tuple[bool, Task]]:
+		"""
+		Reads the verified handles of every player in a roster, starting a scrape for each player as soon as they are read.
+		If a player's first verified handle cannot be scraped, the next one is tried. A player already seen on another
+		roster shares that scrape instead of being scraped again.
+
+		:param locator: The roster on the match page.
+		:return: If each player is the captain, and the task scraping them.
+		"""
+		roster = []
+		for team_li in await locator.locator("li.match-user").all():
+			handles = []
+			for div_handle in await team_li.locator("div.match-user__handle").all():
+				if await div_handle.get_by_alt_text("Verified").count() == 1:
+					handles.append(await div_handle.locator("span").inner_text())
+			if not handles:
+				continue
+
+			handles = tuple(handles)
+			task = self._players.get(handles, None)
+			if task is None:
+				task = self._players[handles] = create_task(self._scrape_player(handles))
+			roster.append((await team_li.locator("div.avatar.small.avatar__role--captain").count() > 0, task))
+		return roster
 
-			if await team_li.locator("div.avatar.small.avatar__role--captain").count():
-				team.captain = user
+	@staticmethod
+	async def team(name:str, roster:list[tuple[bool, Task]]) -> RLTeam:
+		"""
+		Waits for every scrape in a prefetched roster and puts the players that could be scraped into a team. The
+		players that could not be scraped are kept in the team's `failed` list.
+		"""
+		team = RLTeam(name)
+		for is_captain, task in roster:
+			result = await task
+			if not result:
+				team.failed.append(result)
+			elif is_captain:
+				team.captain = result.user
 			else:
-				team.append(user)
+				team.append(result.user)
+		return team
 
-	return team
 
+async def create_team(locator:Locator, name:str, info_page:Page=None, **kwargs) -> RLTeam:
+	"""
+	Scrapes every verified player on a match roster at the same time.
 
-async def team_next_match(page:Page, team_id:str, info_page, match_index=0, **kwargs) -> None | StarLeague:
+	:param locator: The roster on the match page.
+	:param str name: The team's name.
+	:param info_page: A page to load profiles on, one at a time. Ignored when a `pool` is given.
+	:keyword pool: An rlpy.async_api.BrowserPool the profiles are loaded through at the same time. If neither a pool nor
+	an info page is given, a pool of `concurrency` pages is started for this call.
+	:return:
 	"""
-	Gets information about the next match for a Rocket League team participating in a NACE StarLeague season.
+	async with _RosterScraper(info_page, **kwargs) as scraper:
+		return await scraper.team(name, await scraper.prefetch(locator))
 
-	:param page:
-	:param str team_id: The team's id. This is the hexadecimal numbers after `https://nsl.leaguespot.gg/teams/`
-	:param info_page:
-	:param int match_index: The index of the match on the team's page.
-	:return: An rlpy.StarLeague object representing the match, or None if there are no foreseeable matches.
+
+async def _next_match_url(page:Page, team_id:str, match_index:int=0, **kwargs) -> str | None:
+	"""
+	Finds the address of one of a team's upcoming matches.
+
+	:return: The path of the match page, or None if the team has no upcoming matches.
 	:raises TimeoutError: If there is a timeout error within playwright.
 	:raises ValueError: If the match index is higher than the amount of remaining matches.
 	"""
-	from datetime import datetime as dt
-
-	await page.goto(f"https://nsl.leaguespot.gg/teams/{team_id}")
+	limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
+	await limiter.goto_async(page, f"{STARLEAGUE_URL}teams/{team_id}")
 	await page.wait_for_timeout(2000)
 	try:
 		upcoming = page.locator("div.team-match-schedule").first
@@ -69,11 +203,22 @@ async def team_next_match(page:Page, team_id:str, info_page, match_index=0, **kw
 			return
 		if match_index >= count:
 			raise ValueError(f"The match index {match_index} was out of bounds of the elements {count} for team {team_id}.")
-		next_match_url = await matches.nth(match_index).get_attribute("href")
+		return await matches.nth(match_index).get_attribute("href")
 	except TimeoutError as e:
 		raise TimeoutError(f"A timeout error occurred on page: {page.url}. Exception ({e}).")
 
-	await page.goto(f"https://nsl.leaguespot.gg{next_match_url}")
+
+async def _read_match(page:Page, match_url:str, scraper:_RosterScraper, **kwargs) -> tuple[StarLeague, tuple[list, list]] | None:
+	"""
+	Loads a match page and prefetches both rosters. The match's teams are empty until `_fill_teams` is given the rosters.
+
+	:return: The match and its prefetched rosters, or None if it has already been played.
+	:raises TimeoutError: If there is a timeout error within playwright.
+	"""
+	from datetime import datetime as dt
+
+	limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
+	await limiter.goto_async(page, f"https://nsl.leaguespot.gg{match_url}")
 	datetime_info = page.locator("div.match-page__text-container--top")
 	time = await page.locator("p.match-page__text.match-page__text--time").inner_text()
 	date = await datetime_info.locator("p.match-page__text").last.inner_text()
@@ -91,6 +236,87 @@ async def team_next_match(page:Page, team_id:str, info_page, match_index=0, **kw
 	except TimeoutError as e:
 		raise TimeoutError(f"A timeout error occurred on page: {page.url}. Exception ({e})")
 
-	return StarLeague(home_team=await create_team(teams.first, await names.first.inner_text(), info_page),
-						away_team=await create_team(teams.last, await names.last.inner_text(), info_page),
-					  	date=date)
+	home_roster = await scraper.prefetch(teams.first)
+	away_roster = await scraper.prefetch(teams.last)
+	home_name = await names.first.inner_text()
+	away_name = await names.last.inner_text()
+	return StarLeague(home_team=RLTeam(home_name), away_team=RLTeam(away_name), date=date, url=match_url), (home_roster, away_roster)
+
+
+async def _fill_teams(match:StarLeague, rosters:tuple[list, list]) -> StarLeague:
+	match.home_team = await _RosterScraper.team(match.home_team.teamname, rosters[0])
+	match.away_team = await _RosterScraper.team(match.away_team.teamname, rosters[1])
+	return match
+
+
+async def team_next_match(page:Page, team_id:str, info_page:Page=None, match_index=0, **kwargs) -> None | StarLeague:
+	"""
+	Gets information about the next match for a Rocket League team participating in a NACE StarLeague season.
+
+	:param page:
+	:param str team_id: The team's id. This is the hexadecimal numbers after `https://nsl.leaguespot.gg/teams/`
+	:param info_page: A page to load profiles on, one at a time. Ignored when a `pool` is given.
+	:param int match_index: The index of the match on the team's page.
+	:keyword pool: An rlpy.async_api.BrowserPool the players' profiles are loaded through at the same time. If neither a
+	pool nor an info page is given, a pool of `concurrency` pages is started for this call.
+	:return: An rlpy.StarLeague object representing the match, or None if there are no foreseeable matches.
+	:raises TimeoutError: If there is a timeout error within playwright.
+	:raises ValueError: If the match index is higher than the amount of remaining matches.
+	"""
+	next_match_url = await _next_match_url(page, team_id, match_index, **kwargs)
+	if next_match_url is None:
+		return
+
+	async with _RosterScraper(info_page, **kwargs) as scraper:
+		read = await _read_match(page, next_match_url, scraper, **kwargs)
+		if read is None:
+			return
+		return await _fill_teams(*read)
+
+
+async def crawl_league(page:Page, team_ids:Iterable[str], concurrency:int=4, match_index:int=0, **kwargs) -> set[StarLeague]:
+	"""
+	Gets the next match of many NACE StarLeague teams at once. The team and match pages are loaded on `concurrency`
+	pages opened next to `page`, so they share its login. A match between two of the teams is only loaded once, and a
+	player on several rosters is only scraped once.
+
+	:param page: A page that is logged in to NACE StarLeague, such as one from `nace_starleague_session`.
+	:param team_ids: The ids of the teams. These are the hexadecimal numbers after `https://nsl.leaguespot.gg/teams/`
+	:param int concurrency: The maximum number of team and match pages loaded at the same time.
+	:param int match_index: The index of the match on each team's page.
+	:keyword pool: An rlpy.async_api.BrowserPool the players' profiles are loaded through. If none is given, one is
+	started for the crawl.
+	:return: Every upcoming match that was found. Teams whose pages could not be read are logged and skipped.
+	"""
+	if concurrency < 1:
+		raise ValueError(f"The concurrency must be at least 1, not {concurrency}.")
+	logger = kwargs.get("logger", logging.getLogger(__name__))
+	team_ids = list(dict.fromkeys(team_ids))
+	pages = Queue()
+	opened = [page] + [await page.context.new_page() for _ in range(min(concurrency, len(team_ids)) - 1)]
+	for league_page in opened:
+		pages.put_nowait(league_page)
+	matches: dict[str, Task | None] = {}
+
+	async def crawl_team(team_id:str):
+		league_page = await pages.get()
+		try:
+			match_url = await _next_match_url(league_page, team_id, match_index, **kwargs)
+			if match_url is None or match_url in matches:
+				return
+			matches[match_url] = None  # Claims the match so no other team loads it too
+			read = await _read_match(league_page, match_url, scraper, **kwargs)
+			if read is not None:
+				matches[match_url] = create_task(_fill_teams(*read))
+		except (TimeoutError, ValueError):
+			logger.exception(f"An error occurred when reading the next match for team `{team_id}`.")
+		finally:
+			pages.put_nowait(league_page)
+
+	try:
+		async with _RosterScraper(**kwargs) as scraper:
+			await gather(*(crawl_team(team_id) for team_id in team_ids))
+			return set(await gather(*(task for task in matches.values() if task is not None)))
+	finally:
+		for league_page in opened[1:]:
+			await league_page.close()
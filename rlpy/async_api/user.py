@@ -1,79 +1,173 @@
 from logging import getLogger
 from playwright.async_api import Page, Error as PlaywrightError
+from ..rate_limit import DEFAULT_RATE_LIMITER
 from ..user import BaseUser, Console, UserScrapeError
+from .single_flight import SingleFlight
 
 
 class User(BaseUser):
+	IN_FLIGHT = SingleFlight()
+
 	async def get_data(self, page: Page = None, get_player_name=False, wait_for_update=True,
 									close_page_on_finish=False, use_request_api=False, **kwargs) -> "User":
 		super().get_data(page=page, get_player_name=get_player_name, wait_for_update=wait_for_update,
 						 close_page_on_finish=close_page_on_finish, use_request_api=use_request_api, **kwargs)
+		if self._load_from_cache(**kwargs):
+			return self
+
+		if not kwargs.get("coalesce", True):
+			return await self._scrape(page, get_player_name=get_player_name, close_page_on_finish=close_page_on_finish,
+									  use_request_api=use_request_api, **kwargs)
+
+		user = await self.IN_FLIGHT.run(self.link, lambda: self._scrape(page, get_player_name=get_player_name,
+																		close_page_on_finish=close_page_on_finish,
+																		use_request_api=use_request_api, **kwargs))
+		if user is not self:
+			kwargs.get("logger", getLogger(__name__)).debug(f"Shared an in-flight scrape of {self.link}.", extra=self.log_extra)
+			self._load_dict(user.to_dict())
+		return self
+
+	async def _scrape(self, page: Page = None, get_player_name=False, close_page_on_finish=False, use_request_api=False,
+					  **kwargs) -> "User":
 		from asyncio import sleep
-		from bs4 import BeautifulSoup
-		from datetime import datetime as dt, timedelta as td
-		from re import search
 
 		logger = kwargs.get("logger", getLogger(__name__))
 		max_tries = kwargs.get("max_tries", 5)
-		delay = kwargs.get("delay_seconds", 1)
+		delay = kwargs.get("delay_seconds", None)
+		limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
 		tries = 1
 
-		created_playwright = page is None
-		if created_playwright:
-			from playwright.async_api import async_playwright
+		if use_request_api:
+			await self._request_data(get_player_name=get_player_name, **kwargs)
+			self._store_in_cache(**kwargs)
+			return self
 
-			p = await async_playwright().start()
-			logger.debug("Opened playwright to get data.", extra=self.log_extra)
-			browser = await p.firefox.launch(headless=kwargs.get("headless", True),
-									   slow_mo=kwargs.get("slow_mo", 85))
-			logger.debug("Opened chromium.", extra=self.log_extra)
-			page = await browser.new_page()
-			page.set_default_timeout(kwargs.get("timeout", 0))
-			logger.debug("Opened page.", extra=self.log_extra)
+		content = profile = None
+		owned_pool = None
+		checked_out = page is None
+		if checked_out:
+			pool = kwargs.get("pool", None)
+			if pool is None:
+				from .browser_pool import BrowserPool
 
-		await page.goto(self.link)
-		logger.debug(f"Requesting RLStats webpage for {self.player_name}: {self.link}.",
-					 extra=self.log_extra)
+				pool = owned_pool = await BrowserPool(max_pages=1, headless=kwargs.get("headless", True),
+													  slow_mo=kwargs.get("slow_mo", None), timeout=kwargs.get("timeout", None),
+													  profile=kwargs.get("profile", None), logger=logger).start()
+				logger.debug("Opened a single use browser to get data.", extra=self.log_extra)
+			page = await pool.acquire()
+			logger.debug("Checked out a page.", extra=self.log_extra)
 
-		while tries <= max_tries:
-			try:
-				compact = page.locator('button[title="Switch to Compact Version"]')
-				await compact.wait_for(state="attached")
-				logger.debug(f"Page loaded for {self.link}.",
-							 extra=self.log_extra)
+		try:
+			await limiter.goto_async(page, self.link)
+			logger.debug(f"Requesting RLStats webpage for {self.player_name}: {self.link}.",
+						 extra=self.log_extra)
+
+			while tries <= max_tries:
+				try:
+					compact = page.locator('button[title="Switch to Compact Version"]')
+					await compact.wait_for(state="attached")
+					logger.debug(f"Page loaded for {self.link}.",
+								 extra=self.log_extra)
 
-				if await page.title() == "404 Not Found":
-					raise UserScrapeError(f"The requested URL was not found on this server.")
+					if await page.title() == "404 Not Found":
+						raise UserScrapeError(f"The requested URL was not found on this server.")
 
-				content = await page.content()
-				soup = BeautifulSoup(content, "html.parser")
+					if kwargs.get("extract_in_browser", False):
+						profile = await page.evaluate(self.PROFILE_SCRIPT)
+					else:
+						content = await page.content()
 
-				if close_page_on_finish:
+					if close_page_on_finish:
+						await page.close()
+					break
+				except KeyboardInterrupt as e:
+					logger.warning("Keyboard Interrupt stopped the page scraping process in Playwright.",
+								   extra=self.log_extra)
 					await page.close()
-				break
-			except KeyboardInterrupt as e:
-				logger.warning("Keyboard Interrupt stopped the page scraping process in Playwright.",
-							   extra=self.log_extra)
-				await page.close()
-				raise e
-			except BaseException as e:
-				if isinstance(e, PlaywrightError):
-					if "crashed" in e.message:
-						logger.exception("Something crashed in Playwright trying to scrape the data.", extra=self.log_extra)
+					raise e
+				except BaseException as e:
+					if isinstance(e, PlaywrightError):
+						if "crashed" in e.message:
+							logger.exception("Something crashed in Playwright trying to scrape the data.", extra=self.log_extra)
+							raise e
+
+					logger.exception(f"An error occurred trying to scrape website data. Try: {tries:,} of {max_tries:,}.",
+									 extra=self.log_extra)
+					retry_delay = limiter.retry_delay(tries, base_delay=delay)
+					tries += 1
+					if tries == max_tries:
 						raise e
+					await sleep(retry_delay)
+					await limiter.reload_async(page)
+		finally:
+			if checked_out:
+				pool.release(page)
+			if owned_pool is not None:
+				await owned_pool.close()
+
+		if profile is not None:
+			if not self._load_unchanged(extracted=profile, **kwargs):
+				self._process_extracted(profile, get_player_name=get_player_name, **kwargs)
+		elif not self._load_unchanged(html=content, **kwargs):
+			await self._process_html_async(content, get_player_name=get_player_name, **kwargs)
+		self._store_in_cache(**kwargs)
+		return self
 
-				logger.exception(f"An error occurred trying to scrape website data. Try: {tries:,} of {max_tries:,}.",
+	async def _request_data(self, get_player_name=False, **kwargs) -> "User":
+		"""
+		Downloads the user's RLStats page over plain HTTP, without a browser, and processes it.
+
+		:keyword client: The AsyncRequestClient to download the page with. The shared default client is used if none is given.
+		:return: This User object, for chaining
+		:raises rlpy.UserScrapeError: If the page does not exist or could not be scraped.
+		"""
+		from asyncio import CancelledError, sleep
+		from ..request_api import get_default_async_client
+
+		logger = kwargs.get("logger", getLogger(__name__))
+		max_tries = kwargs.get("max_tries", 5)
+		delay = kwargs.get("delay_seconds", None)
+		limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
+		client = kwargs.get("client", None) or get_default_async_client()
+
+		for tries in range(1, max_tries + 1):
+			try:
+				content = await client.get(self.link, rate_limiter=kwargs.get("rate_limiter", None))
+				logger.debug(f"Downloaded RLStats webpage for {self.player_name}: {self.link}.", extra=self.log_extra)
+				break
+			except (UserScrapeError, KeyboardInterrupt, CancelledError) as e:
+				raise e
+			except Exception as e:
+				logger.exception(f"An error occurred trying to download website data. Try: {tries:,} of {max_tries:,}.",
 								 extra=self.log_extra)
-				tries += 1
 				if tries == max_tries:
 					raise e
-				sleep(delay)
-				page.reload()
+				await sleep(limiter.retry_delay(tries, base_delay=delay))
+
+		if self._load_unchanged(html=content, **kwargs):
+			return self
+		return await self._process_html_async(content, get_player_name=get_player_name, **kwargs)
+
+	async def _process_html_async(self, html:str, get_player_name=False, **kwargs) -> "User":
+		"""
+		Parses a downloaded RLStats page and processes it. When a `parse_executor` is given, the page is parsed in that
+		executor so the event loop can keep driving other pages, and only the extracted text is sent back.
+
+		:param str html: The HTML of the user's RLStats page.
+		:param get_player_name:
+		:keyword parse_executor: A `concurrent.futures.Executor` to parse the page in. A ProcessPoolExecutor uses every
+		core. A ThreadPoolExecutor avoids copying the page between processes, but only helps with parsers that release
+		the GIL.
+		:return: This User object, for chaining
+		:raises rlpy.UserScrapeError: If there is an error when the scrape occurs.
+		"""
+		executor = kwargs.get("parse_executor", None)
+		if executor is None:
+			return self._process_html(html, get_player_name=get_player_name, **kwargs)
 
-		if created_playwright:
-			if not page.is_closed():
-				await page.close()
-			await browser.close()
-			await p.stop()
+		from asyncio import get_running_loop
+		from ..user import parse_profile
 
-		return self._process_data(soup, get_player_name=get_player_name, **kwargs)
+		regions = self.PROFILE_REGIONS if kwargs.get("partial_parse", False) else None
+		profile = await get_running_loop().run_in_executor(executor, parse_profile, html, kwargs.get("parser", None), regions)
+		return self._process_extracted(profile, get_player_name=get_player_name, **kwargs)
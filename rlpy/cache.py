@@ -0,0 +1,249 @@
+from logging import getLogger
+from threading import Lock
+from time import time
+from ._enum_classes import Console, convert_str_to_console
+
+
+__ALL__ = ["ProfileCache", "UserCache"]
+
+
+_LIFETIME_STATS = ("wins", "goals", "shots", "assists", "saves", "mvps", "trn_score")
+_PLAYLIST_COLUMNS = ("playlist", "rank", "division", "mmr", "streak", "matches_played")
+
+
+class ProfileCache(object):
+	"""
+	A persistent, SQLite-backed cache of scraped users keyed by (console, username). Each entry stores the user's
+	lifetime stats and every playlist along with the time it was fetched, so the cache stays warm across restarts.
+	"""
+	def __init__(self, path:str=":memory:", ttl:float=3600, **kwargs):
+		"""
+		:param str path: The SQLite database file. The default keeps the cache in memory for the life of the object.
+		:param float ttl: The number of seconds cached data stays fresh, unless a different age is asked for.
+		"""
+		from sqlite3 import connect
+
+		self.path = path
+		self.ttl = ttl
+		self.logger = kwargs.get("logger", getLogger(__name__))
+		self._lock = Lock()
+		self._connection = connect(path, check_same_thread=False)
+		self._create_tables()
+
+	def __enter__(self) -> "ProfileCache":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
+
+	def __len__(self) -> int:
+		with self._lock:
+			return self._connection.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+	def __repr__(self) -> str:
+		return f"rlpy.ProfileCache(path={self.path}, ttl={self.ttl})"
+
+	def _create_tables(self):
+		with self._lock, self._connection:
+			self._connection.execute("PRAGMA foreign_keys = ON")
+			self._connection.execute(f"""CREATE TABLE IF NOT EXISTS profiles (
+				console TEXT NOT NULL,
+				username TEXT NOT NULL,
+				player_name TEXT,
+				{", ".join(f"{stat} {'REAL' if stat == 'trn_score' else 'INTEGER'}" for stat in _LIFETIME_STATS)},
+				reward_level TEXT,
+				updated_at REAL,
+				fetched_at REAL NOT NULL,
+				PRIMARY KEY (console, username)
+			)""")
+			self._connection.execute("""CREATE TABLE IF NOT EXISTS playlists (
+				console TEXT NOT NULL,
+				username TEXT NOT NULL,
+				playlist TEXT NOT NULL,
+				rank TEXT NOT NULL,
+				division TEXT NOT NULL,
+				mmr INTEGER NOT NULL,
+				streak INTEGER,
+				matches_played INTEGER,
+				PRIMARY KEY (console, username, playlist),
+				FOREIGN KEY (console, username) REFERENCES profiles (console, username) ON DELETE CASCADE
+			)""")
+			columns = [column[1] for column in self._connection.execute("PRAGMA table_info(profiles)")]
+			if "updated_at" not in columns:  # Caches written before RLStats update times were recorded
+				self._connection.execute("ALTER TABLE profiles ADD COLUMN updated_at REAL")
+
+	@staticmethod
+	def _key(console:Console | str, username:str) -> tuple[str, str]:
+		if isinstance(console, str):
+			console = convert_str_to_console(console)
+		return console.value, username
+
+	def get(self, console:Console | str, username:str, max_age:float=None) -> dict[str, "Any"] | None:
+		"""
+		Looks up a user.
+
+		:param console: The console the user plays on.
+		:param str username: The user's username.
+		:param float max_age: The maximum age, in seconds, of data that can be returned. Defaults to the cache's TTL.
+		:return: The data stored for the user in the format of `BaseUser.to_dict`, with an extra `fetched_at`
+		timestamp, or None if there is no fresh data.
+		"""
+		key = self._key(console, username)
+		max_age = self.ttl if max_age is None else max_age
+		with self._lock:
+			row = self._connection.execute(f"""SELECT player_name, {", ".join(_LIFETIME_STATS)}, reward_level, updated_at, fetched_at
+				FROM profiles WHERE console = ? AND username = ?""", key).fetchone()
+			if row is None or time() - row[-1] > max_age:
+				return None
+			playlists = self._connection.execute(f"""SELECT {", ".join(_PLAYLIST_COLUMNS)} FROM playlists
+				WHERE console = ? AND username = ?""", key).fetchall()
+
+		data = {"console": key[0], "username": key[1], "player_name": row[0], "reward_level": row[-3], "updated_at": row[-2],
+				"fetched_at": row[-1]}
+		data.update(zip(_LIFETIME_STATS, row[1:-3]))
+		data["playlists"] = {playlist[0]: dict(zip(_PLAYLIST_COLUMNS, playlist)) for playlist in playlists}
+		return data
+
+	def peek(self, console:Console | str, username:str) -> dict[str, "Any"] | None:
+		"""The last data stored for a user, no matter how old it is, or None if nothing was stored."""
+		return self.get(console, username, max_age=float("inf"))
+
+	def set(self, console:Console | str, username:str, data:dict[str, "Any"], fetched_at:float=None):
+		"""
+		Stores a user, replacing anything that was stored for them before.
+
+		:param console: The console the user plays on.
+		:param str username: The user's username.
+		:param dict data: The user's data in the format of `BaseUser.to_dict`.
+		:param float fetched_at: When the data was scraped, as a UNIX timestamp. Defaults to now.
+		"""
+		key = self._key(console, username)
+		fetched_at = time() if fetched_at is None else fetched_at
+		with self._lock, self._connection:
+			self._connection.execute(f"""INSERT OR REPLACE INTO profiles
+				(console, username, player_name, {", ".join(_LIFETIME_STATS)}, reward_level, updated_at, fetched_at)
+				VALUES (?, ?, ?, {", ".join("?" for _ in _LIFETIME_STATS)}, ?, ?, ?)""",
+				(*key, data.get("player_name", None), *(data[stat] for stat in _LIFETIME_STATS), data["reward_level"],
+				 data.get("updated_at", None), fetched_at))
+			self._connection.execute("DELETE FROM playlists WHERE console = ? AND username = ?", key)
+			self._connection.executemany(f"""INSERT INTO playlists (console, username, {", ".join(_PLAYLIST_COLUMNS)})
+				VALUES (?, ?, {", ".join("?" for _ in _PLAYLIST_COLUMNS)})""",
+				[(*key, *(playlist[column] for column in _PLAYLIST_COLUMNS)) for playlist in data["playlists"].values() if playlist is not None])
+		self.logger.debug(f"Cached data for {username} on {key[0]}.")
+
+	def delete(self, console:Console | str, username:str):
+		"""Removes a user from the cache."""
+		with self._lock, self._connection:
+			self._connection.execute("DELETE FROM profiles WHERE console = ? AND username = ?", self._key(console, username))
+
+	def clear(self):
+		"""Removes every user from the cache."""
+		with self._lock, self._connection:
+			self._connection.execute("DELETE FROM profiles")
+
+	def close(self):
+		self._connection.close()
+
+
+class UserCache(object):
+	"""
+	An in-process cache of scraped users keyed by (console, username), bounded to a maximum number of entries. Entries
+	are no longer fresh after their TTL, but stay until they are evicted, so a lookup with a longer `max_age`, or a
+	`peek`, can still use them. The least recently used entry is evicted when the cache is full. Every User consults
+	`BaseUser.CACHE`, which is one of these, unless it is given a different cache.
+	"""
+	def __init__(self, max_entries:int=512, ttl:float=300, **kwargs):
+		"""
+		:param int max_entries: The maximum number of users held at once.
+		:param float ttl: The number of seconds an entry stays fresh, unless a different TTL is given when it is stored.
+		"""
+		from collections import OrderedDict
+
+		if max_entries < 1:
+			raise ValueError(f"The cache must be able to hold at least one user, not {max_entries}.")
+		self.max_entries = max_entries
+		self.ttl = ttl
+		self.logger = kwargs.get("logger", getLogger(__name__))
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+		self._lock = Lock()
+		self._entries: OrderedDict[tuple[str, str], tuple[float, float, dict]] = OrderedDict()
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def __repr__(self) -> str:
+		return f"rlpy.UserCache(max_entries={self.max_entries}, ttl={self.ttl}, entries={len(self)}, hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+	@property
+	def stats(self) -> dict[str, int]:
+		"""The hit, miss and eviction counters, and the current number of entries."""
+		return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "entries": len(self)}
+
+	def get(self, console:Console | str, username:str, max_age:float=None) -> dict[str, "Any"] | None:
+		"""
+		Looks up a user and marks them as recently used.
+
+		:param console: The console the user plays on.
+		:param str username: The user's username.
+		:param float max_age: The maximum age, in seconds, of data that can be returned. Defaults to the entry's TTL.
+		:return: The data stored for the user in the format of `BaseUser.to_dict`, with an extra `fetched_at`
+		timestamp, or None if there is no fresh data.
+		"""
+		key = ProfileCache._key(console, username)
+		now = time()
+		with self._lock:
+			entry = self._entries.get(key, None)
+			if entry is not None:
+				fetched_at, expires_at, data = entry
+				if now > expires_at if max_age is None else now - fetched_at > max_age:
+					entry = None
+			if entry is None:
+				self.misses += 1
+				return None
+			self._entries.move_to_end(key)
+			self.hits += 1
+		return {**data, "fetched_at": fetched_at}
+
+	def peek(self, console:Console | str, username:str) -> dict[str, "Any"] | None:
+		"""
+		The last data stored for a user, no matter how old it is, or None if nothing was stored. Unlike `get`, this
+		neither counts as a hit or miss nor marks the user as recently used.
+		"""
+		with self._lock:
+			entry = self._entries.get(ProfileCache._key(console, username), None)
+		if entry is None:
+			return None
+		fetched_at, expires_at, data = entry
+		return {**data, "fetched_at": fetched_at}
+
+	def set(self, console:Console | str, username:str, data:dict[str, "Any"], fetched_at:float=None, ttl:float=None):
+		"""
+		Stores a user, evicting the least recently used user if the cache is full.
+
+		:param console: The console the user plays on.
+		:param str username: The user's username.
+		:param dict data: The user's data in the format of `BaseUser.to_dict`.
+		:param float fetched_at: When the data was scraped, as a UNIX timestamp. Defaults to now.
+		:param float ttl: The number of seconds this entry stays fresh. Defaults to the cache's TTL.
+		"""
+		key = ProfileCache._key(console, username)
+		fetched_at = time() if fetched_at is None else fetched_at
+		with self._lock:
+			self._entries[key] = (fetched_at, fetched_at + (self.ttl if ttl is None else ttl), data)
+			self._entries.move_to_end(key)
+			while len(self._entries) > self.max_entries:
+				evicted, _ = self._entries.popitem(last=False)
+				self.evictions += 1
+				self.logger.debug(f"Evicted {evicted[1]} on {evicted[0]} from the cache.")
+
+	def delete(self, console:Console | str, username:str):
+		"""Removes a user from the cache."""
+		with self._lock:
+			self._entries.pop(ProfileCache._key(console, username), None)
+
+	def clear(self):
+		"""Removes every user from the cache. The counters are kept."""
+		with self._lock:
+			self._entries.clear()
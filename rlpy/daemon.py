@@ -0,0 +1,317 @@
+from json import dumps, loads
+from logging import getLogger
+from os import getenv
+from ._exceptions import DaemonError
+
+
+__ALL__ = ["ScrapeDaemon", "DaemonClient", "default_socket_path"]
+
+
+CLIENT_OPTIONS = frozenset(("get_player_name", "force_refresh", "cache_ttl", "use_request_api", "partial_parse",
+							"extract_in_browser", "max_tries"))
+
+
+def default_socket_path() -> str:
+	"""The socket the daemon listens on: `$RLPY_SOCKET`, else `rlpy.sock` in `$XDG_RUNTIME_DIR`, else one in the temp directory."""
+	from os.path import join
+	from tempfile import gettempdir
+
+	path = getenv("RLPY_SOCKET", None)
+	if path:
+		return path
+	runtime_dir = getenv("XDG_RUNTIME_DIR", None)
+	if runtime_dir:
+		return join(runtime_dir, "rlpy.sock")
+	from os import getuid
+	return join(gettempdir(), f"rlpy-{getuid()}.sock")
+
+
+class ScrapeDaemon(object):
+	"""
+	A long running process that keeps a browser, warm pages, and the user cache resident, and answers scrape and report
+	requests from `DaemonClient`s over a Unix socket.
+
+	Every request is one line of JSON with a "command". The reply is any number of lines holding a "result", followed by
+	a line with `"done": true`, and an "error" if the request failed. The commands are:
+
+	* `ping`: Replies with no results.
+	* `user`: Scrapes the user with the given "username" and "console".
+	* `batch`: Scrapes every [username, console] pair in "users", replying with each result as it finishes.
+	* `report`: The player table for the next NACE StarLeague match of "team_id". Needs StarLeague credentials.
+	* `stats`: The state of the browser pool and the user cache.
+	* `shutdown`: Stops the daemon.
+
+	`user` and `batch` also take the "options" in `CLIENT_OPTIONS`, which are passed on to `get_data`.
+	"""
+	def __init__(self, socket_path:str=None, max_pages:int=4, profile:"str | ScrapeProfile" = None, cache=None,
+				 nsl_username:str=None, nsl_password:str=None, storage_state:str=None, use_request_api:bool=False, **kwargs):
+		"""
+		:param str socket_path: The socket to listen on. Defaults to `default_socket_path()`.
+		:param int max_pages: The number of warm pages profiles are scraped on at the same time.
+		:param profile: The rlpy.ScrapeProfile, or its name, used by the browser.
+		:param cache: The cache shared by every request. Defaults to the in-process `BaseUser.CACHE`.
+		:param str nsl_username: The NACE StarLeague username used for reports.
+		:param str nsl_password: The NACE StarLeague password used for reports.
+		:param str storage_state: The file the StarLeague session is saved to, so restarts do not log in again.
+		:param bool use_request_api: If profiles should be downloaded over plain HTTP instead of through a browser. No
+		browser is launched, so reports cannot be made.
+		"""
+		self.socket_path = socket_path or default_socket_path()
+		self.max_pages = max_pages
+		self.profile = profile
+		self.cache = cache
+		self.nsl_username = nsl_username
+		self.nsl_password = nsl_password
+		self.storage_state = storage_state
+		self.use_request_api = use_request_api
+		self.logger = kwargs.get("logger", getLogger(__name__))
+
+		self._pool = None
+		self._server = None
+		self._nsl_page = None
+		self._nsl_lock = None
+		self._requests = 0
+
+	def __repr__(self) -> str:
+		return f"rlpy.ScrapeDaemon(socket_path={self.socket_path}, max_pages={self.max_pages}, requests={self._requests:,})"
+
+	def _options(self, options:dict | None) -> dict[str, "Any"]:
+		kwargs = {key: value for key, value in (options or {}).items() if key in CLIENT_OPTIONS}
+		if self.cache is not None:
+			kwargs["cache"] = self.cache
+		if self.use_request_api:
+			kwargs["use_request_api"] = True
+		return kwargs
+
+	async def start(self) -> "ScrapeDaemon":
+		"""
+		Launches the browser and opens the pages so the first request does not pay for them.
+
+		:return: This daemon, for chaining
+		"""
+		from asyncio import Lock
+		from .async_api.browser_pool import BrowserPool
+
+		if self.use_request_api:
+			return self
+		if self._pool is None:
+			self._pool = BrowserPool(max_pages=self.max_pages, profile=self.profile, logger=self.logger)
+			self._nsl_lock = Lock()
+		await self._pool.start()
+		pages = [await self._pool.acquire() for _ in range(self.max_pages)]
+		for page in pages:
+			self._pool.release(page)
+		return self
+
+	async def close(self):
+		"""Closes the StarLeague page, the browser, and the socket."""
+		if self._server is not None:
+			self._server.close()
+			await self._server.wait_closed()
+			self._server = None
+		if self._nsl_page is not None:
+			await self._nsl_page.context.close()
+			self._nsl_page = None
+		if self._pool is not None:
+			await self._pool.close()
+			self._pool = None
+
+	# region Requests
+	async def scrape_user(self, username:str, console:str, options:dict=None) -> dict[str, "Any"]:
+		"""Scrapes one user through the warm pages, returning `ScrapeResult.to_dict()`."""
+		from .async_api.batch import iter_users
+
+		results = [result async for result in iter_users([(username, console)], concurrency=1, pool=self._pool,
+														  **self._options(options))]
+		return results[0].to_dict()
+
+	async def scrape_batch(self, users:list[tuple[str, str]], concurrency:int=None, options:dict=None) -> "AsyncIterator[dict[str, Any]]":
+		"""Scrapes many users through the warm pages, yielding `ScrapeResult.to_dict()` for each as it finishes."""
+		from .async_api.batch import iter_users
+
+		async for result in iter_users(users, concurrency=min(concurrency or self.max_pages, self.max_pages),
+									   pool=self._pool, **self._options(options)):
+			yield result.to_dict()
+
+	async def report(self, team_id:str, match_index:int=0) -> dict[str, "Any"] | None:
+		"""
+		Builds the player table for a team's next NACE StarLeague match. The StarLeague session is opened on the first
+		report and kept for later ones.
+
+		:return: The match's page, date, and player table, or None if the team has no upcoming match.
+		:raises rlpy.DaemonError: If the daemon was not given StarLeague credentials.
+		"""
+		from .async_api.starleague import nace_starleague_session, team_next_match
+
+		if self.nsl_username is None or self.nsl_password is None:
+			raise DaemonError("Reports need the daemon to be started with NACE StarLeague credentials.")
+		if self._pool is None:
+			raise DaemonError("Reports need a browser, so they cannot be made by a daemon using the request API.")
+		async with self._nsl_lock:  # Every report is read from the one StarLeague page
+			if self._nsl_page is None or self._nsl_page.is_closed():
+				if self.storage_state is None:
+					from .async_api.starleague import nace_starleague_login
+
+					self._nsl_page = await (await self._pool.browser.new_context()).new_page()
+					await nace_starleague_login(self._nsl_page, self.nsl_username, self.nsl_password)
+				else:
+					self._nsl_page = await nace_starleague_session(self._pool.browser, self.nsl_username, self.nsl_password,
+																   self.storage_state, logger=self.logger)
+			match = await team_next_match(self._nsl_page, team_id, match_index=match_index, pool=self._pool,
+										  **self._options(None))
+		if match is None:
+			return None
+		return {"url": match.url, "date": None if match.date is None else match.date.isoformat(),
+				"report": match.player_details_list()}
+
+	def stats(self) -> dict[str, "Any"]:
+		from .user import BaseUser
+
+		cache = self.cache if self.cache is not None else BaseUser.CACHE
+		return {"requests": self._requests, "pages_in_use": 0 if self._pool is None else self._pool.in_use,
+				"max_pages": 0 if self._pool is None else self.max_pages,
+				"cache": getattr(cache, "stats", None)}
+	# endregion
+
+	async def _handle(self, reader:"asyncio.StreamReader", writer:"asyncio.StreamWriter"):
+		from asyncio import CancelledError
+
+		async def reply(message:dict):
+			writer.write((dumps(message) + "\n").encode("utf-8"))
+			await writer.drain()
+
+		try:
+			while line := await reader.readline():
+				self._requests += 1
+				try:
+					request = loads(line)
+					command = request.get("command", None)
+					if command == "ping":
+						pass
+					elif command == "user":
+						await reply({"result": await self.scrape_user(request["username"], request["console"], request.get("options", None))})
+					elif command == "batch":
+						async for result in self.scrape_batch(request["users"], request.get("concurrency", None), request.get("options", None)):
+							await reply({"result": result})
+					elif command == "report":
+						await reply({"result": await self.report(request["team_id"], request.get("match_index", 0))})
+					elif command == "stats":
+						await reply({"result": self.stats()})
+					elif command == "shutdown":
+						await reply({"done": True})
+						self._server.close()
+						return
+					else:
+						raise DaemonError(f"Unknown command: \"{command}\".")
+				except (KeyboardInterrupt, SystemExit, CancelledError) as e:
+					raise e
+				except BaseException as e:
+					self.logger.exception("An error occurred handling a daemon request.")
+					await reply({"done": True, "error": f"{type(e).__name__}: {e}"})
+					continue
+				await reply({"done": True})
+		except ConnectionError:
+			self.logger.debug("A client disconnected before its reply was sent.")
+		finally:
+			writer.close()
+
+	async def serve(self):
+		"""Starts the daemon and answers requests until it is sent `shutdown`."""
+		from asyncio import start_unix_server
+		from os import chmod, remove
+		from os.path import exists
+
+		await self.start()
+		if exists(self.socket_path):
+			if DaemonClient(self.socket_path).is_running():
+				raise DaemonError(f"A daemon is already listening on {self.socket_path}.")
+			remove(self.socket_path)
+		self._server = await start_unix_server(self._handle, path=self.socket_path)
+		chmod(self.socket_path, 0o600)
+		self.logger.info(f"rlpy daemon listening on {self.socket_path}.")
+		try:
+			await self._server.wait_closed()
+		finally:
+			await self.close()
+			if exists(self.socket_path):
+				remove(self.socket_path)
+
+	def run(self):
+		"""Blocks, serving requests until the daemon is shut down or interrupted."""
+		from asyncio import run
+
+		try:
+			run(self.serve())
+		except KeyboardInterrupt:
+			self.logger.info("rlpy daemon stopped.")
+
+
+class DaemonClient(object):
+	"""
+	Sends requests to a running `ScrapeDaemon`. Only the standard library is needed, so a client starts without loading
+	Playwright or a parser.
+	"""
+	def __init__(self, socket_path:str=None, timeout:float=None):
+		"""
+		:param str socket_path: The daemon's socket. Defaults to `default_socket_path()`.
+		:param float timeout: The number of seconds to wait for each line of a reply. None waits forever.
+		"""
+		self.socket_path = socket_path or default_socket_path()
+		self.timeout = timeout
+
+	def __repr__(self) -> str:
+		return f"rlpy.DaemonClient(socket_path={self.socket_path})"
+
+	def request(self, command:str, **params) -> "Iterator[Any]":
+		"""
+		Sends one request and yields each result in the reply as it arrives.
+
+		:param str command: One of the daemon's commands.
+		:param params: The rest of the request, such as "username" and "console".
+		:return:
+		:raises rlpy.DaemonError: If the daemon could not complete the request, or closed the connection.
+		:raises OSError: If no daemon is listening on the socket.
+		"""
+		from socket import AF_UNIX, SOCK_STREAM, socket
+
+		with socket(AF_UNIX, SOCK_STREAM) as connection:
+			connection.settimeout(self.timeout)
+			connection.connect(self.socket_path)
+			connection.sendall((dumps({"command": command, **params}) + "\n").encode("utf-8"))
+			with connection.makefile("r", encoding="utf-8") as replies:
+				for line in replies:
+					reply = loads(line)
+					if reply.get("done", False):
+						if reply.get("error", None) is not None:
+							raise DaemonError(reply["error"])
+						return
+					yield reply["result"]
+		raise DaemonError("The daemon closed the connection before finishing the request.")
+
+	def is_running(self) -> bool:
+		"""If a daemon is answering on the socket."""
+		try:
+			for _ in self.request("ping"):
+				pass
+			return True
+		except (OSError, DaemonError):
+			return False
+
+	def user(self, username:str, console:str, **options) -> dict[str, "Any"]:
+		"""Scrapes one user, returning the `ScrapeResult.to_dict()` record."""
+		return next(self.request("user", username=username, console=console, options=options))
+
+	def batch(self, users:"Iterable[tuple[str, str]]", concurrency:int=None, **options) -> "Iterator[dict[str, Any]]":
+		"""Scrapes many users, yielding the `ScrapeResult.to_dict()` record for each as it finishes."""
+		return self.request("batch", users=[list(user) for user in users], concurrency=concurrency, options=options)
+
+	def report(self, team_id:str, match_index:int=0) -> dict[str, "Any"] | None:
+		"""The player table for a team's next NACE StarLeague match, or None if it has no upcoming match."""
+		return next(self.request("report", team_id=team_id, match_index=match_index))
+
+	def stats(self) -> dict[str, "Any"]:
+		return next(self.request("stats"))
+
+	def shutdown(self):
+		for _ in self.request("shutdown"):
+			pass
@@ -1,9 +1,7 @@
 from abc import ABC, abstractmethod
-from tabulate import tabulate
-from .user import BaseUser
+from .user import BaseUser, ScrapeResult
 from ._enum_classes import Playlist
 from datetime import datetime
-from pytz import timezone
 
 
 __ALL__ = ["RLTeam", "Match", "StarLeague", "BaseUser"]
@@ -14,6 +12,7 @@ class RLTeam(list[BaseUser]):
 		super().__init__(users)
 		self.teamname = name
 		self.captain = captain
+		self.failed: list[ScrapeResult] = []  # The players on the roster whose profiles could not be scraped
 
 	def __str__(self) -> str:
 		string = ""
@@ -80,10 +79,14 @@ class RLTeam(list[BaseUser]):
 		return sum(lis) / len(lis)
 
 	def abbreviatied_players_details_list(self, tablefmt="fancy_grid", **kwargs):
+		from tabulate import tabulate
+
 		data = []
 		return tabulate(data, headers=("Player name"), tablefmt=tablefmt, **kwargs)
 
 	def player_details_list(self, tablefmt="fancy_grid") -> str:
+		from tabulate import tabulate
+
 		data = [
 			["User names:"] + [i.player_name for i in self] + ["Averages"],
 			["Console:"] + [f"{i.console.name.replace('_', ' ').title()}" for i in self] + ["null"],
@@ -157,6 +160,31 @@ class StarLeague(Match):
 	def __init__(self, home_team:RLTeam, away_team:RLTeam, **kwargs):
 		super().__init__(home_team, away_team)
 		self.date = kwargs.get("date", None)
+		self.url = kwargs.get("url", None)
+
+	def __eq__(self, other):
+		if not isinstance(other, StarLeague):
+			return False
+		if self.url is None or other.url is None:
+			return self is other
+		return self.url == other.url
+
+	def __hash__(self):
+		return id(self) if self.url is None else hash(self.url)
+
+	def __repr__(self) -> str:
+		return f"rlpy.StarLeague(home_team={self.home_team.teamname}, away_team={self.away_team.teamname}, date={self.date}, url={self.url})"
+
+	@property
+	def url(self) -> str | None:
+		"""The address of the match's page on NACE StarLeague, which identifies the match."""
+		return self._url
+
+	@url.setter
+	def url(self, url:str | None):
+		if not isinstance(url, str | None):
+			url = str(url)
+		self._url = url
 
 	@property
 	def date(self) -> datetime | None:
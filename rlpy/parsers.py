@@ -0,0 +1,229 @@
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from re import compile, escape, I, Pattern
+
+
+__ALL__ = ["Node", "ParserBackend", "PARSER_BACKENDS", "get_parser", "available_parsers", "slice_html"]
+
+
+class Node(ABC):
+	"""An element of a parsed HTML document, with the small part of a DOM API that the scrapers need."""
+	@abstractmethod
+	def select(self, selector:str) -> list["Node"]:
+		"""Every descendant matching the CSS selector, in document order."""
+		pass
+
+	@abstractmethod
+	def select_one(self, selector:str) -> "Node | None":
+		"""The first descendant matching the CSS selector, or None."""
+		pass
+
+	@property
+	@abstractmethod
+	def text(self) -> str:
+		"""All the text inside this element, joined together as it appears in the document."""
+		pass
+
+
+class SoupNode(Node):
+	def __init__(self, tag:"bs4.Tag"):
+		self.tag = tag
+
+	def __repr__(self) -> str:
+		return repr(self.tag)
+
+	def select(self, selector:str) -> list[Node]:
+		return [SoupNode(tag) for tag in self.tag.select(selector)]
+
+	def select_one(self, selector:str) -> Node | None:
+		tag = self.tag.select_one(selector)
+		return None if tag is None else SoupNode(tag)
+
+	@property
+	def text(self) -> str:
+		return self.tag.text
+
+
+class SelectolaxNode(Node):
+	def __init__(self, node:"selectolax.lexbor.LexborNode"):
+		self.node = node
+
+	def __repr__(self) -> str:
+		return self.node.html
+
+	def select(self, selector:str) -> list[Node]:
+		return [SelectolaxNode(node) for node in self.node.css(selector)]
+
+	def select_one(self, selector:str) -> Node | None:
+		node = self.node.css_first(selector)
+		return None if node is None else SelectolaxNode(node)
+
+	@property
+	def text(self) -> str:
+		return self.node.text(deep=True)
+
+
+class ParserBackend(ABC):
+	"""Turns HTML into a tree of Nodes using one particular parsing library."""
+	name = ""
+
+	def __repr__(self) -> str:
+		return f"rlpy.ParserBackend({self.name})"
+
+	@staticmethod
+	@abstractmethod
+	def is_available() -> bool:
+		"""If the library this backend needs is installed."""
+		pass
+
+	@abstractmethod
+	def parse(self, html:str) -> Node:
+		"""
+		Parses a document.
+
+		:param str html:
+		:return: The root of the document.
+		"""
+		pass
+
+
+class HTMLParserBackend(ParserBackend):
+	"""BeautifulSoup with Python's built-in parser. Always available, and the slowest."""
+	name = "html.parser"
+
+	@staticmethod
+	def is_available() -> bool:
+		return True
+
+	def parse(self, html:str) -> Node:
+		from bs4 import BeautifulSoup
+		return SoupNode(BeautifulSoup(html, self.name))
+
+
+class LXMLBackend(HTMLParserBackend):
+	"""BeautifulSoup with the lxml parser, written in C."""
+	name = "lxml"
+
+	@staticmethod
+	def is_available() -> bool:
+		from importlib.util import find_spec
+		return find_spec("lxml") is not None
+
+
+class SelectolaxBackend(ParserBackend):
+	"""selectolax's Lexbor parser, written in C. Much faster than any BeautifulSoup parser."""
+	name = "selectolax"
+
+	@staticmethod
+	def is_available() -> bool:
+		from importlib.util import find_spec
+		return find_spec("selectolax") is not None
+
+	def parse(self, html:str) -> Node:
+		from selectolax.lexbor import LexborHTMLParser
+		return SelectolaxNode(LexborHTMLParser(html).root)
+
+
+PARSER_BACKENDS = {backend.name: backend for backend in (SelectolaxBackend, LXMLBackend, HTMLParserBackend)}
+
+
+def available_parsers() -> list[str]:
+	"""The names of the parser backends that can be used, fastest first."""
+	return [name for name, backend in PARSER_BACKENDS.items() if backend.is_available()]
+
+
+_default_parser: ParserBackend | None = None
+
+
+def get_parser(parser:"str | ParserBackend | None" = None) -> ParserBackend:
+	"""
+	Finds a parser backend.
+
+	:param parser: The name of a backend in `PARSER_BACKENDS`, a ParserBackend, or None for the fastest installed backend.
+	:return:
+	:raises ValueError: If there is no backend with the given name.
+	:raises ImportError: If the library for the named backend is not installed.
+	"""
+	global _default_parser
+	if isinstance(parser, ParserBackend):
+		return parser
+	if parser is None:
+		if _default_parser is None:
+			_default_parser = PARSER_BACKENDS[available_parsers()[0]]()
+		return _default_parser
+
+	backend = PARSER_BACKENDS.get(parser, None)
+	if backend is None:
+		raise ValueError(f"There is no parser backend named \"{parser}\". Choose one of: {', '.join(PARSER_BACKENDS)}.")
+	if not backend.is_available():
+		raise ImportError(f"The \"{parser}\" parser backend is not installed. Install it with `pip install rlpy[parsers]`.")
+	return backend()
+
+
+_ATTRIBUTES = r"""(?:[^>"']|"[^"]*"|'[^']*')"""  # Anything in a tag up to its `>`, skipping any `>` in quoted values
+
+
+@lru_cache(maxsize=None)
+def _region_patterns(selector:str) -> tuple[Pattern, Pattern, str, str]:
+	if "#" in selector:
+		tag, value = selector.split("#")
+		attribute = "id"
+	elif "." in selector:
+		tag, value = selector.split(".")
+		attribute = "class"
+	else:
+		raise ValueError(f"Only `tag.class` and `tag#id` selectors can be sliced, not \"{selector}\".")
+	opening = compile(rf"<{escape(tag)}\b{_ATTRIBUTES}*?\s{attribute}\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+)){_ATTRIBUTES}*>", I)
+	nesting = compile(rf"<(/?){escape(tag)}\b{_ATTRIBUTES}*>", I)
+	return opening, nesting, attribute, value
+
+
+def _find_regions(html:str, selector:str, first_only:bool) -> list[tuple[int, int]]:
+	opening, nesting, attribute, value = _region_patterns(selector)
+	regions = []
+	for match in opening.finditer(html):
+		attribute_value = next(group for group in match.groups() if group is not None)
+		if (value not in attribute_value.split()) if attribute == "class" else (attribute_value != value):
+			continue
+
+		depth = 1
+		end = len(html)  # An element that is never closed runs to the end of the document, like it would when parsed
+		for tag in nesting.finditer(html, match.end()):
+			depth += -1 if tag.group(1) else 1
+			if depth == 0:
+				end = tag.end()
+				break
+		regions.append((match.start(), end))
+		if first_only:
+			break
+	return regions
+
+
+def slice_html(html:str, regions:"Iterable[tuple[str, bool]]") -> str | None:
+	"""
+	Cuts the elements matching a few simple selectors out of a page and puts them in a small document of their own, in
+	their original order, so only those elements have to be parsed. Elements inside another sliced element are only
+	kept once.
+
+	:param str html: The full page.
+	:param regions: Pairs of a `tag.class` or `tag#id` selector and if only the first match is needed. A selector whose
+	first match is needed has to match, while the others may match nothing.
+	:return: A document containing only the matching elements, or None if a selector whose first match is needed was
+	not found, so the whole page should be parsed instead.
+	"""
+	spans = []
+	for selector, first_only in regions:
+		found = _find_regions(html, selector, first_only)
+		if first_only and not found:
+			return None
+		spans.extend(found)
+	spans.sort()
+	kept = []
+	for start, end in spans:
+		if kept and end <= kept[-1][1]:
+			continue
+		if kept and start < kept[-1][1]:  # Overlapping without nesting means the markup is broken, so keep both whole
+			kept[-1] = (kept[-1][0], max(end, kept[-1][1]))
+			continue
+		kept.append((start, end))
+	return "<html><body>" + "".join(html[start:end] for start, end in kept) + "</body></html>"
@@ -0,0 +1,220 @@
+from logging import getLogger
+from random import uniform
+from threading import Lock
+from time import monotonic, sleep
+from urllib.parse import urlsplit
+
+
+__ALL__ = ["RateLimiter", "DEFAULT_RATE_LIMITER", "parse_retry_after"]
+
+
+THROTTLED_STATUSES = frozenset((429, 503))
+
+
+def parse_retry_after(value:str | None) -> float | None:
+	"""
+	Reads a `Retry-After` header.
+
+	:param value: The header's value, either a number of seconds or an HTTP date.
+	:return: The number of seconds to wait, or None if the header is missing or malformed.
+	"""
+	if value is None:
+		return None
+	value = value.strip()
+	if value.isdigit():
+		return float(value)
+	from datetime import datetime, timezone
+	from email.utils import parsedate_to_datetime
+	try:
+		return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+	except (TypeError, ValueError):
+		return None
+
+
+class _Bucket(object):
+	def __init__(self, rate:float, burst:float):
+		self.max_rate = self.rate = rate
+		self.burst = self.tokens = burst
+		self.updated = monotonic()
+		self.blocked_until = 0.0
+
+
+class RateLimiter(object):
+	"""
+	Paces requests with a token bucket for each host. When a host throttles a request, that host's rate is halved, and
+	every caller waits out the backoff (or the host's `Retry-After`). Successful requests slowly raise the rate back to
+	its maximum, so scraping settles at the fastest rate the host will sustain.
+	"""
+	def __init__(self, rate:float=2, burst:float=4, base_delay:float=1, max_delay:float=60,
+				 host_rates:dict[str, tuple[float, float]]=None, **kwargs):
+		"""
+		:param float rate: The maximum number of requests per second sent to one host.
+		:param float burst: The number of requests that can be sent to an idle host at once.
+		:param float base_delay: The number of seconds waited before the first retry. Each retry doubles it.
+		:param float max_delay: The longest number of seconds waited before a retry.
+		:param dict host_rates: A (rate, burst) pair for hosts that should not use the defaults.
+		"""
+		self.rate = rate
+		self.burst = burst
+		self.base_delay = base_delay
+		self.max_delay = max_delay
+		self.host_rates = dict(host_rates or {})
+		self.logger = kwargs.get("logger", getLogger(__name__))
+		self._lock = Lock()
+		self._buckets: dict[str, _Bucket] = {}
+
+	def __repr__(self) -> str:
+		return f"rlpy.RateLimiter(rate={self.rate}, burst={self.burst}, hosts={len(self._buckets)})"
+
+	@staticmethod
+	def _host(url:str) -> str:
+		return urlsplit(url).hostname or ""
+
+	def _bucket(self, host:str) -> _Bucket:
+		bucket = self._buckets.get(host, None)
+		if bucket is None:
+			bucket = self._buckets[host] = _Bucket(*self.host_rates.get(host, (self.rate, self.burst)))
+		return bucket
+
+	def current_rate(self, url:str) -> float:
+		"""The number of requests per second currently allowed to the URL's host."""
+		with self._lock:
+			return self._bucket(self._host(url)).rate
+
+	def reserve(self, url:str) -> float:
+		"""
+		Takes a token for a request to the URL's host.
+
+		:param str url:
+		:return: The number of seconds to wait before sending the request.
+		"""
+		now = monotonic()
+		with self._lock:
+			bucket = self._bucket(self._host(url))
+			bucket.tokens = min(bucket.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+			bucket.updated = now
+			bucket.tokens -= 1
+			wait = 0.0 if bucket.tokens >= 0 else -bucket.tokens / bucket.rate
+			return max(wait, bucket.blocked_until - now)
+
+	def acquire(self, url:str):
+		"""Blocks until a request can be sent to the URL's host."""
+		wait = self.reserve(url)
+		if wait > 0:
+			sleep(wait)
+
+	async def acquire_async(self, url:str):
+		"""Waits until a request can be sent to the URL's host."""
+		from asyncio import sleep as async_sleep
+
+		wait = self.reserve(url)
+		if wait > 0:
+			await async_sleep(wait)
+
+	def retry_delay(self, attempt:int, base_delay:float=None) -> float:
+		"""
+		Works out how long to wait before retrying a request that failed without being throttled, such as a timeout or
+		a page that did not finish loading. Other requests to the host are not held back.
+
+		:param int attempt: The number of the attempt that failed, starting at 1.
+		:param float base_delay: Overrides the limiter's delay before the first retry.
+		:return: The number of seconds to wait.
+		"""
+		delay = min(self.max_delay, (self.base_delay if base_delay is None else base_delay) * 2 ** (attempt - 1))
+		return uniform(delay / 2, delay)
+
+	def backoff(self, url:str, attempt:int, retry_after:float=None, base_delay:float=None) -> float:
+		"""
+		Works out how long to wait before retrying a request the host throttled, and stops every other request to the
+		host for that long.
+
+		:param str url: The URL that was throttled.
+		:param int attempt: The number of the attempt that failed, starting at 1.
+		:param float retry_after: The delay the host asked for, which is used instead of the exponential backoff. It is
+		capped at `max_delay`, so one response cannot stall the host for as long as it likes.
+		:param float base_delay: Overrides the limiter's delay before the first retry.
+		:return: The number of seconds to wait.
+		"""
+		delay = self.retry_delay(attempt, base_delay) if retry_after is None else min(retry_after, self.max_delay)
+		with self._lock:
+			bucket = self._bucket(self._host(url))
+			bucket.blocked_until = max(bucket.blocked_until, monotonic() + delay)
+		return delay
+
+	def throttled(self, url:str, attempt:int, retry_after:float=None) -> float:
+		"""
+		Records that the host throttled a request, halving its rate, and works out the backoff.
+
+		:return: The number of seconds to wait before retrying.
+		"""
+		host = self._host(url)
+		with self._lock:
+			bucket = self._bucket(host)
+			bucket.rate = max(bucket.max_rate / 64, bucket.rate / 2)
+		self.logger.warning(f"{host} throttled a request. Lowered its rate to {bucket.rate:.3g} requests per second.")
+		return self.backoff(url, attempt, retry_after=retry_after)
+
+	def succeeded(self, url:str):
+		"""Records that a request was not throttled, slowly raising the host's rate back towards its maximum."""
+		with self._lock:
+			bucket = self._bucket(self._host(url))
+			bucket.rate = min(bucket.max_rate, bucket.rate + bucket.max_rate / 16)
+
+	# region Page Navigation
+	def goto(self, page:"playwright.sync_api.Page", url:str, max_tries:int=5, **kwargs) -> "playwright.sync_api.Response | None":
+		"""
+		Navigates a synchronous Playwright page, waiting for the rate limit and retrying throttled responses.
+
+		:param page:
+		:param str url:
+		:param int max_tries: The number of times a throttled navigation is tried before its response is returned.
+		:param kwargs: Passed on to `Page.goto`.
+		:return: The response of the last navigation.
+		"""
+		return self._navigate(lambda: page.goto(url, **kwargs), url, max_tries)
+
+	def reload(self, page:"playwright.sync_api.Page", max_tries:int=5, **kwargs) -> "playwright.sync_api.Response | None":
+		"""Reloads a synchronous Playwright page, waiting for the rate limit and retrying throttled responses."""
+		return self._navigate(lambda: page.reload(**kwargs), page.url, max_tries)
+
+	async def goto_async(self, page:"playwright.async_api.Page", url:str, max_tries:int=5, **kwargs) -> "playwright.async_api.Response | None":
+		"""
+		Navigates an asynchronous Playwright page, waiting for the rate limit and retrying throttled responses.
+
+		:param page:
+		:param str url:
+		:param int max_tries: The number of times a throttled navigation is tried before its response is returned.
+		:param kwargs: Passed on to `Page.goto`.
+		:return: The response of the last navigation.
+		"""
+		return await self._navigate_async(lambda: page.goto(url, **kwargs), url, max_tries)
+
+	async def reload_async(self, page:"playwright.async_api.Page", max_tries:int=5, **kwargs) -> "playwright.async_api.Response | None":
+		"""Reloads an asynchronous Playwright page, waiting for the rate limit and retrying throttled responses."""
+		return await self._navigate_async(lambda: page.reload(**kwargs), page.url, max_tries)
+
+	def _navigate(self, navigate, url:str, max_tries:int):
+		for attempt in range(1, max_tries + 1):
+			self.acquire(url)
+			response = navigate()
+			if response is None or response.status not in THROTTLED_STATUSES or attempt == max_tries:
+				if response is not None and response.status not in THROTTLED_STATUSES:
+					self.succeeded(url)
+				return response
+			sleep(self.throttled(url, attempt, parse_retry_after(response.headers.get("retry-after", None))))
+
+	async def _navigate_async(self, navigate, url:str, max_tries:int):
+		from asyncio import sleep as async_sleep
+
+		for attempt in range(1, max_tries + 1):
+			await self.acquire_async(url)
+			response = await navigate()
+			if response is None or response.status not in THROTTLED_STATUSES or attempt == max_tries:
+				if response is not None and response.status not in THROTTLED_STATUSES:
+					self.succeeded(url)
+				return response
+			await async_sleep(self.throttled(url, attempt, parse_retry_after(response.headers.get("retry-after", None))))
+	# endregion
+
+
+DEFAULT_RATE_LIMITER = RateLimiter()
@@ -0,0 +1,174 @@
+from logging import getLogger
+from weakref import WeakKeyDictionary
+from ._exceptions import UserScrapeError
+from .rate_limit import DEFAULT_RATE_LIMITER, RateLimiter, THROTTLED_STATUSES, parse_retry_after
+
+
+__ALL__ = ["RequestClient", "AsyncRequestClient", "get_default_client", "get_default_async_client"]
+
+
+DEFAULT_HEADERS = {
+	"User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/115.0",
+	"Accept": "text/html,application/xhtml+xml",
+	"Accept-Encoding": "gzip, deflate",
+}
+
+
+def _import_httpx():
+	try:
+		import httpx
+	except ImportError as e:
+		raise ImportError("Scraping without a browser requires httpx. Install it with `pip install rlpy[http]`.") from e
+	return httpx
+
+
+class _BaseRequestClient(object):
+	def __init__(self, timeout:float=10, max_connections:int=10, headers:dict[str, str]=None,
+				 rate_limiter:RateLimiter=None, max_tries:int=5, **kwargs):
+		"""
+		:param float timeout: The number of seconds to wait to connect, read, or write before giving up.
+		:param int max_connections: The maximum number of connections kept open to each host.
+		:param dict headers: Headers sent with every request, on top of the default browser-like headers.
+		:param rate_limiter: The RateLimiter every request waits for. Defaults to the limiter shared by all of rlpy.
+		:param int max_tries: The number of times a throttled request is sent before giving up.
+		"""
+		self.timeout = timeout
+		self.max_connections = max_connections
+		self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+		self.rate_limiter = DEFAULT_RATE_LIMITER if rate_limiter is None else rate_limiter
+		self.max_tries = max_tries
+		self.logger = kwargs.get("logger", getLogger(__name__))
+		self._client = None
+
+	def _client_options(self) -> dict:
+		httpx = _import_httpx()
+		return {
+			"timeout": httpx.Timeout(self.timeout),
+			"limits": httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+			"headers": self.headers,
+			"follow_redirects": True,
+		}
+
+	def _check_response(self, response) -> str:
+		if response.status_code == 404:
+			raise UserScrapeError(f"The requested URL was not found on this server: {response.url}.")
+		response.raise_for_status()
+		return response.text
+
+
+class RequestClient(_BaseRequestClient):
+	"""A keep-alive HTTP client that downloads RLStats pages without launching a browser."""
+	def __enter__(self) -> "RequestClient":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
+
+	@property
+	def client(self) -> "httpx.Client":
+		"""The underlying connection pool, created the first time it is needed."""
+		if self._client is None:
+			self._client = _import_httpx().Client(**self._client_options())
+		return self._client
+
+	def get(self, url:str, rate_limiter:RateLimiter=None) -> str:
+		"""
+		Downloads a page.
+
+		:param str url: The page to download.
+		:param rate_limiter: The RateLimiter this request waits for, instead of the client's own.
+		:return: The decoded HTML of the page.
+		:raises rlpy.UserScrapeError: If the page does not exist.
+		:raises httpx.HTTPError: If the request failed or the server returned an error status, including when it is
+		still throttling the request after `max_tries` attempts.
+		"""
+		from time import sleep
+
+		limiter = self.rate_limiter if rate_limiter is None else rate_limiter
+		self.logger.debug(f"Requesting {url} without a browser.")
+		for attempt in range(1, self.max_tries + 1):
+			limiter.acquire(url)
+			response = self.client.get(url)
+			if response.status_code not in THROTTLED_STATUSES:
+				limiter.succeeded(url)
+				break
+			if attempt < self.max_tries:
+				sleep(limiter.throttled(url, attempt, parse_retry_after(response.headers.get("Retry-After", None))))
+		return self._check_response(response)
+
+	def close(self):
+		if self._client is not None:
+			self._client.close()
+			self._client = None
+
+
+class AsyncRequestClient(_BaseRequestClient):
+	"""A keep-alive HTTP client that downloads RLStats pages without launching a browser, for use with asyncio."""
+	async def __aenter__(self) -> "AsyncRequestClient":
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		await self.close()
+
+	@property
+	def client(self) -> "httpx.AsyncClient":
+		"""The underlying connection pool, created the first time it is needed."""
+		if self._client is None:
+			self._client = _import_httpx().AsyncClient(**self._client_options())
+		return self._client
+
+	async def get(self, url:str, rate_limiter:RateLimiter=None) -> str:
+		"""
+		Downloads a page.
+
+		:param str url: The page to download.
+		:param rate_limiter: The RateLimiter this request waits for, instead of the client's own.
+		:return: The decoded HTML of the page.
+		:raises rlpy.UserScrapeError: If the page does not exist.
+		:raises httpx.HTTPError: If the request failed or the server returned an error status, including when it is
+		still throttling the request after `max_tries` attempts.
+		"""
+		from asyncio import sleep
+
+		limiter = self.rate_limiter if rate_limiter is None else rate_limiter
+		self.logger.debug(f"Requesting {url} without a browser.")
+		for attempt in range(1, self.max_tries + 1):
+			await limiter.acquire_async(url)
+			response = await self.client.get(url)
+			if response.status_code not in THROTTLED_STATUSES:
+				limiter.succeeded(url)
+				break
+			if attempt < self.max_tries:
+				await sleep(limiter.throttled(url, attempt, parse_retry_after(response.headers.get("Retry-After", None))))
+		return self._check_response(response)
+
+	async def close(self):
+		if self._client is not None:
+			await self._client.aclose()
+			self._client = None
+
+
+_default_client: RequestClient | None = None
+_default_async_clients = WeakKeyDictionary()
+
+
+def get_default_client() -> RequestClient:
+	"""The RequestClient shared by every synchronous User that is not given its own client."""
+	global _default_client
+	if _default_client is None:
+		_default_client = RequestClient()
+	return _default_client
+
+
+def get_default_async_client() -> AsyncRequestClient:
+	"""
+	The AsyncRequestClient shared by every asynchronous User that is not given its own client. Connections cannot be
+	shared between event loops, so each running loop gets its own client.
+	"""
+	from asyncio import get_running_loop
+
+	loop = get_running_loop()
+	client = _default_async_clients.get(loop, None)
+	if client is None:
+		client = _default_async_clients[loop] = AsyncRequestClient()
+	return client
@@ -0,0 +1,80 @@
+from urllib.parse import urlsplit
+
+
+__ALL__ = ["ScrapeProfile", "SCRAPE_PROFILES", "get_scrape_profile"]
+
+
+def _site(url:str) -> str:
+	host = urlsplit(url).hostname or ""
+	return ".".join(host.split(".")[-2:])
+
+
+class ScrapeProfile(object):
+	"""
+	A named set of browser settings used when pages are opened for scraping: how slowly Playwright acts, how long it
+	waits, and which requests are aborted before they are sent.
+	"""
+	def __init__(self, name:str, slow_mo:float=85, timeout:float=0, navigation_timeout:float=None,
+				 blocked_resource_types:tuple[str, ...]=(), block_third_party:bool=False):
+		"""
+		:param str name: The name the profile is registered under.
+		:param float slow_mo: The number of milliseconds Playwright waits between operations.
+		:param float timeout: The default timeout for page actions, in milliseconds. 0 disables timeouts.
+		:param float navigation_timeout: The default timeout for navigations, in milliseconds. Defaults to `timeout`.
+		:param blocked_resource_types: Playwright resource types, such as "image" or "font", that are aborted.
+		:param bool block_third_party: If requests to a site other than the page's own site are aborted.
+		"""
+		self.name = name
+		self.slow_mo = slow_mo
+		self.timeout = timeout
+		self.navigation_timeout = timeout if navigation_timeout is None else navigation_timeout
+		self.blocked_resource_types = frozenset(blocked_resource_types)
+		self.block_third_party = block_third_party
+
+	def __repr__(self) -> str:
+		return f"rlpy.ScrapeProfile(name={self.name}, slow_mo={self.slow_mo}, timeout={self.timeout})"
+
+	@property
+	def intercepts_requests(self) -> bool:
+		"""If a route has to be installed on pages to apply this profile."""
+		return bool(self.blocked_resource_types) or self.block_third_party
+
+	def should_block(self, resource_type:str, url:str, page_url:str) -> bool:
+		"""
+		Decides if a request should be aborted. Documents are never blocked, so navigations always go through.
+
+		:param str resource_type: The Playwright resource type of the request.
+		:param str url: The URL being requested.
+		:param str page_url: The URL of the frame making the request.
+		:return:
+		"""
+		if resource_type == "document":
+			return False
+		if resource_type in self.blocked_resource_types:
+			return True
+		return self.block_third_party and url.startswith("http") and _site(url) != _site(page_url)
+
+
+SCRAPE_PROFILES = {
+	"default": ScrapeProfile("default"),
+	"fast": ScrapeProfile("fast", slow_mo=0, timeout=15_000, navigation_timeout=30_000,
+						  blocked_resource_types=("image", "media", "font", "stylesheet"), block_third_party=True),
+}
+
+
+def get_scrape_profile(profile:"str | ScrapeProfile | None" = None) -> ScrapeProfile:
+	"""
+	Finds a scrape profile.
+
+	:param profile: The name of a profile in `SCRAPE_PROFILES`, a ScrapeProfile, or None for the default profile.
+	:return:
+	:raises ValueError: If there is no profile with the given name.
+	"""
+	if profile is None:
+		return SCRAPE_PROFILES["default"]
+	if isinstance(profile, ScrapeProfile):
+		return profile
+	try:
+		return SCRAPE_PROFILES[profile]
+	except KeyError:
+		raise ValueError(f"There is no scrape profile named \"{profile}\". Choose one of: {', '.join(SCRAPE_PROFILES)}.")
@@ -1,12 +1,15 @@
 from json import loads, dumps
 from logging import getLogger
-from playwright.sync_api import sync_playwright, expect
 from re import search
+from .rate_limit import DEFAULT_RATE_LIMITER
 
 
 def scrape_skill_distributions(output_file, **kwargs):
+	from playwright.sync_api import sync_playwright
+
 	headless = kwargs.get("headless", True)
 	logger = kwargs.get("logger", getLogger(__name__))
+	limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
 	playlists = {"10": "Ranked Duel 1v1",
 				"11": "Ranked Doubles 2v2",
 				"13": "Ranked Standard 3v3",
@@ -20,7 +23,7 @@ def scrape_skill_distributions(output_file, **kwargs):
 		page = browser.new_page()
 		json = {"data": [], "population": []}
 		for num, name in playlists.items():
-			page.goto(f"https://api.tracker.gg/api/v1/rocket-league/distribution/{num}")
+			limiter.goto(page, f"https://api.tracker.gg/api/v1/rocket-league/distribution/{num}")
 			html = page.inner_text("*")
 			dct = loads(html)["data"]
 			for attribute in ("tiers", "divisions"):
@@ -29,7 +32,7 @@ def scrape_skill_distributions(output_file, **kwargs):
 
 			logger.debug(f"Scraping from: https://rocketleague.tracker.network/rocket-league/distribution?playlist={num}")
 
-			page.goto(f"https://rocketleague.tracker.network/rocket-league/distribution?playlist={num}")
+			limiter.goto(page, f"https://rocketleague.tracker.network/rocket-league/distribution?playlist={num}")
 			itms = page.locator("li.dropdown__item")
 			for itm in itms.all():
 				if itm.inner_text() == name:
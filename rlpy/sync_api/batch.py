@@ -0,0 +1,92 @@
+from collections.abc import Iterable, Iterator
+from logging import getLogger
+from time import perf_counter
+from .._enum_classes import Console
+from ..user import ScrapeResult
+from .browser_pool import BrowserPool
+from .user import User
+
+
+__ALL__ = ["iter_users"]
+
+
+def _as_user(user:User | tuple[str, Console | str]) -> User:
+	if isinstance(user, User):
+		return user
+	username, console = user
+	return User(username, console)
+
+
+def _fetch_user(user:User, **kwargs) -> ScrapeResult:
+	logger = kwargs.get("logger", getLogger(__name__))
+	start = perf_counter()
+	try:
+		user.get_data(**kwargs)
+	except (KeyboardInterrupt, SystemExit) as e:
+		raise e
+	except BaseException as e:
+		logger.warning(f"Could not scrape {user.link}: {e!r}", extra=user.log_extra)
+		return ScrapeResult(user, error=e, elapsed=perf_counter() - start)
+	return ScrapeResult(user, elapsed=perf_counter() - start)
+
+
+def iter_users(users:Iterable[User | tuple[str, Console | str]], concurrency:int=4, pool:BrowserPool=None,
+			   **kwargs) -> Iterator[ScrapeResult]:
+	"""
+	Scrapes many users, yielding each result as soon as its scrape finishes. Users are only taken from `users` when a
+	scraper is free, and nothing new is started while a result is waiting to be consumed, so `users` can be a lazy
+	iterable of any length.
+
+	Synchronous Playwright can only be driven from the thread that started it, so profiles loaded in a browser are
+	scraped one at a time through one shared page. With `use_request_api`, up to `concurrency` pages are downloaded at
+	once in threads.
+
+	:param users: rlpy.sync_api.User objects, or (username, console) pairs.
+	:param int concurrency: The maximum number of profiles downloaded at the same time with `use_request_api`.
+	:param pool: The BrowserPool to check pages out of. If none is given, one is started for the batch and closed
+	afterwards, using the `headless`, `slow_mo`, `timeout` and `profile` keywords.
+	:param kwargs: Passed on to every `User.get_data` call.
+	:return: One rlpy.ScrapeResult per user, in the order the scrapes finished.
+	"""
+	if concurrency < 1:
+		raise ValueError(f"The concurrency must be at least 1, not {concurrency}.")
+	users = (_as_user(user) for user in users)
+
+	if kwargs.get("use_request_api", False):
+		yield from _iter_requests(users, concurrency, **kwargs)
+		return
+
+	owned_pool = pool is None
+	if owned_pool:
+		pool = BrowserPool(max_pages=1, headless=kwargs.pop("headless", True),
+						   slow_mo=kwargs.pop("slow_mo", None), timeout=kwargs.pop("timeout", None),
+						   profile=kwargs.pop("profile", None), logger=kwargs.get("logger", getLogger(__name__)))
+	try:
+		pool.start()
+		for user in users:
+			yield _fetch_user(user, pool=pool, **kwargs)
+	finally:
+		if owned_pool:
+			pool.close()
+
+
+def _iter_requests(users:Iterator[User], concurrency:int, **kwargs) -> Iterator[ScrapeResult]:
+	from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+	executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="rlpy-iter-users")
+	pending = set()
+	try:
+		for user in users:
+			pending.add(executor.submit(_fetch_user, user, **kwargs))
+			if len(pending) < concurrency:
+				continue
+			done, pending = wait(pending, return_when=FIRST_COMPLETED)
+			for future in done:
+				yield future.result()
+
+		while pending:
+			done, pending = wait(pending, return_when=FIRST_COMPLETED)
+			for future in done:
+				yield future.result()
+	finally:
+		executor.shutdown(wait=True, cancel_futures=True)
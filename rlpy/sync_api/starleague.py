@@ -1,66 +1,183 @@
 from .._enum_classes import Console, Playlist
-from .._exceptions import UserScrapeError
 from ..match import RLTeam, StarLeague
-from ..tools import get_timezone
+from ..rate_limit import DEFAULT_RATE_LIMITER
+from ..tools import get_timezone, save_storage_state, storage_state_expired
+from ..user import ScrapeResult
 from .user import User
+from collections.abc import Iterable
 import logging
-from playwright.sync_api import Locator, Page, expect, sync_playwright, TimeoutError
+from time import perf_counter
+from playwright.sync_api import Browser, Locator, Page, expect, sync_playwright, TimeoutError
 from pytz import timezone
 
 
-__ALL__ = ["nace_starleague_login", "create_team", "team_next_match"]
+__ALL__ = ["nace_starleague_login", "nace_starleague_session", "create_team", "team_next_match", "crawl_league"]
 
 
-def nace_starleague_login(page: Page, username: str, password: str):
-	page.goto("https://nsl.leaguespot.gg/login/")
+STARLEAGUE_URL = "https://nsl.leaguespot.gg/"
+
+
+def _submit_login(page:Page, username:str, password:str):
 	page.locator("input#username").type(username)
 	page.locator("input#password").type(password)
 	page.locator("button.login-button.button.button--primary.button--wide.button--round").click(force=True)
-	page.wait_for_url("https://nsl.leaguespot.gg/")
+	page.wait_for_url(STARLEAGUE_URL)
 
 
-def create_team(locator: Locator, name: str, info_page: Page) -> RLTeam:
-	team = RLTeam(name)
-	users = locator.locator("li.match-user")
+def nace_starleague_login(page: Page, username: str, password: str, **kwargs):
+	"""
+	Logs in to NACE StarLeague.
 
-	for team_li in users.all():
-		handles = team_li.locator("div.match-user__handle")
-		for div_handle in handles.all():
-			verified = div_handle.get_by_alt_text("Verified").count() == 1
-			if not verified:
-				continue
+	:param page:
+	:param str username:
+	:param str password:
+	:keyword str storage_state: A file the logged in session is saved to, so `nace_starleague_session` can reuse it.
+	"""
+	limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
+	limiter.goto(page, f"{STARLEAGUE_URL}login/")
+	_submit_login(page, username, password)
+	if kwargs.get("storage_state", None) is not None:
+		save_storage_state(page.context.storage_state(), kwargs["storage_state"])
 
-			try:
-				user = User(div_handle.locator("span").inner_text(), Console.EPIC_GAMES)
-				user.get_data(page=info_page)
-			except UserScrapeError:
-				logging.getLogger(__name__).exception(f"An error occurred when scraping information for `{user.player_name}` on `{user.console}`")
-				continue
 
-			if team_li.locator("div.avatar.small.avatar__role--captain").count():
-				team.captain = user
+def nace_starleague_session(browser:Browser, username:str, password:str, storage_state:str, **kwargs) -> Page:
+	"""
+	Opens a page in a new browser context that is logged in to NACE StarLeague. A session saved by an earlier login is
+	loaded instead of logging in again. The login form is only filled in when there is no saved session, or the site no
+	longer accepts it, and the new session is then saved for the next context. Many contexts can be opened from one
+	saved session at the same time.
+
+	:param browser:
+	:param str username:
+	:param str password:
+	:param str storage_state: The file the session is saved to and loaded from.
+	:keyword float verify_timeout: The number of milliseconds to wait for the site to accept a saved session. Defaults to 5000.
+	:keyword context_options: Other keywords passed to `Browser.new_context`.
+	:return: A logged in page. Its context can be found with `page.context`.
+	"""
+	logger = kwargs.get("logger", logging.getLogger(__name__))
+	limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
+	context_options = kwargs.get("context_options", {})
+	saved = not storage_state_expired(storage_state)
+
+	context = browser.new_context(storage_state=storage_state if saved else None, **context_options)
+	page = context.new_page()
+	limiter.goto(page, f"{STARLEAGUE_URL}login/")
+	if saved:
+		try:  # A logged in session is sent straight on from the login page
+			page.wait_for_url(STARLEAGUE_URL, timeout=kwargs.get("verify_timeout", 5000))
+			logger.debug("Reused the saved NACE StarLeague session.")
+			return page
+		except TimeoutError:
+			logger.info("The saved NACE StarLeague session has expired. Logging in again.")
+
+	_submit_login(page, username, password)
+	save_storage_state(context.storage_state(), storage_state)
+	return page
+
+
+def _read_roster(locator:Locator) -> list[tuple[bool, list[str]]]:
+	"""
+	Reads every player in a roster before any profile is loaded, so the match page is only walked once.
+
+	:param locator: The roster on the match page.
+	:return: If each player is the captain, and their verified handles.
+	"""
+	roster = []
+	for team_li in locator.locator("li.match-user").all():
+		handles = [div_handle.locator("span").inner_text() for div_handle in team_li.locator("div.match-user__handle").all()
+				   if div_handle.get_by_alt_text("Verified").count() == 1]
+		if handles:
+			roster.append((team_li.locator("div.avatar.small.avatar__role--captain").count() > 0, handles))
+	return roster
+
+
+def _scrape_player(handles:list[str], info_page:Page=None, **kwargs) -> ScrapeResult:
+	"""Scrapes the first of a player's handles that can be scraped. If none can, the last handle's error is returned."""
+	for handle in handles:
+		user = User(handle, Console.EPIC_GAMES)
+		start = perf_counter()
+		try:
+			user.get_data(page=info_page, **kwargs)
+		except Exception as e:
+			kwargs.get("logger", logging.getLogger(__name__)).exception(f"An error occurred when scraping information for `{user.player_name}` on `{user.console}`")
+			result = ScrapeResult(user, error=e, elapsed=perf_counter() - start)
+			continue
+		return ScrapeResult(user, elapsed=perf_counter() - start)
+	return result
+
+
+def _scrape_rosters(rosters:list[tuple[str, list[tuple[bool, list[str]]]]], info_page:Page=None, **kwargs) -> list[RLTeam]:
+	"""
+	Scrapes every player in the rosters, scraping a player on several rosters only once. With `use_request_api`, up to
+	`concurrency` profiles are downloaded at the same time in threads. Otherwise the profiles are loaded in a browser one
+	player at a time, since synchronous Playwright can only be driven from the thread that started it.
+
+	:param rosters: The name of each team, and the roster read by `_read_roster`.
+	:param info_page: A page to load profiles on. If none is given, a page is checked out of the `pool` keyword, or
+	out of a browser started for this call.
+	:return: One team for each roster. The players that could not be scraped are in each team's `failed` list.
+	"""
+	players = list(dict.fromkeys(tuple(handles) for name, roster in rosters for is_captain, handles in roster))
+	owned_pool = None
+	try:
+		if kwargs.get("use_request_api", False):
+			from concurrent.futures import ThreadPoolExecutor
+
+			with ThreadPoolExecutor(max_workers=kwargs.get("concurrency", 6), thread_name_prefix="rlpy-roster") as executor:
+				results = list(executor.map(lambda handles: _scrape_player(handles, **kwargs), players))
+		else:
+			if info_page is None and kwargs.get("pool", None) is None:
+				from .browser_pool import BrowserPool
+
+				kwargs["pool"] = owned_pool = BrowserPool(max_pages=1, headless=kwargs.get("headless", True),
+														  profile=kwargs.get("profile", None)).start()
+			results = [_scrape_player(handles, info_page, **kwargs) for handles in players]
+	finally:
+		if owned_pool is not None:
+			owned_pool.close()
+
+	results = dict(zip(players, results))
+	teams = []
+	for name, roster in rosters:
+		team = RLTeam(name)
+		for is_captain, handles in roster:
+			result = results[tuple(handles)]
+			if not result:
+				team.failed.append(result)
+			elif is_captain:
+				team.captain = result.user
 			else:
-				team.append(user)
-			break
+				team.append(result.user)
+		teams.append(team)
+	return teams
 
-	return team
 
+def create_team(locator: Locator, name: str, info_page: Page = None, **kwargs) -> RLTeam:
+	"""
+	Scrapes every verified player on a match roster. Unless `use_request_api` is set, the players are scraped one at a
+	time in a browser; the async API's `create_team` scrapes them at the same time.
 
-def team_next_match(page: Page, team_id: str, info_page:Page, match_index:int=0, **kwargs) -> None | StarLeague:
+	:param locator: The roster on the match page.
+	:param str name: The team's name.
+	:param info_page: A page to load profiles on. If none is given, a page is checked out of the `pool` keyword, or out
+	of a browser started for this call.
+	:keyword bool use_request_api: If the profiles should be downloaded over plain HTTP, `concurrency` at a time.
+	:return:
 	"""
-	Gets information about the next match for a Rocket League team participating in a NACE StarLeague season.
+	return _scrape_rosters([(name, _read_roster(locator))], info_page, **kwargs)[0]
 
-	:param page:
-	:param str team_id: The team's id. This is the hexadecimal numbers after `https://nsl.leaguespot.gg/teams/`
-	:param info_page:
-	:param int match_index: The index of the match on the team's page.
-	:return: An rlpy.StarLeague object representing the match, or None if there are no foreseeable matches.
+
+def _next_match_url(page:Page, team_id:str, match_index:int=0, **kwargs) -> str | None:
+	"""
+	Finds the address of one of a team's upcoming matches.
+
+	:return: The path of the match page, or None if the team has no upcoming matches.
 	:raises TimeoutError: If there is a timeout error within playwright.
 	:raises ValueError: If the match index is higher than the amount of remaining matches.
 	"""
-	from datetime import datetime as dt
-
-	page.goto(f"https://nsl.leaguespot.gg/teams/{team_id}")
+	limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
+	limiter.goto(page, f"{STARLEAGUE_URL}teams/{team_id}")
 	page.wait_for_timeout(2000)
 	try:
 		upcoming = page.locator("div.team-match-schedule").first
@@ -70,11 +187,22 @@ def team_next_match(page: Page, team_id: str, info_page:Page, match_index:int=0,
 			return
 		if match_index >= count:
 			raise ValueError(f"The match index {match_index} was out of bounds of the elements {count} for team {team_id}.")
-		next_match_url = matches.nth(match_index).get_attribute("href")
+		return matches.nth(match_index).get_attribute("href")
 	except TimeoutError as e:
 		raise TimeoutError(f"A timeout error occurred on page: {page.url}. Exception ({e}).")
 
-	page.goto(f"https://nsl.leaguespot.gg{next_match_url}")
+
+def _read_match(page:Page, match_url:str, **kwargs) -> tuple[StarLeague, list[tuple[str, list]]] | None:
+	"""
+	Loads a match page and reads both rosters. The match's teams are empty until the rosters are scraped.
+
+	:return: The match and the name and roster of each team, or None if it has already been played.
+	:raises TimeoutError: If there is a timeout error within playwright.
+	"""
+	from datetime import datetime as dt
+
+	limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
+	limiter.goto(page, f"https://nsl.leaguespot.gg{match_url}")
 	datetime_info = page.locator("div.match-page__text-container--top")
 	time = page.locator("p.match-page__text.match-page__text--time").inner_text()
 	date = datetime_info.locator("p.match-page__text").last.inner_text()
@@ -92,6 +220,64 @@ def team_next_match(page: Page, team_id: str, info_page:Page, match_index:int=0,
 	except TimeoutError as e:
 		raise TimeoutError(f"A timeout error occurred on page: {page.url}. Exception ({e})")
 
-	return StarLeague(home_team=create_team(teams.first, names.first.inner_text(), info_page),
-					  away_team=create_team(teams.last, names.last.inner_text(), info_page),
-					  date=date)
+	rosters = [(names.first.inner_text(), _read_roster(teams.first)), (names.last.inner_text(), _read_roster(teams.last))]
+	return StarLeague(home_team=RLTeam(rosters[0][0]), away_team=RLTeam(rosters[1][0]), date=date, url=match_url), rosters
+
+
+def team_next_match(page: Page, team_id: str, info_page:Page=None, match_index:int=0, **kwargs) -> None | StarLeague:
+	"""
+	Gets information about the next match for a Rocket League team participating in a NACE StarLeague season.
+
+	:param page:
+	:param str team_id: The team's id. This is the hexadecimal numbers after `https://nsl.leaguespot.gg/teams/`
+	:param info_page: A page to load profiles on. If none is given, a page is checked out of the `pool` keyword, or out
+	of a browser started for this call.
+	:param int match_index: The index of the match on the team's page.
+	:keyword bool use_request_api: If the players' profiles should be downloaded over plain HTTP, `concurrency` at a time.
+	:return: An rlpy.StarLeague object representing the match, or None if there are no foreseeable matches.
+	:raises TimeoutError: If there is a timeout error within playwright.
+	:raises ValueError: If the match index is higher than the amount of remaining matches.
+	"""
+	next_match_url = _next_match_url(page, team_id, match_index, **kwargs)
+	if next_match_url is None:
+		return
+
+	read = _read_match(page, next_match_url, **kwargs)
+	if read is None:
+		return
+	match, rosters = read
+	match.home_team, match.away_team = _scrape_rosters(rosters, info_page, **kwargs)
+	return match
+
+
+def crawl_league(page:Page, team_ids:Iterable[str], info_page:Page=None, match_index:int=0, **kwargs) -> set[StarLeague]:
+	"""
+	Gets the next match of many NACE StarLeague teams. Every team and match page is read before any profile is loaded,
+	so a match between two of the teams is only loaded once, and a player on several rosters is only scraped once.
+	Unless `use_request_api` is set, the players are scraped one at a time in a browser, so the async API's
+	`crawl_league` is faster for large leagues.
+
+	:param page: A page that is logged in to NACE StarLeague, such as one from `nace_starleague_session`.
+	:param team_ids: The ids of the teams. These are the hexadecimal numbers after `https://nsl.leaguespot.gg/teams/`
+	:param info_page: A page to load profiles on. If none is given, a page is checked out of the `pool` keyword, or out
+	of a browser started for this call.
+	:param int match_index: The index of the match on each team's page.
+	:keyword bool use_request_api: If the players' profiles should be downloaded over plain HTTP, `concurrency` at a time.
+	:return: Every upcoming match that was found. Teams whose pages could not be read are logged and skipped.
+	"""
+	logger = kwargs.get("logger", logging.getLogger(__name__))
+	matches = {}
+	for team_id in dict.fromkeys(team_ids):
+		try:
+			match_url = _next_match_url(page, team_id, match_index, **kwargs)
+			if match_url is None or match_url in matches:
+				continue
+			matches[match_url] = _read_match(page, match_url, **kwargs)
+		except (TimeoutError, ValueError):
+			logger.exception(f"An error occurred when reading the next match for team `{team_id}`.")
+
+	matches = [read for read in matches.values() if read is not None]
+	teams = iter(_scrape_rosters([roster for match, rosters in matches for roster in rosters], info_page, **kwargs))
+	for match, rosters in matches:
+		match.home_team, match.away_team = next(teams), next(teams)
+	return {match for match, rosters in matches}
@@ -1,5 +1,6 @@
 from logging import getLogger
 from playwright.sync_api import Page, Error as PlaywrightError
+from ..rate_limit import DEFAULT_RATE_LIMITER
 from ..user import BaseUser, Console, UserScrapeError
 
 
@@ -9,71 +10,123 @@ class User(BaseUser):
 		super().get_data(page=page, get_player_name=get_player_name, wait_for_update=wait_for_update,
 						 close_page_on_finish=close_page_on_finish, use_request_api=use_request_api, **kwargs)
 		from time import sleep
-		from bs4 import BeautifulSoup
-		from datetime import datetime as dt, timedelta as td
-		from re import search
 
 		logger = kwargs.get("logger", getLogger(__name__))
 		max_tries = kwargs.get("max_tries", 5)
-		delay = kwargs.get("delay_seconds", 1)
+		delay = kwargs.get("delay_seconds", None)
+		limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
 		tries = 1
 
-		created_playwright = page is None
-		if created_playwright:
-			from playwright.sync_api import sync_playwright
+		if self._load_from_cache(**kwargs):
+			return self
 
-			p = sync_playwright().start()
-			logger.debug("Opened playwright to get data.", extra=self.log_extra)
-			browser = p.firefox.launch(headless=kwargs.get("headless", True),
-									   slow_mo=kwargs.get("slow_mo", 85))
-			logger.debug("Opened chromium.", extra=self.log_extra)
-			page = browser.new_page()
-			page.set_default_timeout(kwargs.get("timeout", 0))
-			logger.debug("Opened page.", extra=self.log_extra)
+		if use_request_api:
+			self._request_data(get_player_name=get_player_name, **kwargs)
+			self._store_in_cache(**kwargs)
+			return self
 
-		page.goto(self.link)
-		logger.debug(f"Requesting RLStats webpage for {self.player_name}: {self.link}.",
-					 extra=self.log_extra)
+		content = profile = None
+		owned_pool = None
+		checked_out = page is None
+		if checked_out:
+			pool = kwargs.get("pool", None)
+			if pool is None:
+				from .browser_pool import BrowserPool
 
-		while tries <= max_tries:
-			try:
-				compact = page.locator('button[title="Switch to Compact Version"]')
-				compact.wait_for(state="attached")
-				logger.debug(f"Page loaded for {self.link}.",
-							 extra=self.log_extra)
+				pool = owned_pool = BrowserPool(max_pages=1, headless=kwargs.get("headless", True),
+												slow_mo=kwargs.get("slow_mo", None), timeout=kwargs.get("timeout", None),
+												profile=kwargs.get("profile", None), logger=logger).start()
+				logger.debug("Opened a single use browser to get data.", extra=self.log_extra)
+			page = pool.acquire()
+			logger.debug("Checked out a page.", extra=self.log_extra)
+
+		try:
+			limiter.goto(page, self.link)
+			logger.debug(f"Requesting RLStats webpage for {self.player_name}: {self.link}.",
+						 extra=self.log_extra)
 
-				if page.title() == "404 Not Found":
-					raise UserScrapeError(f"The requested URL was not found on this server.")
+			while tries <= max_tries:
+				try:
+					compact = page.locator('button[title="Switch to Compact Version"]')
+					compact.wait_for(state="attached")
+					logger.debug(f"Page loaded for {self.link}.",
+								 extra=self.log_extra)
 
-				content = page.content()
-				soup = BeautifulSoup(content, "html.parser")
+					if page.title() == "404 Not Found":
+						raise UserScrapeError(f"The requested URL was not found on this server.")
 
-				if close_page_on_finish:
+					if kwargs.get("extract_in_browser", False):
+						profile = page.evaluate(self.PROFILE_SCRIPT)
+					else:
+						content = page.content()
+
+					if close_page_on_finish:
+						page.close()
+					break
+				except KeyboardInterrupt as e:
+					logger.warning("Keyboard Interrupt stopped the page scraping process in Playwright.",
+								   extra=self.log_extra)
 					page.close()
-				break
-			except KeyboardInterrupt as e:
-				logger.warning("Keyboard Interrupt stopped the page scraping process in Playwright.",
-							   extra=self.log_extra)
-				page.close()
-				raise e
-			except BaseException as e:
-				if isinstance(e, PlaywrightError):
-					if "crashed" in e.message:
-						logger.exception("Something crashed in Playwright trying to scrape the data.", extra=self.log_extra)
+					raise e
+				except BaseException as e:
+					if isinstance(e, PlaywrightError):
+						if "crashed" in e.message:
+							logger.exception("Something crashed in Playwright trying to scrape the data.", extra=self.log_extra)
+							raise e
+
+					logger.exception(f"An error occurred trying to scrape website data. Try: {tries:,} of {max_tries:,}.",
+									 extra=self.log_extra)
+					retry_delay = limiter.retry_delay(tries, base_delay=delay)
+					tries += 1
+					if tries == max_tries:
 						raise e
+					sleep(retry_delay)
+					limiter.reload(page)
+		finally:
+			if checked_out:
+				pool.release(page)
+			if owned_pool is not None:
+				owned_pool.close()
+
+		if profile is not None:
+			if not self._load_unchanged(extracted=profile, **kwargs):
+				self._process_extracted(profile, get_player_name=get_player_name, **kwargs)
+		elif not self._load_unchanged(html=content, **kwargs):
+			self._process_html(content, get_player_name=get_player_name, **kwargs)
+		self._store_in_cache(**kwargs)
+		return self
+
+	def _request_data(self, get_player_name=False, **kwargs) -> "User":
+		"""
+		Downloads the user's RLStats page over plain HTTP, without a browser, and processes it.
 
-				logger.exception(f"An error occurred trying to scrape website data. Try: {tries:,} of {max_tries:,}.",
+		:keyword client: The RequestClient to download the page with. The shared default client is used if none is given.
+		:return: This User object, for chaining
+		:raises rlpy.UserScrapeError: If the page does not exist or could not be scraped.
+		"""
+		from time import sleep
+		from ..request_api import get_default_client
+
+		logger = kwargs.get("logger", getLogger(__name__))
+		max_tries = kwargs.get("max_tries", 5)
+		delay = kwargs.get("delay_seconds", None)
+		limiter = kwargs.get("rate_limiter", None) or DEFAULT_RATE_LIMITER
+		client = kwargs.get("client", None) or get_default_client()
+
+		for tries in range(1, max_tries + 1):
+			try:
+				content = client.get(self.link, rate_limiter=kwargs.get("rate_limiter", None))
+				logger.debug(f"Downloaded RLStats webpage for {self.player_name}: {self.link}.", extra=self.log_extra)
+				break
+			except (UserScrapeError, KeyboardInterrupt) as e:
+				raise e
+			except Exception as e:
+				logger.exception(f"An error occurred trying to download website data. Try: {tries:,} of {max_tries:,}.",
 								 extra=self.log_extra)
-				tries += 1
 				if tries == max_tries:
 					raise e
-				sleep(delay)
-				page.reload()
-
-		if created_playwright:
-			if not page.is_closed():
-				page.close()
-			browser.close()
-			p.stop()
+				sleep(limiter.retry_delay(tries, base_delay=delay))
 
-		return self._process_data(soup, get_player_name=get_player_name, **kwargs)
+		if self._load_unchanged(html=content, **kwargs):
+			return self
+		return self._process_html(content, get_player_name=get_player_name, **kwargs)
@@ -1,10 +1,9 @@
-from pytz import timezone
+__ALL__ = ["get_timezone", "storage_state_expired", "save_storage_state"]
 
 
-__ALL__ = ["get_timezone"]
+def get_timezone(abbreviation:str) -> "pytz.BaseTzInfo | None":
+	from pytz import timezone
 
-
-def get_timezone(abbreviation:str) -> timezone:
 	return {
 		"CST": timezone("US/Central"),
 		"CDT": timezone("US/Central"),
@@ -15,3 +14,43 @@ def get_timezone(abbreviation:str) -> timezone:
 		"MST": timezone("US/Mountain"),
 		"MDT": timezone("US/Mountain"),
 	}.get(abbreviation, None)
+
+
+def storage_state_expired(path:str, domain:str="leaguespot.gg") -> bool:
+	"""
+	Checks a saved Playwright storage state without opening a browser.
+
+	:param str path: The JSON file written by `save_storage_state`.
+	:param str domain: Only cookies for this domain, or its subdomains, are checked.
+	:return: True if the file is missing or unreadable, has no cookies for the domain, or any of them has expired.
+	"""
+	from json import load
+	from time import time
+
+	try:
+		with open(path, encoding="utf-8") as f:
+			cookies = [cookie for cookie in load(f).get("cookies", []) if cookie.get("domain", "").lstrip(".").endswith(domain)]
+	except (OSError, ValueError, AttributeError):
+		return True
+	now = time()
+	return not cookies or any(0 < cookie.get("expires", -1) <= now for cookie in cookies)
+
+
+def save_storage_state(state:dict, path:str):
+	"""
+	Writes a Playwright storage state to disk. The file is replaced in one step, so contexts loading it at the same time
+	never read a half written file.
+
+	:param dict state: The result of `BrowserContext.storage_state()`.
+	:param str path:
+	"""
+	from json import dump
+	from os import makedirs, replace
+	from os.path import abspath, dirname
+	from tempfile import NamedTemporaryFile
+
+	directory = dirname(abspath(path))
+	makedirs(directory, exist_ok=True)
+	with NamedTemporaryFile("w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False) as f:
+		dump(state, f)
+	replace(f.name, path)
@@ -1,16 +1,71 @@
 from ._enum_classes import *
 from ._exceptions import *
+from .cache import UserCache
+from .parsers import Node, SoupNode, get_parser, slice_html
 from .user_playlist import UserPlaylist
 from logging import getLogger
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
-from playwright.sync_api import Page as SyncPage
-from playwright.async_api import Page as ASyncPage
+from re import compile, I
+from time import time
+
+
+UPDATED_REGEX = compile(r"([^\n]*?)\s*Updated\s+(\d+|an?|one)\s+(second|minute|hour|day|week|month|year)s?\s+ago", I)
+UPDATED_RESOLUTION = 60
+_UPDATED_UNITS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400, "week": 604800, "month": 2592000, "year": 31536000}
+
+
+def parse_updated(text:str, now:float=None) -> float | None:
+	"""
+	Reads when RLStats last updated a profile from the "Updated N minutes ago" text in its user info section.
+
+	:param str text: The text, or HTML, of the user info section.
+	:param float now: The UNIX timestamp the page was loaded at. Defaults to now.
+	:return: The UNIX timestamp of the update, or None if the text does not say.
+	"""
+	match = UPDATED_REGEX.search(text)
+	if match is None:
+		return None
+	amount = match.group(2).lower()
+	amount = int(amount) if amount.isdigit() else 1
+	return (time() if now is None else now) - amount * _UPDATED_UNITS[match.group(3).lower()]
 
 
 class BaseUser(ABC):
 	SIMPLE_USER_REGEX = r"[a-zA-Z\d_.\[\]$^&*()<>%+]+"
 	COMPLEX_USER_REGEX = r"[a-zA-Z\d_. \[\]$^&*()<>%+]+"
+	RLSTATS_URL = "https://rlstats.net"
+	CACHE = UserCache()
+	PROFILE_REGIONS = (("div.error-message", False), ("section#userinfo", True), ("div.block-stats", True),
+					   ("div.fullwidth", True), ("div.block-skills", True))
+	PROFILE_SCRIPT = """() => {
+		const text = (element) => element.textContent;
+		const errors = Array.from(document.querySelectorAll("div.error-message"));
+		const userinfo = document.querySelector("section#userinfo");
+		const profile = {error: errors.length ? errors.map(text).join("") : null, userinfo: userinfo === null ? null : text(userinfo)};
+		if (profile.error !== null) {
+			return profile;
+		}
+
+		const sections = {};
+		for (const [name, selector] of [["stats", "div.block-stats"], ["reward_level", "div.fullwidth"], ["skills", "div.block-skills"]]) {
+			sections[name] = document.querySelector(selector);
+			if (sections[name] === null) {
+				return {...profile, missing: selector};
+			}
+		}
+		const rewardLevel = sections.reward_level.querySelector("h2");
+		if (rewardLevel === null) {
+			return {...profile, missing: "h2"};
+		}
+
+		const tables = Array.from(sections.skills.querySelectorAll("table"));
+		profile.stats = Array.from(sections.stats.querySelectorAll("td"), text);
+		profile.reward_level = text(rewardLevel);
+		profile.playlist_tables = tables.slice(0, 2).map((table) => Array.from(table.querySelectorAll("tr"),
+			(row, i) => Array.from(row.querySelectorAll(i === 0 ? "th" : "td"), text)));
+		profile.casual_rows = tables.length > 2 ? Array.from(tables[2].querySelectorAll("tr"), text) : [];
+		return profile;
+	}"""
 
 	def __init__(self, user_name:str, console:Console, **kwargs):
 		self.username = user_name
@@ -25,6 +80,7 @@ class BaseUser(ABC):
 		self.mvps = 0
 		self.trn_score = 0
 		self.reward_level = ""
+		self.updated_at = None
 		self._playlists = {i:None for i in Playlist.PLAYLISTS}
 
 	def __getitem__(self, item):
@@ -45,7 +101,7 @@ class BaseUser(ABC):
 		return self.player_name == other.player_name and self.console == other.console
 
 	@abstractmethod
-	def get_data(self, page: SyncPage | ASyncPage = None, get_player_name=False, wait_for_update=True,
+	def get_data(self, page:"playwright.sync_api.Page | playwright.async_api.Page" = None, get_player_name=False, wait_for_update=True,
 									close_page_on_finish=False, **kwargs) -> "BaseUser":
 		"""
 
@@ -54,33 +110,123 @@ class BaseUser(ABC):
 		:param bool wait_for_update: If the program should wait for the web page to reload or if the data should be taken immediately.
 		:param bool close_page_on_finish: If the page object should be closed as soon as it is no longer required,
 		regardless of if it was passed as an argument or created in the method.
+		:keyword pool: A BrowserPool to check a page out of when no page is given. Without one, a browser is launched
+		and closed just for this call.
+		:keyword profile: The rlpy.ScrapeProfile, or its name such as "fast", used for a browser launched just for this
+		call. Pools take their own profile.
+		:keyword bool use_request_api: If the page should be downloaded over plain HTTP instead of being loaded in a
+		browser. Requires httpx.
+		:keyword client: The RequestClient used when `use_request_api` is set.
+		:keyword cache: A cache, such as rlpy.ProfileCache, that is checked before scraping and updated afterwards.
+		Defaults to the in-process `BaseUser.CACHE`. Pass None to skip caching.
+		:keyword float cache_ttl: The maximum age, in seconds, of cached data that can be used. Defaults to the cache's TTL.
+		:keyword float freshness_window: The number of seconds after RLStats updates a profile that it will not update it
+		again. Cached data older than the TTL is still used, without loading the page, while RLStats' copy is this young.
+		Cached data is also used, instead of parsing a newly loaded page, whenever the page shows the same update.
+		:keyword bool force_refresh: If the user should be scraped even when the cache has fresh data.
+		:keyword parser: The rlpy.ParserBackend, or its name, used to parse the page. Defaults to the fastest installed.
+		:keyword bool partial_parse: If only the sections of the page that are scraped should be parsed, instead of the
+		whole page.
+		:keyword parse_executor: For the async API, a `concurrent.futures.Executor`, such as a ProcessPoolExecutor, that
+		the page is parsed in so parsing does not block the event loop.
+		:keyword bool extract_in_browser: If the data should be pulled out of the page by a script running in the browser,
+		so only that data is sent back instead of the whole page. Ignored with `use_request_api`.
+		:keyword bool coalesce: For the async API, if a call should share the result of a scrape of the same user that
+		is already in flight instead of loading the page again. Defaults to True.
+		:keyword rate_limiter: The rlpy.RateLimiter that paces requests to RLStats and backs off when throttled. With
+		`use_request_api`, it is used instead of the client's own limiter. Defaults to the limiter shared by all of rlpy,
+		or the client's limiter.
+		:keyword float delay_seconds: The delay before the first retry of a failed scrape, doubled for each retry after it.
+		Defaults to the rate limiter's.
 		:return: This User object, for chaining
 		:raises UserScrapeError: If an error occurs during scraping information for the player.
 		"""
 		if self.console == Console.SWITCH:
 			raise UserScrapeError(f"RLStats cannot support some features, including stats for Switch players.")
 
-	def _process_data(self, soup:BeautifulSoup, get_player_name=False, **kwargs) -> "BaseUser":
+	def _process_html(self, html:str, get_player_name=False, **kwargs) -> "BaseUser":
 		"""
+		Parses a downloaded RLStats page and processes it.
 
-		:param soup:
+		:param str html: The HTML of the user's RLStats page.
 		:param get_player_name:
+		:keyword parser: The rlpy.ParserBackend, or its name, used to parse the page. Defaults to the fastest installed.
+		:keyword bool partial_parse: If only the sections of the page listed in `PROFILE_REGIONS` should be parsed. The
+		whole page is parsed when one of the sections that is always needed is missing.
 		:return:
 		:raises rlpy.UserScrapeError: If there is an error when the scrape occurs.
 		"""
-		from re import compile
+		if kwargs.get("partial_parse", False):
+			html = slice_html(html, self.PROFILE_REGIONS) or html
+		return self._process_data(get_parser(kwargs.get("parser", None)).parse(html), get_player_name=get_player_name, **kwargs)
+
+	def _process_data(self, soup:"BeautifulSoup | Node", get_player_name=False, **kwargs) -> "BaseUser":
+		"""
+
+		:param soup: The parsed RLStats page, either as a BeautifulSoup object or from a rlpy.ParserBackend.
+		:param get_player_name:
+		:return:
+		:raises rlpy.UserScrapeError: If there is an error when the scrape occurs.
+		"""
+		if not isinstance(soup, Node):
+			soup = SoupNode(soup)
+		return self._process_profile(self._extract_profile(soup), get_player_name=get_player_name, **kwargs)
+
+	def _extract_profile(self, document:Node) -> dict[str, "Any"]:
+		"""
+		Pulls the text that is needed out of a parsed RLStats page, so it can be processed the same way no matter how the
+		page was parsed.
+
+		:param document:
+		:return: The text of the error message, user info section, lifetime stat cells, reward level, the cells of the
+		two ranked playlist tables (header cells for the first row, data cells for the rest), and the rows of the casual table.
+		:raises rlpy.UserScrapeError: If a section of the page is missing.
+		"""
+		extracted = extract_profile(document)
+		self._check_missing(extracted)
+		return extracted
+
+	def _check_missing(self, extracted:dict[str, "Any"]):
+		missing = extracted.pop("missing", None)
+		if missing is not None and extracted["error"] is None:
+			if missing == "h2":
+				raise UserScrapeError(f"The website: {self.link} did not have a reward level.")
+			raise UserScrapeError(f"The website: {self.link} did not have a `{missing}` section.")
+
+	def _process_extracted(self, extracted:dict[str, "Any"], get_player_name=False, **kwargs) -> "BaseUser":
+		"""
+		Processes the data returned by running `PROFILE_SCRIPT` on the user's RLStats page in the browser, or by
+		`parse_profile`.
+
+		:param extracted:
+		:param get_player_name:
+		:return:
+		:raises rlpy.UserScrapeError: If a section of the page is missing, or if there is an error when the scrape occurs.
+		"""
+		self._check_missing(extracted)
+		return self._process_profile(extracted, get_player_name=get_player_name, **kwargs)
+
+	def _process_profile(self, extracted:dict[str, "Any"], get_player_name=False, **kwargs) -> "BaseUser":
+		"""
 
+		:param extracted: The text pulled out of an RLStats page by `_extract_profile`.
+		:param get_player_name:
+		:return:
+		:raises rlpy.UserScrapeError: If there is an error when the scrape occurs.
+		"""
 		logger = kwargs.get("logger", getLogger(__name__))
 		logger.info("Processing User data retrieved from web.", extra=self.log_extra)
-		error_message = soup.select("div.error-message")
-		if len(error_message) != 0:
-			raise UserScrapeError(f"The website: {self.link} had an error and could not be loaded. Error message: \"{error_message}\".")
+		if extracted["error"] is not None:
+			raise UserScrapeError(f"The website: {self.link} had an error and could not be loaded. Error message: \"{extracted['error'].strip()}\".")
 
+		userinfo = extracted["userinfo"] or ""
+		self.updated_at = parse_updated(userinfo)
 		if get_player_name:
-			try:
-				match = search(r"\n*([\w -]+) Updated (\d+) minutes ago[Fancy|Compact] Version", soup.select_one("section#userinfo").text)
-			except AttributeError:
-				logger.exception("Could not find player name in website.", extra=self.log_extra)
+			match = UPDATED_REGEX.search(userinfo)
+			if match is None or not match.group(1).strip():
+				logger.warning("Could not find player name in website.", extra=self.log_extra)
+			else:
+				self.player_name = match.group(1).strip()
 
 		# region Collect Lifetime Stats
 		lifetime_stat_conversion = {
@@ -91,26 +237,24 @@ class BaseUser(ABC):
 			"Saves": "saves",
 			"MVPs": "mvps",
 		}
-		lifetime_stats = soup.select_one("div.block-stats").select("td")
 		stat_regex = compile(r"([\d,]+)\s(\w+)")
-		for stat in lifetime_stats:
-			match = stat_regex.search(stat.text)
+		for stat in extracted["stats"]:
+			match = stat_regex.search(stat)
 			if match is None:
-				logger.error(f"Could not match regex for {stat.text}.", extra=self.log_extra)
+				logger.error(f"Could not match regex for {stat}.", extra=self.log_extra)
 				continue
 
 			value = int(match.group(1).replace(",", "_"))
 			name = match.group(2)
 			setattr(self, lifetime_stat_conversion[name], value)
 
-		del lifetime_stats, lifetime_stat_conversion
+		del lifetime_stat_conversion
 		logger.debug("Lifetime stats collected.",
 					 extra=self.log_extra)
 		# endregion
 
 		# region Collect Reward Level
-		reward_level = soup.select_one("div.fullwidth", text=compile(r"([\w ]+)\s*\n?\s*Season Reward Level"))
-		reward_level = reward_level.find("h2").text.strip()
+		reward_level = extracted["reward_level"].strip()
 		if reward_level == "Unranked":
 			reward_level = None
 		self.reward_level = reward_level
@@ -118,40 +262,33 @@ class BaseUser(ABC):
 		# endregion
 
 		# region Collect Playlist Data
-		region = soup.select_one("div.block-skills")
-		tables = region.select("table")
 		match_regex = compile(r"Matches Played:\s([\d,]+)")
 		streak_regex = compile(r"(Win|Loss) Streak:\s([\d,]+)")
 		mmr_regex = compile(r"(~\d+)? ?([\d,]+) ?(~\d+)?")
 		casual_regex = compile(r"Rating ([\d,]+)")
 		playlists = []
-		for table_num, table in enumerate(tables):
-			if table_num == 2:
-				for row in table.select("tr"):
-					match = casual_regex.search(row.text)
-					if match is None:
-						continue
-					playlist = UserPlaylist.from_text("Casual", "Unranked", "Division I", int(match.group(1).replace(',', '_')), None, None)
-					self._playlists[playlist.playlist.name] = playlist
-					break
-				break
-
+		for table_num, table in enumerate(extracted["playlist_tables"]):
 			cells = [[], [], [], []]
-			for i, row in enumerate(table.select("tr")):
+			for i, values in enumerate(table):
 				if i == 4:
 					continue
-				elif i == 0:
-					values = row.find_all("th")
-				else:
-					values = row.find_all("td")
 				if len(values) != 4:
 					logger.error(f"There are not the correct amount of items in the user's playlist tables. Table: {table_num}. Row: {i}. Cells: {len(values)}",
 								 extra=self.log_extra)
 
 				for lst, value in zip(cells, values):
-					lst.append(value.text)
+					lst.append(value)
 			playlists.extend(cells)
 
+		if len(extracted["playlist_tables"]) == 2:
+			for row in extracted["casual_rows"]:
+				match = casual_regex.search(row)
+				if match is None:
+					continue
+				playlist = UserPlaylist.from_text("Casual", "Unranked", "Division I", int(match.group(1).replace(',', '_')), None, None)
+				self._playlists[playlist.playlist.name] = playlist
+				break
+
 		for lst in playlists:
 			playlist, rank, division, mmr, matches_played, streak = lst
 
@@ -215,6 +352,105 @@ class BaseUser(ABC):
 					return _playlist
 		raise PlaylistNotFoundError(f"Could not find playlist: {playlist} for RL user {self.username}.", playlist_name=playlist.name if isinstance(playlist, Playlist) else playlist)
 
+	def to_dict(self) -> dict[str, "Any"]:
+		"""
+		A JSON friendly snapshot of the scraped data for this user, which can be loaded back with `from_dict`.
+		:return:
+		"""
+		return {
+			"username": self.username,
+			"console": self.console.value,
+			"player_name": self._player_name,
+			"wins": self.wins,
+			"goals": self.goals,
+			"shots": self.shots,
+			"assists": self.assists,
+			"saves": self.saves,
+			"mvps": self.mvps,
+			"trn_score": self.trn_score,
+			"reward_level": self.reward_level,
+			"updated_at": self.updated_at,
+			"playlists": {name: None if playlist is None else playlist.to_dict() for name, playlist in self._playlists.items()},
+		}
+
+	@classmethod
+	def from_dict(cls, data:dict[str, "Any"], **kwargs):
+		"""
+		Creates a user from the output of `to_dict` without scraping anything.
+
+		:param dict data:
+		:return:
+		"""
+		return cls(data["username"], data["console"], **kwargs)._load_dict(data)
+
+	def _load_dict(self, data:dict[str, "Any"]) -> "BaseUser":
+		if data.get("player_name", None) is not None:
+			self.player_name = data["player_name"]
+		for attribute in ("wins", "goals", "shots", "assists", "saves", "mvps", "trn_score", "reward_level"):
+			setattr(self, attribute, data[attribute])
+		self.updated_at = data.get("updated_at", None)
+		for name, playlist in data["playlists"].items():
+			self._playlists[name] = None if playlist is None else UserPlaylist.from_dict(playlist)
+		return self
+
+	def _load_from_cache(self, **kwargs) -> bool:
+		"""
+		Fills this user from the cache given to `get_data`, if the cache holds data young enough to use.
+
+		:return: If the user was loaded from the cache.
+		"""
+		cache = kwargs.get("cache", self.CACHE)
+		if cache is None or kwargs.get("force_refresh", False):
+			return False
+		data = cache.get(self.console, self.username, max_age=kwargs.get("cache_ttl", None))
+		if data is None:
+			freshness_window = kwargs.get("freshness_window", None)
+			data = None if freshness_window is None else self._cached_snapshot(**kwargs)
+			if data is None or data.get("updated_at", None) is None or time() - data["updated_at"] >= freshness_window:
+				return False
+		kwargs.get("logger", getLogger(__name__)).debug("Loaded user data from the cache.", extra=self.log_extra)
+		self._load_dict(data)
+		return True
+
+	def _cached_snapshot(self, **kwargs) -> dict[str, "Any"] | None:
+		"""The last data cached for this user, no matter how old it is."""
+		cache = kwargs.get("cache", self.CACHE)
+		if cache is None:
+			return None
+		if hasattr(cache, "peek"):
+			return cache.peek(self.console, self.username)
+		return cache.get(self.console, self.username, max_age=float("inf"))
+
+	def _load_unchanged(self, html:str=None, extracted:dict[str, "Any"]=None, **kwargs) -> bool:
+		"""
+		Fills this user from the cached snapshot instead of processing a freshly loaded page, if the page shows that
+		RLStats has not updated the profile since the snapshot was taken.
+
+		:param str html: The HTML of the user's RLStats page.
+		:param dict extracted: The data pulled out of the page in the browser, if it was used instead of the HTML.
+		:return: If the user was loaded from the snapshot.
+		"""
+		if kwargs.get("force_refresh", False):
+			return False
+		snapshot = self._cached_snapshot(**kwargs)
+		if snapshot is None or snapshot.get("updated_at", None) is None:
+			return False
+		if extracted is not None:
+			userinfo = extracted.get("userinfo", None) if extracted.get("error", None) is None else None
+		else:
+			userinfo = slice_html(html, (("section#userinfo", True),))
+		updated_at = parse_updated(userinfo or "")
+		if updated_at is None or abs(updated_at - snapshot["updated_at"]) >= UPDATED_RESOLUTION:
+			return False
+		kwargs.get("logger", getLogger(__name__)).debug("RLStats has not updated the user since they were cached.", extra=self.log_extra)
+		self._load_dict(snapshot)
+		return True
+
+	def _store_in_cache(self, **kwargs):
+		cache = kwargs.get("cache", self.CACHE)
+		if cache is not None:
+			cache.set(self.console, self.username, self.to_dict())
+
 	# region User Properties
 	@property
 	def log_extra(self) -> dict[str, "Any"]:
@@ -237,6 +473,17 @@ class BaseUser(ABC):
 	def username(self):
 		raise ValueError("Cannot delete username from User object")
 
+	@property
+	def updated_at(self) -> float | None:
+		"""When RLStats last updated the user's data, as a UNIX timestamp accurate to about a minute. None if unknown."""
+		return self._updated_at
+
+	@updated_at.setter
+	def updated_at(self, updated_at:float | None):
+		if not isinstance(updated_at, float | None):
+			updated_at = float(updated_at)
+		self._updated_at = updated_at
+
 	@property
 	def player_name(self) -> str:
 		"""The user's chosen name, nickname, or screen name. May be changed at will without changing data sources."""
@@ -263,7 +510,7 @@ class BaseUser(ABC):
 	@property
 	def link(self) -> str:
 		"""The link for the user's RLStats page."""
-		return f"https://rlstats.net/profile/{self.console.value}/{self.link_name}"
+		return f"{self.RLSTATS_URL}/profile/{self.console.value}/{self.link_name}"
 
 	@link.setter
 	def link(self, value):
@@ -398,3 +645,101 @@ class BaseUser(ABC):
 			from warnings import warn
 			warn("RLStats does not have the ability to scrape data for Switch users.")
 		return cls(username, console, **kwargs)
+
+
+def extract_profile(document:Node) -> dict[str, "Any"]:
+	"""
+	Pulls the text that is needed out of a parsed RLStats page. This matches what `BaseUser.PROFILE_SCRIPT` returns in
+	the browser, so a missing section is named under the "missing" key instead of raising an error.
+
+	:param document:
+	:return:
+	"""
+	error_message = document.select("div.error-message")
+	userinfo = document.select_one("section#userinfo")
+	profile = {
+		"error": "".join(error.text for error in error_message) if error_message else None,
+		"userinfo": None if userinfo is None else userinfo.text,
+	}
+	if profile["error"] is not None:
+		return profile
+
+	sections = {}
+	for name, selector in (("stats", "div.block-stats"), ("reward_level", "div.fullwidth"), ("skills", "div.block-skills")):
+		sections[name] = document.select_one(selector)
+		if sections[name] is None:
+			return {**profile, "missing": selector}
+
+	reward_level = sections["reward_level"].select_one("h2")
+	if reward_level is None:
+		return {**profile, "missing": "h2"}
+
+	tables = sections["skills"].select("table")
+	profile.update({
+		"stats": [stat.text for stat in sections["stats"].select("td")],
+		"reward_level": reward_level.text,
+		"playlist_tables": [[[cell.text for cell in row.select("th" if i == 0 else "td")] for i, row in enumerate(table.select("tr"))]
+							for table in tables[:2]],
+		"casual_rows": [row.text for row in tables[2].select("tr")] if len(tables) > 2 else [],
+	})
+	return profile
+
+
+def parse_profile(html:str, parser:"str | ParserBackend | None" = None, regions:"Iterable[tuple[str, bool]]" = None) -> dict[str, "Any"]:
+	"""
+	Parses an RLStats page into the small dictionary of text that `BaseUser._process_extracted` reads. Both the
+	arguments and the result can be pickled, so this can be run in a `concurrent.futures.ProcessPoolExecutor`.
+
+	:param str html: The HTML of a user's RLStats page.
+	:param parser: The rlpy.ParserBackend, or its name, used to parse the page. Defaults to the fastest installed.
+	:param regions: If given, only these regions of the page are parsed, like `BaseUser.PROFILE_REGIONS`.
+	:return:
+	"""
+	if regions is not None:
+		html = slice_html(html, regions) or html
+	return extract_profile(get_parser(parser).parse(html))
+
+
+class ScrapeResult(object):
+	"""The outcome of scraping one user as part of a batch: the user, the error that stopped it (if any), and how long it took."""
+	def __init__(self, user:BaseUser, error:BaseException | None = None, elapsed:float = 0.0):
+		self.user = user
+		self.error = error
+		self.elapsed = elapsed
+
+	def __repr__(self) -> str:
+		return f"rlpy.ScrapeResult(user={self.user!r}, error={self.error!r}, elapsed={self.elapsed:.3f})"
+
+	def __bool__(self) -> bool:
+		return self.ok
+
+	@property
+	def ok(self) -> bool:
+		"""If the user was scraped without an error."""
+		return self.error is None
+
+	def to_dict(self) -> dict[str, "Any"]:
+		"""
+		A JSON friendly record of the result. The scraped data is under "data", which is None if the scrape failed.
+		:return:
+		"""
+		return {
+			"username": self.user.username,
+			"console": self.user.console.value,
+			"ok": self.ok,
+			"elapsed": round(self.elapsed, 3),
+			"error": None if self.error is None else str(self.error),
+			"error_type": None if self.error is None else type(self.error).__name__,
+			"data": self.user.to_dict() if self.ok else None,
+		}
+
+	@property
+	def elapsed(self) -> float:
+		"""The number of seconds spent scraping the user."""
+		return self._elapsed
+
+	@elapsed.setter
+	def elapsed(self, elapsed:float):
+		if not isinstance(elapsed, float):
+			elapsed = float(elapsed)
+		self._elapsed = elapsed
@@ -1,14 +1,29 @@
-from ._enum_classes import Playlist, Division, Rank
+from ._enum_classes import Playlist, Division, Rank, SEASONS
 from ._exceptions import RankNotFoundError, PlaylistNotFoundError
+from re import compile
 
 
 __ALL__ = ["UserPlaylist"]
 
 
+DIVISION_REGEX = compile(r"Division ([IV1-4]+)")
+_ROMAN_NUMERALS = {"I": 1, "II": 2, "III": 3, "IV": 4}
+
+
 def format_none(value) -> str | None:
 	return None if value is None else f"{value:,}"
 
 
+def roman_to_arabic(roman:str) -> int:
+	roman = roman.strip().upper()
+	if roman.isnumeric():
+		return int(roman)
+	number = _ROMAN_NUMERALS.get(roman, None)
+	if number is None:
+		raise ValueError(f"{roman} is not a numeral that can be matched.")
+	return number
+
+
 class UserPlaylist(object):
 	def __init__(self, playlist:Playlist, rank:Rank, division:Division, mmr:int, streak:int, matches_played:int):
 		self.playlist = playlist
@@ -103,48 +118,26 @@ class UserPlaylist(object):
 		return f"Playlist({self.playlist.name}, Rank={self.rank.name}, Division={self.division.name}, MMR={format_none(self.mmr)}, Matches Played={format_none(self.matches_played)}, Streak={format_none(self.streak)})"
 
 	@classmethod
-	def from_text(cls, playlist:str, rank:str, division:str, mmr:str | int, streak:str | int | None, matches_played: int | None):
-		from re import search
+	def from_text(cls, playlist:str, rank:str, division:str, mmr:str | int, streak:str | int | None, matches_played: int | None,
+				  season:int | str | None = None):
+		"""
+		Builds a UserPlaylist from the text shown on an RLStats profile.
+
+		:param season: The season, in `rlpy.SEASONS`, whose ranks are used. Defaults to the current season.
+		:raises rlpy.PlaylistNotFoundError: If the playlist is not in the season's data.
+		:raises rlpy.SeasonNotFoundError: If there is no data for the season.
+		"""
 		# region Parse Playlist object
-		playlist = {
-			"Casual": "Un-Ranked",
-			"1v1 Solo Duel": "Ranked Duel 1v1",
-			"2v2 Doubles": "Ranked Doubles 2v2",
-			"3v3 Standard": "Ranked Standard 3v3",
-			"3v3 Tournament": "Tournament Matches",
-			"2v2 Hoops": "Hoops",
-			"3v3 Rumble": "Rumble",
-			"3v3 Dropshot": "Dropshot",
-			"3v3 Snow Day": "Snowday"
-		}.get(playlist, playlist)
-		for name, _playlist in Playlist.PLAYLISTS.items():
-			if playlist == name:
-				playlist = _playlist
-				break
-		else:
-			raise PlaylistNotFoundError(f"Playlist name: {playlist} could not be found in the given playlists.", playlist_name=playlist)
+		name = Playlist.PLAYLIST_ALIASES.get(playlist, playlist)
+		playlist = SEASONS[season].get(name, None)
+		if playlist is None:
+			raise PlaylistNotFoundError(f"Playlist name: {name} could not be found in the given playlists.", playlist_name=name)
 		# endregion
 
 		if isinstance(mmr, str):
 			mmr = int(mmr.removeprefix("#").replace(",", "_"))
 
-		def roman_to_arabic(roman:str) -> int:
-			roman = roman.strip().upper()
-			if roman.isnumeric():
-				return int(roman)
-			match roman:
-				case "I":
-					return 1
-				case "II":
-					return 2
-				case "III":
-					return 3
-				case "IV":
-					return 4
-				case _:
-					raise ValueError(f"{roman} is not a numeral that can be matched.")
-
-		match = search(r"Division ([IV1-4]+)", division)
+		match = DIVISION_REGEX.search(division)
 		if match is None:
 			raise ValueError(f"Could not get the data from the full rank: {division}")
 		rank = playlist.get_rank(rank)
@@ -156,5 +149,40 @@ class UserPlaylist(object):
 			except ValueError:
 				streak = None
 
-		matches_played = None if matches_played == "N/A" or matches_played is None else int(matches_played)
+		if isinstance(matches_played, str):
+			matches_played = None if matches_played == "N/A" else int(matches_played.replace(",", "_"))
 		return cls(playlist, rank, division, mmr, streak, matches_played)
+
+	def to_dict(self) -> dict[str, str | int | None]:
+		"""A JSON friendly representation of this playlist, which can be turned back into a UserPlaylist with `from_dict`."""
+		return {
+			"playlist": self.playlist.name,
+			"rank": self.rank.name,
+			"division": self.division.name,
+			"mmr": self.mmr,
+			"streak": self.streak,
+			"matches_played": self.matches_played,
+		}
+
+	@classmethod
+	def from_dict(cls, data:dict[str, str | int | None], season:int | str | None = None):
+		"""
+		Rebuilds a UserPlaylist from the output of `to_dict`.
+
+		:param dict data:
+		:param season: The season, in `rlpy.SEASONS`, the data was scraped in. Defaults to the current season.
+		:return:
+		:raises rlpy.PlaylistNotFoundError: If the playlist is not in the season's data.
+		:raises rlpy.RankNotFoundError: If the rank or division is not in the season's data.
+		:raises rlpy.SeasonNotFoundError: If there is no data for the season.
+		"""
+		playlist = SEASONS[season].get(data["playlist"], None)
+		if playlist is None:
+			raise PlaylistNotFoundError(f"Playlist name: {data['playlist']} could not be found in the given playlists.", playlist_name=data["playlist"])
+		rank = playlist.get_rank(data["rank"])
+		for division in (rank.division_1, rank.division_2, rank.division_3, rank.division_4):
+			if division is not None and division.name == data["division"]:
+				break
+		else:
+			raise RankNotFoundError(f"The division \"{data['division']}\" could not be found in {rank.name}.")
+		return cls(playlist, rank, division, data["mmr"], data["streak"], data["matches_played"])
@@ -26,6 +26,11 @@ setup(
 	install_requires=[
 		"beautifulsoup4", "playwright >= 1.3.0", "tabulate", "pytz"
 	],
+	extras_require={
+		"http": ["httpx"],
+		"numpy": ["numpy"],
+		"parsers": ["lxml", "selectolax"]
+	},
 	entry_points={
 		"console_scripts": [f"{project_name}={project_name}.__main__:main"]
 	},
@@ -0,0 +1,23 @@
+from os import listdir
+from os.path import dirname, join, realpath, splitext
+from pytest import fixture
+
+
+FIXTURE_DIR = join(dirname(dirname(realpath(__file__))), "benchmarks", "fixtures")
+FIXTURES = sorted(splitext(name)[0] for name in listdir(FIXTURE_DIR) if name.endswith(".html"))
+
+
+def load_fixture(name:str) -> str:
+	"""A saved RLStats page from `benchmarks/fixtures`."""
+	with open(join(FIXTURE_DIR, f"{name}.html"), encoding="utf-8") as f:
+		return f.read()
+
+
+@fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+	"""Gives every test its own season cache directory and an empty in-process user cache."""
+	from rlpy import UserCache
+	from rlpy.user import BaseUser
+
+	monkeypatch.setenv("RLPY_CACHE_DIR", str(tmp_path / "season_cache"))
+	monkeypatch.setattr(BaseUser, "CACHE", UserCache())
@@ -0,0 +1,36 @@
+from asyncio import run
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pytest import fixture, mark, raises
+from rlpy import Console, UserScrapeError
+from rlpy.async_api.user import User
+from .conftest import FIXTURES, load_fixture
+
+
+@fixture(scope="module")
+def process_pool():
+	with ProcessPoolExecutor(max_workers=2) as executor:
+		yield executor
+
+
+def processed(page:str, **kwargs) -> dict:
+	user = run(User("SomePlayer", Console.EPIC_GAMES)._process_html_async(load_fixture(page), **kwargs))
+	data = user.to_dict()
+	del data["updated_at"]
+	return data
+
+
+@mark.parametrize("page", [page for page in FIXTURES if page != "error"])
+@mark.parametrize("partial_parse", [False, True])
+def test_parsing_in_a_process_pool_matches_an_inline_parse(process_pool, page, partial_parse):
+	assert processed(page, parse_executor=process_pool, partial_parse=partial_parse) == processed(page)
+
+
+@mark.parametrize("page", [page for page in FIXTURES if page != "error"])
+def test_parsing_in_a_thread_pool_matches_an_inline_parse(page):
+	with ThreadPoolExecutor(max_workers=2) as executor:
+		assert processed(page, parse_executor=executor) == processed(page)
+
+
+def test_error_page_raises_from_a_process_pool(process_pool):
+	with raises(UserScrapeError):
+		processed("error", parse_executor=process_pool)
@@ -0,0 +1,96 @@
+from asyncio import run
+from itertools import count
+from pytest import mark, raises
+from rlpy import Console, RateLimiter, UserScrapeError
+from rlpy.async_api.batch import fetch_users, iter_users as iter_users_async
+from rlpy.sync_api.batch import iter_users
+from .conftest import load_fixture
+
+
+class _BatchClient(object):
+	"""Stands in for a request client. Users named "missing..." do not exist, and "broken..." fail unexpectedly."""
+	def __init__(self):
+		self.requested = []
+
+	def page(self, url:str) -> str:
+		self.requested.append(url)
+		username = url.rsplit("/", 1)[-1]
+		if username.startswith("missing"):
+			raise UserScrapeError(f"The requested URL was not found on this server: {url}.")
+		if username.startswith("broken"):
+			raise RuntimeError(f"Unexpected page layout at {url}")
+		return load_fixture("ranked")
+
+	def get(self, url:str, rate_limiter:RateLimiter=None) -> str:
+		return self.page(url)
+
+
+class _AsyncBatchClient(_BatchClient):
+	async def get(self, url:str, rate_limiter:RateLimiter=None) -> str:
+		return self.page(url)
+
+
+USERS = [("first", Console.EPIC_GAMES), ("missing", Console.STEAM), ("broken", Console.EPIC_GAMES),
+		 ("second", Console.XBOX)]
+
+
+def batch_options(client) -> dict:
+	return {"use_request_api": True, "client": client, "rate_limiter": RateLimiter(base_delay=0), "max_tries": 1,
+			"cache": None}
+
+
+def outcomes(results) -> dict[str, str | None]:
+	return {result.user.username: None if result.ok else type(result.error).__name__ for result in results}
+
+
+@mark.parametrize("concurrency", [1, 3])
+def test_iter_users_yields_failures_without_stopping(concurrency):
+	results = list(iter_users(USERS, concurrency=concurrency, **batch_options(_BatchClient())))
+	assert outcomes(results) == {"first": None, "missing": "UserScrapeError", "broken": "RuntimeError", "second": None}
+	assert next(result for result in results if result.ok).user.goals == 2345
+	assert all(result.elapsed >= 0 for result in results)
+
+
+def test_iter_users_takes_users_lazily():
+	taken = count()
+	users = ((f"player{next(taken)}", Console.EPIC_GAMES) for _ in range(1000))
+	results = iter_users(users, concurrency=2, **batch_options(_BatchClient()))
+	first = [next(results) for _ in range(3)]
+	results.close()
+	assert all(first)
+	assert next(taken) <= 6
+
+
+def test_iter_users_rejects_no_concurrency():
+	with raises(ValueError):
+		next(iter_users(USERS, concurrency=0))
+
+
+def test_fetch_users_keeps_the_order():
+	results = run(fetch_users(USERS, concurrency=2, **batch_options(_AsyncBatchClient())))
+	assert [result.user.username for result in results] == [username for username, console in USERS]
+	assert outcomes(results) == {"first": None, "missing": "UserScrapeError", "broken": "RuntimeError", "second": None}
+
+
+@mark.parametrize("concurrency", [1, 3])
+def test_async_iter_users_yields_failures_without_stopping(concurrency):
+	async def collect():
+		return [result async for result in iter_users_async(USERS, concurrency=concurrency,
+																**batch_options(_AsyncBatchClient()))]
+
+	assert outcomes(run(collect())) == {"first": None, "missing": "UserScrapeError", "broken": "RuntimeError",
+										"second": None}
+
+
+def test_async_iter_users_applies_backpressure():
+	taken = count()
+	users = ((f"player{next(taken)}", Console.EPIC_GAMES) for _ in range(1000))
+
+	async def take_three():
+		results = iter_users_async(users, concurrency=2, buffer=2, **batch_options(_AsyncBatchClient()))
+		first = [await results.__anext__() for _ in range(3)]
+		await results.aclose()
+		return first
+
+	assert all(run(take_three()))
+	assert next(taken) <= 7
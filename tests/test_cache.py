@@ -0,0 +1,81 @@
+from time import time
+from pytest import fixture, mark
+from rlpy import Console, ProfileCache, UserCache
+from rlpy.sync_api.user import User
+from .conftest import load_fixture
+
+
+PAGES = ("ranked", "unranked", "casual_only")
+
+
+@fixture(params=["profile_cache", "user_cache"])
+def cache(request):
+	if request.param == "profile_cache":
+		with ProfileCache(":memory:") as cache:
+			yield cache
+	else:
+		yield UserCache()
+
+
+def scraped_user(page:str) -> User:
+	return User("SomePlayer", Console.EPIC_GAMES)._process_html(load_fixture(page))
+
+
+@mark.parametrize("page", PAGES)
+def test_cache_round_trip(cache, page):
+	user = scraped_user(page)
+	user._store_in_cache(cache=cache)
+
+	cached = User("SomePlayer", Console.EPIC_GAMES)
+	assert cached._load_from_cache(cache=cache)
+	assert cached.to_dict() == user.to_dict()
+
+
+def test_cache_miss(cache):
+	assert not User("SomePlayer", Console.EPIC_GAMES)._load_from_cache(cache=cache)
+	scraped_user("ranked")._store_in_cache(cache=cache)
+	assert not User("SomePlayer", Console.STEAM)._load_from_cache(cache=cache)
+	assert not User("SomePlayer", Console.EPIC_GAMES)._load_from_cache(cache=cache, force_refresh=True)
+
+
+def test_expired_entries_are_not_loaded(cache):
+	user = scraped_user("ranked")
+	cache.set(user.console, user.username, user.to_dict(), fetched_at=0)
+	assert not User("SomePlayer", Console.EPIC_GAMES)._load_from_cache(cache=cache)
+
+
+def test_freshness_window_uses_entries_past_their_ttl(cache):
+	user = scraped_user("ranked")
+	now = time()
+	cache.set(user.console, user.username, {**user.to_dict(), "updated_at": now - 400}, fetched_at=now - max(cache.ttl, 300) - 1)
+
+	assert not User("SomePlayer", Console.EPIC_GAMES)._load_from_cache(cache=cache)
+	assert not User("SomePlayer", Console.EPIC_GAMES)._load_from_cache(cache=cache, freshness_window=300)
+	cached = User("SomePlayer", Console.EPIC_GAMES)
+	assert cached._load_from_cache(cache=cache, freshness_window=3600)
+	assert cached.wins == user.wins
+
+
+def test_max_age_overrides_the_ttl(cache):
+	user = scraped_user("ranked")
+	cache.set(user.console, user.username, user.to_dict(), fetched_at=time() - cache.ttl - 60)
+	assert cache.get(user.console, user.username) is None
+	assert cache.get(user.console, user.username, max_age=cache.ttl + 120) is not None
+	assert cache.get(user.console, user.username, max_age=30) is None
+
+
+def test_peek_returns_stale_entries(cache):
+	user = scraped_user("ranked")
+	assert cache.peek(user.console, user.username) is None
+	cache.set(user.console, user.username, user.to_dict(), fetched_at=0)
+	assert cache.peek(user.console, user.username)["fetched_at"] == 0
+
+
+def test_snapshot_lookups_are_not_counted():
+	cache = UserCache(ttl=60)
+	user = scraped_user("ranked")
+	cache.set(user.console, user.username, user.to_dict(), fetched_at=time() - 120)
+	fresh = User("SomePlayer", Console.EPIC_GAMES)
+	assert fresh._cached_snapshot(cache=cache) is not None
+	fresh._load_unchanged(html=load_fixture("ranked"), cache=cache)
+	assert cache.stats == {"hits": 0, "misses": 0, "evictions": 0, "entries": 1}
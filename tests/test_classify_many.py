@@ -0,0 +1,63 @@
+from pytest import importorskip, mark
+from rlpy import MMROutOfBoundError, Playlist, Unranked, UnrankedPlaylist
+
+np = importorskip("numpy")
+
+
+RANKED_PLAYLISTS = [name for name, playlist in Playlist.PLAYLISTS.items() if not isinstance(playlist, UnrankedPlaylist)]
+
+
+def classify(playlist:Playlist, mmr:float):
+	"""Classifies one MMR the way `Playlist.classify_many` documents, by asking every rank in order."""
+	ranks = [rank for name, rank in playlist.ranks.items() if name != "Unranked" and not isinstance(rank, Unranked)]
+	for rank in ranks:
+		for division in (rank.division_1, rank.division_2, rank.division_3, rank.division_4):
+			if division is not None and division.lower_bound <= mmr <= division.upper_bound:
+				return rank, division
+	for rank in ranks:
+		try:
+			return rank, rank.get_division(mmr)
+		except MMROutOfBoundError:
+			continue
+	return None, None
+
+
+def mmr_line(playlist:Playlist) -> "numpy.ndarray":
+	highest = max(div.upper_bound for rank in playlist.ranks.values() if not isinstance(rank, Unranked)
+				  for div in (rank.division_1, rank.division_2, rank.division_3, rank.division_4) if div is not None)
+	return np.arange(-50, highest + 50, 0.5)
+
+
+@mark.parametrize("playlist_name", RANKED_PLAYLISTS)
+def test_classify_many_matches_get_division(playlist_name):
+	playlist = Playlist.PLAYLISTS[playlist_name]
+	mmrs = mmr_line(playlist)
+	ranks, divisions = playlist.classify_many(mmrs, as_objects=True)
+	for mmr, rank, division in zip(mmrs.tolist(), ranks, divisions):
+		assert (rank, division) == classify(playlist, mmr), mmr
+		if rank is not None:
+			assert rank.get_division(mmr) is division
+
+
+@mark.parametrize("playlist_name", RANKED_PLAYLISTS)
+def test_classify_many_indices(playlist_name):
+	playlist = Playlist.PLAYLISTS[playlist_name]
+	mmrs = mmr_line(playlist)
+	rank_indices, division_indices = playlist.classify_many(mmrs)
+	ranks, divisions = playlist.classify_many(mmrs, as_objects=True)
+	rank_list = list(playlist.ranks.values())
+	for rank_index, division_index, rank, division in zip(rank_indices, division_indices, ranks, divisions):
+		if rank is None:
+			assert rank_index == division_index == -1
+		else:
+			assert rank_list[rank_index] is rank
+			assert getattr(rank, f"division_{division_index + 1}") is division
+
+
+def test_classify_many_keeps_the_shape():
+	playlist = Playlist.PLAYLISTS["Ranked Doubles 2v2"]
+	mmrs = [[100, 1200], [-1000, 5000]]
+	ranks, divisions = playlist.classify_many(mmrs)
+	assert ranks.shape == divisions.shape == (2, 2)
+	assert ranks[1, 0] == -1
+	assert playlist.classify_many([])[0].shape == (0,)
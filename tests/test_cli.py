@@ -0,0 +1,145 @@
+from json import dumps, loads
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from subprocess import run
+from sys import executable
+from threading import Thread
+from pytest import fixture, mark
+from rlpy import Console
+from rlpy.__main__ import _read_batch_users, main
+from .test_request_api import local_rlstats, server_url
+
+
+BATCH_INPUT = """username,console
+# a comment, then a blank line
+
+SomePlayer,Epic
+OnlyAName
+Too,Many,Values
+Someone,NotAConsole
+Missing,epic
+"""
+
+
+class _FakeDaemonHandler(StreamRequestHandler):
+	"""Answers like a ScrapeDaemon, where users named "Missing" cannot be scraped."""
+	def handle(self):
+		request = loads(self.rfile.readline())
+		self.server.requests.append(request)
+		users = [request["users"]] if request["command"] == "batch" else [[(request["username"], request["console"])]]
+		for username, console in users[0]:
+			ok = username != "Missing"
+			self.reply({"result": {"username": username, "console": console, "ok": ok, "elapsed": 0.5,
+								   "error": None if ok else "Not found", "error_type": None if ok else "UserScrapeError",
+								   "data": {"username": username, "console": console} if ok else None}})
+		self.reply({"done": True, "error": None})
+
+	def reply(self, message:dict):
+		self.wfile.write((dumps(message) + "\n").encode("utf-8"))
+
+
+@fixture
+def daemon_socket(tmp_path):
+	server = ThreadingUnixStreamServer(str(tmp_path / "rlpy.sock"), _FakeDaemonHandler)
+	server.requests = []
+	Thread(target=server.serve_forever, daemon=True).start()
+	yield server
+	server.shutdown()
+	server.server_close()
+
+
+def run_cli(*args:str) -> tuple[int, list[str], list[str]]:
+	"""Runs the command line in a new interpreter, returning its exit code, output, and the heavy modules it imported."""
+	code = ("import sys; from rlpy.__main__ import main; code = main(sys.argv[1:]); "
+			"print([name for name in ('playwright', 'bs4', 'rlpy.sync_api', 'rlpy.async_api') if name in sys.modules]); "
+			"sys.exit(code)")
+	process = run([executable, "-c", code, *args], capture_output=True, text=True, timeout=60)
+	*output, imported = process.stdout.splitlines()
+	return process.returncode, output, eval(imported)
+
+
+def read_rows(text:str) -> tuple[list[tuple[str, Console]], list[tuple[int, list[str], str]]]:
+	errors = []
+	users = _read_batch_users(text.splitlines(), lambda line_number, row, e: errors.append((line_number, row, type(e).__name__)))
+	return list(users), errors
+
+
+def test_batch_input_skips_header_comments_and_blank_lines():
+	users, errors = read_rows("username,console\n# ignored\n\n  SomePlayer , steam \n")
+	assert users == [("SomePlayer", Console.STEAM)]
+	assert errors == []
+
+
+def test_batch_input_header_only_skipped_on_first_line():
+	users, errors = read_rows("SomePlayer,steam\nusername,console\n")
+	assert users == [("SomePlayer", Console.STEAM)]
+	assert errors == [(2, ["username", "console"], "ConsoleNotFoundError")]
+
+
+@mark.parametrize("row,error", [
+	("OnlyAName", "ValueError"),
+	("Too,Many,Values", "ValueError"),
+	("Someone,NotAConsole", "ConsoleNotFoundError"),
+])
+def test_batch_input_rejects_malformed_lines(row, error):
+	users, errors = read_rows(f"SomePlayer,epic\n{row}\n")
+	assert users == [("SomePlayer", Console.EPIC_GAMES)]
+	assert errors == [(2, row.split(","), error)]
+
+
+def test_batch_writes_json_lines(local_rlstats, tmp_path):
+	input_file, output_file = tmp_path / "users.csv", tmp_path / "results.jsonl"
+	input_file.write_text(BATCH_INPUT, encoding="utf-8")
+
+	assert main(["batch", str(input_file), "-o", str(output_file), "--request-api", "-n", "2"]) == 1
+
+	records = [loads(line) for line in output_file.read_text(encoding="utf-8").splitlines()]
+	assert all(set(record) == {"username", "console", "ok", "elapsed", "error", "error_type", "data"} for record in records)
+	by_user = {record["username"]: record for record in records}
+	assert sorted(by_user) == ["Missing", "OnlyAName", "SomePlayer", "Someone", "Too"]
+
+	assert by_user["SomePlayer"]["ok"] and by_user["SomePlayer"]["error"] is None
+	assert by_user["SomePlayer"]["data"]["username"] == "SomePlayer"
+	assert by_user["SomePlayer"]["elapsed"] > 0
+
+	assert not by_user["Missing"]["ok"] and by_user["Missing"]["data"] is None
+	assert by_user["Missing"]["error_type"] == "UserScrapeError"
+
+	assert by_user["OnlyAName"]["error"].startswith("Line 5:") and by_user["OnlyAName"]["error_type"] == "ValueError"
+	assert by_user["Too"]["error"].startswith("Line 6:")
+	assert by_user["Someone"]["error_type"] == "ConsoleNotFoundError"
+	assert all(by_user[name]["elapsed"] == 0.0 for name in ("OnlyAName", "Too", "Someone"))
+
+
+def test_batch_succeeds_when_every_user_is_scraped(local_rlstats, tmp_path):
+	input_file, output_file = tmp_path / "users.csv", tmp_path / "results.jsonl"
+	input_file.write_text("SomePlayer,epic\n", encoding="utf-8")
+
+	assert main(["batch", str(input_file), "-o", str(output_file), "--request-api"]) == 0
+	assert [loads(line)["ok"] for line in output_file.read_text(encoding="utf-8").splitlines()] == [True]
+
+
+def test_user_through_the_daemon(daemon_socket):
+	code, output, imported = run_cli("user", "-u", "SomePlayer", "-c", "epic", "--socket", daemon_socket.server_address)
+	assert code == 0
+	assert loads("\n".join(output)) == {"username": "SomePlayer", "console": "epic"}
+	assert daemon_socket.requests == [{"command": "user", "username": "SomePlayer", "console": "epic", "options": {}}]
+	assert imported == []
+
+
+def test_batch_through_the_daemon(daemon_socket, tmp_path):
+	input_file = tmp_path / "users.csv"
+	input_file.write_text("SomePlayer,Epic\nMissing,steam\nSomeone,NotAConsole\n", encoding="utf-8")
+	code, output, imported = run_cli("batch", str(input_file), "--socket", daemon_socket.server_address)
+	assert code == 1
+	assert daemon_socket.requests[0]["users"] == [["SomePlayer", "Epic"], ["Missing", "Steam"]]
+	assert [(record["username"], record["ok"]) for record in map(loads, output)] == \
+		   [("Someone", False), ("SomePlayer", True), ("Missing", False)]
+	assert imported == []
+
+
+@mark.parametrize("command", [["user", "-u", "SomePlayer", "-c", "epic"], ["batch", "-"]])
+def test_missing_daemon_is_reported(command, tmp_path):
+	socket = str(tmp_path / "missing.sock")
+	code, output, imported = run_cli(*command, "--socket", socket)
+	assert code == 1
+	assert output == [f"No such file or directory: {socket}"]
@@ -0,0 +1,103 @@
+from re import fullmatch
+from pytest import mark, raises
+from rlpy import MMROutOfBoundError, Playlist, RankNotFoundError, Unranked, UnrankedPlaylist
+
+
+RANKED_PLAYLISTS = [name for name, playlist in Playlist.PLAYLISTS.items() if not isinstance(playlist, UnrankedPlaylist)]
+
+
+# region The lookups before they were indexed
+def old_get_rank(playlist:Playlist, rank_name:str):
+	rank_name = rank_name.replace("3", "III").replace("2", "II").replace("1", "I")
+	lowered = rank_name.strip().lower().replace("gc", "grand champion")
+	for key in playlist.ranks.keys():
+		if lowered == key.lower():
+			return playlist.ranks[key]
+	if lowered.startswith("c"):
+		lowered = lowered.replace("c", "champion")
+		for key in playlist.ranks.keys():
+			if lowered == key.lower():
+				return playlist.ranks[key]
+	return None
+
+
+def old_get_division(rank, mmr:int, default_div:int=None):
+	for div in (rank.division_1, rank.division_2, rank.division_3, rank.division_4):
+		if div is not None:
+			if div.lower_bound <= mmr <= div.upper_bound:
+				return div
+	if rank.division_1 is not None:
+		if 0 <= rank.division_1.lower_bound - mmr <= 15:
+			return rank.division_1
+	if rank.division_4 is not None:
+		if 0 <= mmr - rank.division_4.upper_bound <= 15:
+			return rank.division_4
+	if default_div is not None:
+		div = getattr(rank, f"division_{default_div}", None)
+		if div is not None:
+			return div
+	return None
+# endregion
+
+
+def name_variants(name:str) -> set[str]:
+	digits = name.replace("III", "3").replace("II", "2").replace(" I", " 1")
+	variants = {name, name.lower(), name.upper(), f"  {name} ", digits, digits.lower(), name.replace(" ", ""),
+				name.replace(" ", "  "), name.replace("ion", "i on"), name[:-1]}
+	words = name.split()
+	if words[0] == "Grand":
+		variants |= {f"GC{digits[-1]}", f"gc {words[-1].lower()}", f"GC {words[-1]}", f"G C {words[-1]}"}
+	elif words[0] == "Champion":
+		variants |= {f"C{digits[-1]}", f"c {words[-1].lower()}", f"C{words[-1]}", f"C  {words[-1]}"}
+	return variants
+
+
+def is_compact_champion(name:str) -> bool:
+	"""If the name is one of the short forms of Champion or Grand Champion, such as "C1", "c ii" or "GC3"."""
+	return fullmatch(r"g?c ?(i{1,3}|[1-3])", name.strip().lower()) is not None
+
+
+@mark.parametrize("playlist_name", RANKED_PLAYLISTS)
+def test_get_rank_matches_the_old_lookup(playlist_name):
+	playlist = Playlist.PLAYLISTS[playlist_name]
+	for rank_name, rank in list(playlist.ranks.items()):
+		for variant in name_variants(rank_name):
+			expected = old_get_rank(playlist, variant)
+			if expected is None and is_compact_champion(variant):
+				expected = rank  # The short forms were documented, but never matched before they were indexed
+			if expected is None:
+				with raises(RankNotFoundError):
+					playlist.get_rank(variant)
+			else:
+				assert playlist.get_rank(variant) is expected, variant
+
+
+@mark.parametrize("name, expected", [("C1", "Champion I"), ("c2", "Champion II"), ("C III", "Champion III"),
+									 ("GC1", "Grand Champion I"), ("gc 2", "Grand Champion II"),
+									 ("GCIII", "Grand Champion III"), (" champion 3 ", "Champion III")])
+def test_compact_champion_names(name, expected):
+	assert Playlist.PLAYLISTS["Ranked Doubles 2v2"].get_rank(name).name == expected
+
+
+@mark.parametrize("name", ["BronzeI", "Gold  I", "Cha mpion I", "C  I", "G C I", "C4", "Champion"])
+def test_names_with_other_spacing_are_not_found(name):
+	with raises(RankNotFoundError):
+		Playlist.PLAYLISTS["Ranked Doubles 2v2"].get_rank(name)
+
+
+@mark.parametrize("playlist_name", RANKED_PLAYLISTS)
+def test_get_division_matches_the_old_scan(playlist_name):
+	for rank in list(Playlist.PLAYLISTS[playlist_name].ranks.values()):
+		if isinstance(rank, Unranked):  # Added by get_rank("Unranked") to playlists without an Unranked tier
+			continue
+		divisions = [div for div in (rank.division_1, rank.division_2, rank.division_3, rank.division_4) if div is not None]
+		low = min(div.lower_bound for div in divisions) - 40
+		high = max(div.upper_bound for div in divisions) + 40
+		for mmr in range(low, high + 1):
+			for default_div in (None, 2):
+				expected = old_get_division(rank, mmr, default_div)
+				if expected is None:
+					with raises(MMROutOfBoundError):
+						rank.get_division(mmr, default_div)
+				else:
+					assert rank.get_division(mmr, default_div) is expected, (rank.name, mmr)
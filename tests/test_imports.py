@@ -0,0 +1,35 @@
+from subprocess import run
+from sys import executable
+from pytest import mark
+import rlpy
+
+
+HEAVY_MODULES = ("playwright", "bs4", "numpy", "lxml", "selectolax", "httpx", "tabulate", "pytz")
+
+
+def imported_modules(code:str) -> list[str]:
+	"""Runs the code in a new interpreter, returning which of `HEAVY_MODULES` it imported."""
+	code = f"{code}\nimport sys\nprint([name for name in {HEAVY_MODULES!r} if name in sys.modules])"
+	process = run([executable, "-c", code], capture_output=True, text=True, timeout=60, check=True)
+	return eval(process.stdout.splitlines()[-1])
+
+
+def test_import_loads_no_heavy_modules():
+	assert imported_modules("import rlpy") == []
+
+
+def test_star_import_loads_no_heavy_modules():
+	assert imported_modules("from rlpy import *") == []
+
+
+@mark.parametrize("name", rlpy.__all__)
+def test_every_exported_name_exists(name):
+	assert getattr(rlpy, name) is not None
+
+
+def test_star_import_exports_lazy_names():
+	namespace = {}
+	exec("from rlpy import *", namespace)
+	for name in ("RLTeam", "Match", "StarLeague", "BaseUser", "ScrapeResult", "get_timezone", "scrape_skill_distributions",
+				 "Console", "UserScrapeError", "UserCache", "RateLimiter", "UserPlaylist"):
+		assert namespace[name] is getattr(rlpy, name)
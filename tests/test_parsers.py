@@ -0,0 +1,109 @@
+from pytest import importorskip, mark, raises
+from rlpy import Console, UserScrapeError, get_parser
+from rlpy.parsers import slice_html
+from rlpy.sync_api.user import User
+from rlpy.user import parse_profile
+from .conftest import FIXTURES, load_fixture
+
+
+BACKENDS = [("html.parser", "bs4"), ("lxml", "lxml"), ("selectolax", "selectolax")]
+
+
+def collapse_whitespace(value):
+	"""The extracted text with runs of whitespace collapsed, since backends keep different whitespace-only text nodes."""
+	if isinstance(value, str):
+		return " ".join(value.split())
+	if isinstance(value, dict):
+		return {key: collapse_whitespace(item) for key, item in value.items()}
+	if isinstance(value, list):
+		return [collapse_whitespace(item) for item in value]
+	return value
+
+
+def scraped_data(page:str, **kwargs) -> dict | type:
+	"""The data processed from a saved page, without its update time, or the type of error processing it raised."""
+	try:
+		data = User("SomePlayer", Console.EPIC_GAMES)._process_html(load_fixture(page), **kwargs).to_dict()
+	except UserScrapeError as e:
+		return type(e)
+	del data["updated_at"]
+	return data
+
+
+@mark.parametrize("page", FIXTURES)
+@mark.parametrize("backend, module", BACKENDS)
+def test_backends_extract_the_same_text(backend, module, page):
+	importorskip(module)
+	expected = collapse_whitespace(parse_profile(load_fixture(page), "html.parser"))
+	assert collapse_whitespace(parse_profile(load_fixture(page), backend)) == expected
+
+
+@mark.parametrize("page", FIXTURES)
+@mark.parametrize("backend, module", BACKENDS)
+def test_backends_process_the_same_user(backend, module, page):
+	importorskip(module)
+	assert scraped_data(page, parser=backend) == scraped_data(page, parser="html.parser")
+
+
+@mark.parametrize("backend, module", BACKENDS)
+def test_error_page_raises_with_every_backend(backend, module):
+	importorskip(module)
+	with raises(UserScrapeError):
+		User("SomePlayer", Console.EPIC_GAMES)._process_html(load_fixture("error"), parser=backend)
+
+
+def test_unknown_backend():
+	with raises(ValueError):
+		get_parser("html5lib")
+
+
+# region Partial parsing
+EDGE_CASES = {
+	"nested": '<div class="keep"><div><div class="keep inner">a</div><div>b</div></div>c</div><div>outside</div>',
+	"void_tags": '<div class="keep">a<br>b<br/><img src="x.png"><input value="1"/>c</div><div>outside</div>',
+	"self_closing_same_tag": '<div class="keep">a<div/>b</div>c</div><div>outside</div>',
+	"quoted_gt_in_opening": '<div title="1 > 0" class="keep" data-x=\'a>b\'>a<span>b</span></div><div>outside</div>',
+	"quoted_gt_in_nested": '<div class="keep"><div title="x>y">a</div><div data-x=\'</div>\'>b</div>c</div><p>outside</p>',
+	"quoted_selector_in_other_attribute": '<div data-x=\'class="keep"\'>outside</div><div class="keep">a</div>',
+	"unquoted_and_single_quoted": "<div class=keep>a</div><div class='other keep'>b</div><div class='keeper'>no</div>",
+	"uppercase": '<DIV CLASS="keep">a<Div>b</DIV>c</div><div>outside</div>',
+	"unclosed": '<div class="keep">a<div>b',
+}
+
+
+def selected_text(html:str, selector:str) -> list[str]:
+	return [node.text for node in get_parser("html.parser").parse(html).select(selector)]
+
+
+@mark.parametrize("case", EDGE_CASES)
+def test_slice_keeps_what_a_full_parse_finds(case):
+	html = f"<html><body><p>before</p>{EDGE_CASES[case]}<p>after</p></body></html>"
+	sliced = slice_html(html, (("div.keep", False),))
+	assert selected_text(sliced, "div.keep") == selected_text(html, "div.keep")
+	assert "outside" not in sliced and "before" not in sliced
+
+
+def test_slice_finds_ids_and_only_the_first_match():
+	html = '<section id="userinfo" title="a>b">first</section><section id="userinfo">second</section><section id="other">x</section>'
+	sliced = slice_html(html, (("section#userinfo", True),))
+	assert selected_text(sliced, "section") == ["first"]
+
+
+def test_slice_missing_region():
+	html = '<div class="keep">a</div>'
+	assert slice_html(html, (("div.keep", False), ("section#userinfo", True))) is None
+	assert selected_text(slice_html(html, (("div.keep", True), ("div.error", False))), "div") == ["a"]
+
+
+@mark.parametrize("page", FIXTURES)
+def test_partial_parse_matches_a_full_parse(page):
+	assert scraped_data(page, partial_parse=True) == scraped_data(page)
+	html = load_fixture(page)
+	assert parse_profile(html, "html.parser", User.PROFILE_REGIONS) == parse_profile(html, "html.parser")
+
+
+def test_partial_parse_falls_back_to_a_full_parse():
+	html = load_fixture("ranked").replace('<section id="userinfo"', '<section id="user-info"')
+	assert slice_html(html, User.PROFILE_REGIONS) is None
+	assert parse_profile(html, "html.parser", User.PROFILE_REGIONS) == parse_profile(html, "html.parser")
+# endregion
@@ -0,0 +1,55 @@
+from pytest import approx
+from rlpy import Console, RateLimiter
+from rlpy.sync_api.user import User
+from .conftest import load_fixture
+
+
+URL = "https://rlstats.net/profile/Epic/SomePlayer"
+
+
+class _FlakyClient(object):
+	"""Stands in for a RequestClient, failing once before returning the page."""
+	def __init__(self):
+		self.calls = 0
+
+	def get(self, url:str, rate_limiter:RateLimiter=None) -> str:
+		self.calls += 1
+		if self.calls == 1:
+			raise ConnectionError("reset")
+		return load_fixture("ranked")
+
+
+def test_retry_delay_does_not_block_the_host():
+	limiter = RateLimiter(burst=10)
+	for attempt in range(1, 5):
+		assert 2 ** (attempt - 1) / 2 <= limiter.retry_delay(attempt) <= 2 ** (attempt - 1)
+	assert limiter.retry_delay(20) <= limiter.max_delay
+	assert limiter.reserve(URL) == 0
+
+
+def test_backoff_blocks_the_host():
+	limiter = RateLimiter(burst=10)
+	assert limiter.backoff(URL, 1, retry_after=30) == 30
+	assert limiter.reserve(URL) == approx(30, abs=1)
+	assert limiter.reserve("https://nsl.leaguespot.gg/") == 0
+
+
+def test_throttled_halves_the_rate():
+	limiter = RateLimiter(rate=8)
+	limiter.throttled(URL, 1, retry_after=0)
+	assert limiter.current_rate(URL) == 4
+	limiter.succeeded(URL)
+	assert limiter.current_rate(URL) == 4.5
+
+
+def test_failed_scrape_retries_without_blocking_the_host():
+	limiter, client = RateLimiter(burst=10, base_delay=0.01), _FlakyClient()
+	User("SomePlayer", Console.EPIC_GAMES).get_data(use_request_api=True, client=client, rate_limiter=limiter, cache=None)
+	assert client.calls == 2
+	assert limiter.reserve(URL) == 0
+
+
+def test_retry_after_is_capped():
+	limiter = RateLimiter(burst=10, max_delay=60)
+	assert limiter.backoff(URL, 1, retry_after=86400) == 60
+	assert limiter.reserve(URL) == approx(60, abs=1)
@@ -0,0 +1,134 @@
+from asyncio import CancelledError, run
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from pytest import fixture, raises
+from rlpy import Console, RateLimiter, UserScrapeError
+from rlpy.request_api import AsyncRequestClient, RequestClient
+from rlpy.async_api.user import User as AsyncUser
+from rlpy.sync_api.user import User
+from rlpy.user import BaseUser
+from .conftest import load_fixture
+
+
+PAGES = {"/profile/Epic/SomePlayer": load_fixture("ranked")}
+THROTTLED_ONCE = {"/throttled"}
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+	def do_GET(self):
+		if self.path in THROTTLED_ONCE:
+			THROTTLED_ONCE.remove(self.path)
+			self.send_response(429)
+			self.send_header("Retry-After", "0")
+			self.send_header("Content-Length", "0")
+			self.end_headers()
+			return
+		page = PAGES.get(self.path.replace("/throttled", "/profile/Epic/SomePlayer"), None)
+		body = (page or "<title>404 Not Found</title>").encode("utf-8")
+		self.send_response(404 if page is None else 200)
+		self.send_header("Content-Type", "text/html; charset=utf-8")
+		self.send_header("Content-Length", str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+	def log_message(self, format, *args):
+		pass
+
+
+@fixture(scope="module")
+def server_url():
+	server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+	Thread(target=server.serve_forever, daemon=True).start()
+	yield f"http://127.0.0.1:{server.server_port}"
+	server.shutdown()
+	server.server_close()
+
+
+@fixture
+def local_rlstats(server_url, monkeypatch):
+	monkeypatch.setattr(BaseUser, "RLSTATS_URL", server_url)
+	return server_url
+
+
+def fast_limiter() -> RateLimiter:
+	return RateLimiter(rate=1000, burst=1000, base_delay=0)
+
+
+class _FlakyClient(object):
+	"""Stands in for an AsyncRequestClient, raising each of `errors` before returning the page."""
+	def __init__(self, *errors:BaseException):
+		self.errors = list(errors)
+		self.calls = 0
+
+	async def get(self, url:str, rate_limiter:RateLimiter=None) -> str:
+		self.calls += 1
+		if self.errors:
+			raise self.errors.pop(0)
+		return load_fixture("ranked")
+
+
+def test_request_client_downloads_page(local_rlstats):
+	with RequestClient(rate_limiter=fast_limiter()) as client:
+		assert client.get(f"{local_rlstats}/profile/Epic/SomePlayer") == PAGES["/profile/Epic/SomePlayer"]
+
+
+def test_request_client_missing_page(local_rlstats):
+	with RequestClient(rate_limiter=fast_limiter()) as client:
+		with raises(UserScrapeError):
+			client.get(f"{local_rlstats}/profile/Epic/Missing")
+
+
+def test_request_client_retries_throttled_requests(local_rlstats):
+	limiter = fast_limiter()
+	with RequestClient(rate_limiter=limiter) as client:
+		assert client.get(f"{local_rlstats}/throttled") == PAGES["/profile/Epic/SomePlayer"]
+	assert limiter.current_rate(local_rlstats) < limiter.rate
+
+
+def test_request_client_uses_the_given_rate_limiter(local_rlstats):
+	own, given = RateLimiter(rate=0.01, burst=1), RateLimiter(rate=0.01, burst=1)
+	with RequestClient(rate_limiter=own) as client:
+		client.get(f"{local_rlstats}/profile/Epic/SomePlayer", rate_limiter=given)
+	assert given.reserve(local_rlstats) > 1
+	assert own.reserve(local_rlstats) < 1
+
+
+def test_request_data_parses_page(local_rlstats):
+	with RequestClient(rate_limiter=fast_limiter()) as client:
+		user = User("SomePlayer", Console.EPIC_GAMES).get_data(use_request_api=True, client=client, cache=None)
+	assert user.goals == 2345
+	assert user.get_playlist("Ranked Standard 3v3").rank.name == "Champion II"
+	assert user.get_playlist("Ranked Standard 3v3").mmr == 1219
+
+
+def test_async_request_data_parses_page(local_rlstats):
+	async def scrape():
+		async with AsyncRequestClient(rate_limiter=fast_limiter()) as client:
+			return await AsyncUser("SomePlayer", Console.EPIC_GAMES).get_data(use_request_api=True, client=client,
+																			   cache=None)
+
+	user = run(scrape())
+	assert user.wins == 1234
+	assert user.get_playlist("Ranked Doubles 2v2").rank.name == "Champion I"
+
+
+def test_request_data_missing_page_is_not_retried(local_rlstats):
+	with RequestClient(rate_limiter=fast_limiter()) as client:
+		with raises(UserScrapeError):
+			User("Missing", Console.EPIC_GAMES).get_data(use_request_api=True, client=client, cache=None)
+
+
+def test_async_request_data_retries_errors():
+	client = _FlakyClient(ConnectionError("reset"))
+	user = run(AsyncUser("SomePlayer", Console.EPIC_GAMES)._request_data(client=client, rate_limiter=fast_limiter(),
+																		 delay_seconds=0, cache=None))
+	assert client.calls == 2
+	assert user.goals == 2345
+
+
+def test_async_request_data_does_not_retry_cancellation():
+	client = _FlakyClient(CancelledError())
+	with raises(CancelledError):
+		run(AsyncUser("SomePlayer", Console.EPIC_GAMES)._request_data(client=client, rate_limiter=fast_limiter(),
+																	  delay_seconds=0, cache=None))
+	assert client.calls == 1
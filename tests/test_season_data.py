@@ -0,0 +1,184 @@
+from os import stat, utime
+from shutil import copyfile
+from threading import Barrier, Thread
+from time import sleep
+from pytest import fixture, mark, raises
+import rlpy._enum_classes as enum_classes
+from rlpy import SEASONS, MMROutOfBoundError, Playlist, SeasonNotFoundError, SeasonRegistry, UserPlaylist
+from rlpy._enum_classes import _LazyPlaylists, _load_season_file, _read_season_cache, _season_cache_path
+
+
+@fixture
+def unloaded_playlists(monkeypatch) -> _LazyPlaylists:
+	"""Replaces `Playlist.PLAYLISTS` with one that has not loaded the current season yet."""
+	playlists = _LazyPlaylists()
+	monkeypatch.setattr(Playlist, "PLAYLISTS", playlists)
+	return playlists
+
+
+@fixture
+def season_file(tmp_path) -> str:
+	"""A copy of the current season's data that can be changed."""
+	path = str(tmp_path / "season.json")
+	copyfile(SEASONS.files["current"], path)
+	return path
+
+
+OLD_SEASONS = ("6", "8", "9", "10")
+RANKED_PLAYLISTS = ("Ranked Duel 1v1", "Ranked Doubles 2v2", "Ranked Standard 3v3")
+
+
+def parse_fails(file_path:str):
+	raise AssertionError(f"{file_path} was parsed instead of read from its compiled copy.")
+
+
+def test_concurrent_first_reads_wait_for_the_load(unloaded_playlists, monkeypatch):
+	loads = []
+
+	def slow_load(file_path, use_cache=True):
+		loads.append(file_path)
+		sleep(0.05)
+		return _load_season_file(file_path, use_cache)
+
+	monkeypatch.setattr(enum_classes, "_load_season_file", slow_load)
+	start, found = Barrier(16), []
+
+	def read():
+		start.wait()
+		found.append(Playlist.PLAYLISTS.get("Ranked Doubles 2v2"))
+
+	threads = [Thread(target=read) for _ in range(16)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	assert len(loads) == 1
+	assert len(found) == 16 and None not in found
+	assert len(set(map(id, found))) == 1
+
+
+def test_failed_load_is_retried(unloaded_playlists, tmp_path):
+	with raises(FileNotFoundError):
+		Playlist.load_data(str(tmp_path / "missing.json"))
+	assert not unloaded_playlists.loaded
+	assert Playlist.PLAYLISTS.get("Hoops") is not None
+	assert unloaded_playlists.loaded
+
+
+def test_season_file_is_compiled_once(season_file, monkeypatch):
+	first = _load_season_file(season_file)
+	assert _read_season_cache(season_file) is not None
+
+	monkeypatch.setattr(Playlist, "_parse_season", parse_fails)
+	second = _load_season_file(season_file)
+	assert second.keys() == first.keys()
+	assert second["Hoops"].get_rank("Gold II").name == "Gold II"
+
+
+def test_changed_season_file_is_recompiled(season_file):
+	_load_season_file(season_file)
+	with open(season_file, encoding="utf-8") as f:
+		data = f.read()
+	with open(season_file, "w", encoding="utf-8") as f:
+		f.write(data.replace('"Gold II"', '"Golden II"'))
+	assert _read_season_cache(season_file) is None
+
+	playlists = _load_season_file(season_file)
+	assert "Golden II" in playlists["Hoops"].ranks
+	assert _read_season_cache(season_file) is not None
+
+
+def test_touched_season_file_is_recompiled(season_file):
+	_load_season_file(season_file)
+	info = stat(season_file)
+	utime(season_file, ns=(info.st_atime_ns, info.st_mtime_ns + 1_000_000_000))
+	assert _read_season_cache(season_file) is None
+
+
+def test_cache_version_change_is_recompiled(season_file, monkeypatch):
+	_load_season_file(season_file)
+	monkeypatch.setattr(enum_classes, "_SEASON_CACHE_VERSION", enum_classes._SEASON_CACHE_VERSION + 1)
+	assert _read_season_cache(season_file) is None
+
+
+def test_corrupt_cache_is_recompiled(season_file):
+	_load_season_file(season_file)
+	with open(_season_cache_path(season_file), "wb") as f:
+		f.write(b"not a pickle")
+	assert _read_season_cache(season_file) is None
+	assert "Hoops" in _load_season_file(season_file)
+	assert _read_season_cache(season_file) is not None
+
+
+def test_cache_can_be_skipped(season_file):
+	_load_season_file(season_file, use_cache=False)
+	assert _read_season_cache(season_file) is None
+
+
+@mark.parametrize("season", OLD_SEASONS)
+def test_old_seasons_load(season):
+	assert season in SEASONS and int(season) in SEASONS and f"Season {season}" in SEASONS
+	playlists = SEASONS[season]
+	assert SEASONS[int(season)] is playlists
+	assert set(RANKED_PLAYLISTS) <= set(playlists)
+	for name in RANKED_PLAYLISTS:
+		ranks = [rank for rank in playlists[name].ranks.values() if rank.division_1 is not None and rank.name != "Unranked"]
+		assert len(ranks) >= 20
+		bounds = [rank.division_1.lower_bound for rank in ranks]
+		assert bounds == sorted(bounds)
+		assert all(rank.playlist_name == name for rank in ranks)
+
+
+@mark.parametrize("season", OLD_SEASONS)
+def test_old_seasons_load_without_the_cache(season):
+	registry = SeasonRegistry(use_cache=False)
+	fresh = registry[season]["Ranked Doubles 2v2"].get_rank("GC3")
+	assert fresh.division_1.lower_bound == SEASONS[season]["Ranked Doubles 2v2"].get_rank("GC3").division_1.lower_bound
+
+
+def test_get_rank_in_another_season():
+	current = Playlist.PLAYLISTS["Ranked Doubles 2v2"]
+	rank = current.get_rank("GC3", season=6)
+	assert rank is SEASONS[6]["Ranked Doubles 2v2"].get_rank("Grand Champion III")
+	assert rank.division_1.lower_bound != current.get_rank("GC3").division_1.lower_bound
+	assert current.get_rank("GC3", season="current") is current.get_rank("GC3")
+
+
+def test_get_division_in_another_season():
+	rank = Playlist.PLAYLISTS["Ranked Doubles 2v2"].get_rank("GC3")
+	old_rank = SEASONS[6]["Ranked Doubles 2v2"].get_rank("GC3")
+	mmr = old_rank.division_2.lower_bound
+	assert rank.get_division(mmr, season=6) is old_rank.division_2
+	with raises(MMROutOfBoundError):
+		rank.get_division(mmr)
+
+
+def test_user_playlist_from_text_in_another_season():
+	old_rank = SEASONS[6]["Ranked Doubles 2v2"].get_rank("GC3")
+	mmr = f"{old_rank.division_2.lower_bound:,}"
+	playlist = UserPlaylist.from_text("Ranked Doubles 2v2", "Grand Champion III", "Division II", mmr, "3", 10, season=6)
+	assert playlist.rank is old_rank
+	assert playlist.division is old_rank.division_2
+	assert playlist.mmr == old_rank.division_2.lower_bound
+
+
+def test_unknown_season():
+	assert 99 not in SEASONS
+	with raises(SeasonNotFoundError, match="season 99"):
+		SEASONS[99]
+	with raises(SeasonNotFoundError):
+		SEASONS.get_playlist("Ranked Doubles 2v2", season=99)
+	with raises(SeasonNotFoundError):
+		Playlist.PLAYLISTS["Ranked Doubles 2v2"].get_rank("GC3", season=99)
+	with raises(SeasonNotFoundError):
+		Playlist.PLAYLISTS["Ranked Doubles 2v2"].get_rank("GC3").get_division(1700, season=99)
+	with raises(SeasonNotFoundError):
+		UserPlaylist.from_text("Ranked Doubles 2v2", "Grand Champion III", "Division II", "1,700", "3", 10, season=99)
+
+
+def test_registered_season(season_file):
+	registry = SeasonRegistry()
+	registry.register("Season 99", season_file)
+	assert "99" in registry.seasons
+	assert registry[99]["Ranked Doubles 2v2"].get_rank("GC3").division_1.lower_bound == \
+		   Playlist.PLAYLISTS["Ranked Doubles 2v2"].get_rank("GC3").division_1.lower_bound
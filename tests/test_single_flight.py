@@ -0,0 +1,104 @@
+from asyncio import CancelledError, Event, create_task, gather, run, sleep, wait_for
+from pytest import raises
+from rlpy.async_api.single_flight import SingleFlight
+
+
+class _Call(object):
+	"""A call that counts how often it runs, and blocks until it is released."""
+	def __init__(self):
+		self.calls = 0
+		self.started = Event()
+		self.release = Event()
+
+	async def __call__(self) -> int:
+		self.calls += 1
+		self.started.set()
+		await self.release.wait()
+		return self.calls
+
+
+def test_concurrent_calls_share_a_result():
+	async def main():
+		flight, call = SingleFlight(), _Call()
+		tasks = [create_task(flight.run("key", call)) for _ in range(5)]
+		await call.started.wait()
+		call.release.set()
+		results = [await task for task in tasks]
+		return call.calls, results, len(flight)
+
+	calls, results, remaining = run(main())
+	assert calls == 1
+	assert results == [1] * 5
+	assert remaining == 0
+
+
+def test_cancelled_leader_hands_the_call_to_a_follower():
+	async def main():
+		flight, call = SingleFlight(), _Call()
+		leader = create_task(flight.run("key", call))
+		await call.started.wait()
+		followers = [create_task(flight.run("key", call)) for _ in range(3)]
+		await sleep(0)
+
+		call.started.clear()
+		leader.cancel()
+		with raises(CancelledError):
+			await leader
+		await wait_for(call.started.wait(), timeout=1)
+		call.release.set()
+		results = [await follower for follower in followers]
+		return call.calls, results
+
+	calls, results = run(main())
+	assert calls == 2
+	assert results == [2] * 3
+
+
+def test_cancelled_follower_does_not_cancel_the_call():
+	async def main():
+		flight, call = SingleFlight(), _Call()
+		leader = create_task(flight.run("key", call))
+		await call.started.wait()
+		follower = create_task(flight.run("key", call))
+		await sleep(0)
+
+		follower.cancel()
+		with raises(CancelledError):
+			await follower
+		call.release.set()
+		result = await leader
+		return call.calls, result
+
+	assert run(main()) == (1, 1)
+
+
+def test_exceptions_are_shared():
+	async def fail():
+		await sleep(0)
+		raise ValueError("failed")
+
+	async def main():
+		flight = SingleFlight()
+		return await gather(flight.run("key", fail), flight.run("key", fail), return_exceptions=True)
+
+	results = run(main())
+	assert all(isinstance(result, ValueError) for result in results)
+	assert results[0] is results[1]
+
+
+def test_follower_cancelled_with_its_leader_stops():
+	async def main():
+		flight, call = SingleFlight(), _Call()
+		leader = create_task(flight.run("key", call))
+		await call.started.wait()
+		follower = create_task(flight.run("key", call))
+		await sleep(0)
+
+		leader.cancel()
+		follower.cancel()
+		for task in (leader, follower):
+			with raises(CancelledError):
+				await task
+		return call.calls, len(flight)
+
+	assert run(main()) == (1, 0)
@@ -0,0 +1,255 @@
+from asyncio import Event, create_task, run, wait_for
+from collections import Counter
+from json import load
+from threading import Barrier, Lock
+from time import time
+from pytest import importorskip
+from rlpy import RateLimiter
+from .conftest import load_fixture
+
+importorskip("playwright")
+importorskip("pytz")
+
+from playwright.sync_api import TimeoutError
+from rlpy.async_api.starleague import _RosterScraper
+from rlpy.sync_api.starleague import STARLEAGUE_URL, _scrape_player, _scrape_rosters, nace_starleague_session
+from rlpy.tools import save_storage_state, storage_state_expired
+from .test_tools import storage_state
+
+
+class _RosterClient(object):
+	"""Stands in for a request client. Handles starting with "broken" fail with an unexpected error."""
+	def get(self, url:str, rate_limiter:RateLimiter=None) -> str:
+		if url.rsplit("/", 1)[-1].startswith("broken"):
+			raise RuntimeError(f"Unexpected page layout at {url}")
+		return load_fixture("ranked")
+
+
+class _AsyncRosterClient(_RosterClient):
+	async def get(self, url:str, rate_limiter:RateLimiter=None) -> str:
+		return super().get(url, rate_limiter)
+
+
+class _OverlappingClient(object):
+	"""Only returns once `parties` downloads are running at the same time, and counts how often each profile is loaded."""
+	def __init__(self, parties:int):
+		self.barrier = Barrier(parties, timeout=5)
+		self.calls = Counter()
+		self._lock = Lock()
+
+	def get(self, url:str, rate_limiter:RateLimiter=None) -> str:
+		with self._lock:
+			self.calls[url.rsplit("/", 1)[-1]] += 1
+		self.barrier.wait()
+		return load_fixture("ranked")
+
+
+class _AsyncOverlappingClient(object):
+	def __init__(self, parties:int):
+		self.parties = parties
+		self.running = 0
+		self.all_running = Event()
+		self.calls = Counter()
+
+	async def get(self, url:str, rate_limiter:RateLimiter=None) -> str:
+		self.calls[url.rsplit("/", 1)[-1]] += 1
+		self.running += 1
+		if self.running == self.parties:
+			self.all_running.set()
+		await wait_for(self.all_running.wait(), timeout=5)
+		return load_fixture("ranked")
+
+
+class _FakeLocator(object):
+	"""Stands in for the Playwright locators `_RosterScraper.prefetch` reads a roster through."""
+	def __init__(self, text:str="", children:dict[str, list["_FakeLocator"]]=None):
+		self.text = text
+		self.children = children or {}
+
+	def locator(self, selector:str) -> "_FakeLocator":
+		return _FakeLocator(children={"": self.children.get(selector, [])})
+
+	def get_by_alt_text(self, text:str) -> "_FakeLocator":
+		return self.locator(text)
+
+	async def all(self) -> list["_FakeLocator"]:
+		return self.children[""]
+
+	async def count(self) -> int:
+		return len(self.children[""])
+
+	async def inner_text(self) -> str:
+		return self.children[""][0].text
+
+
+def fake_roster(*players:tuple[bool, list[str]]) -> _FakeLocator:
+	"""A roster of players, each being if they are the captain and their verified handles."""
+	return _FakeLocator(children={"li.match-user": [
+		_FakeLocator(children={
+			"div.match-user__handle": [_FakeLocator(children={"Verified": [_FakeLocator()], "span": [_FakeLocator(handle)]})
+									   for handle in handles],
+			"div.avatar.small.avatar__role--captain": [_FakeLocator()] if is_captain else [],
+		}) for is_captain, handles in players
+	]})
+
+
+class _LoginBrowser(object):
+	"""
+	Stands in for a Playwright browser on NACE StarLeague. A context loaded with a session in `accepted` is sent on from
+	the login page, and filling in the login form gives a new session.
+	"""
+	def __init__(self, *accepted:dict):
+		self.accepted = list(accepted)
+		self.logins = 0
+		self.loaded = []
+
+	def new_context(self, storage_state:str=None, **kwargs) -> "_LoginContext":
+		state = None
+		self.loaded.append(storage_state)
+		if storage_state is not None:
+			with open(storage_state, encoding="utf-8") as f:
+				state = load(f)
+		return _LoginContext(self, state)
+
+
+class _LoginContext(object):
+	def __init__(self, browser:_LoginBrowser, state:dict | None):
+		self.browser = browser
+		self.state = state
+
+	def new_page(self) -> "_LoginPage":
+		return _LoginPage(self)
+
+	def storage_state(self) -> dict:
+		return self.state
+
+
+class _LoginPage(object):
+	def __init__(self, context:_LoginContext):
+		self.context = context
+
+	def goto(self, url:str, **kwargs):
+		return None
+
+	def locator(self, selector:str) -> "_LoginPage":
+		return self
+
+	def type(self, text:str):
+		pass
+
+	def click(self, **kwargs):
+		self.context.browser.logins += 1
+		self.context.state = storage_state(("nsl.leaguespot.gg", time() + 3600))
+		self.context.state["cookies"][0]["value"] = f"login-{self.context.browser.logins}"
+		self.context.browser.accepted.append(self.context.state)
+
+	def wait_for_url(self, url:str, timeout:float=None):
+		if self.context.state not in self.context.browser.accepted:
+			raise TimeoutError(f"Timed out waiting for {url}")
+
+
+def login(browser:_LoginBrowser, path) -> _LoginPage:
+	return nace_starleague_session(browser, "user", "password", str(path), rate_limiter=RateLimiter(base_delay=0),
+								   verify_timeout=0)
+
+
+def scrape_options(client) -> dict:
+	return {"use_request_api": True, "client": client, "rate_limiter": RateLimiter(base_delay=0), "max_tries": 1,
+			"cache": None}
+
+
+def test_player_falls_back_to_the_next_handle():
+	result = _scrape_player(["broken", "SomePlayer"], **scrape_options(_RosterClient()))
+	assert result.ok
+	assert result.user.username == "SomePlayer"
+
+
+def test_unexpected_errors_are_recorded():
+	result = _scrape_player(["broken", "broken_too"], **scrape_options(_RosterClient()))
+	assert not result.ok
+	assert isinstance(result.error, RuntimeError)
+	assert result.user.username == "broken_too"
+
+
+def test_rosters_keep_the_players_that_failed():
+	rosters = [("Home", [(True, ["SomePlayer"]), (False, ["broken"])]), ("Away", [(True, ["broken"])])]
+	home, away = _scrape_rosters(rosters, **scrape_options(_RosterClient()))
+	assert [user.username for user in home] == ["SomePlayer"]
+	assert home.captain.username == "SomePlayer"
+	assert [result.user.username for result in home.failed] == ["broken"]
+	assert len(away) == 0 and away.captain is None
+	assert isinstance(away.failed[0].error, RuntimeError)
+
+
+def test_async_roster_keeps_the_players_that_failed():
+	async def main():
+		async with _RosterScraper(**scrape_options(_AsyncRosterClient())) as scraper:
+			roster = [(True, create_task(scraper._scrape_player(("SomePlayer",)))),
+					  (False, create_task(scraper._scrape_player(("broken",))))]
+			return await scraper.team("Home", roster)
+
+	team = run(main())
+	assert team.captain.username == "SomePlayer"
+	assert len(team.failed) == 1
+	assert isinstance(team.failed[0].error, RuntimeError)
+
+
+def test_rosters_are_downloaded_at_the_same_time():
+	client = _OverlappingClient(3)
+	rosters = [("Home", [(True, ["First"]), (False, ["Shared"])]), ("Away", [(True, ["Third"]), (False, ["Shared"])])]
+	home, away = _scrape_rosters(rosters, concurrency=3, **scrape_options(client))
+	assert not home.failed and not away.failed
+	assert [user.username for user in home] == ["First", "Shared"]
+	assert [user.username for user in away] == ["Third", "Shared"]
+	assert client.calls == {"First": 1, "Shared": 1, "Third": 1}
+
+
+def test_async_rosters_share_players_and_scrape_at_the_same_time():
+	client = _AsyncOverlappingClient(3)
+
+	async def main():
+		async with _RosterScraper(**scrape_options(client)) as scraper:
+			home = await scraper.prefetch(fake_roster((True, ["First"]), (False, ["Shared"])))
+			away = await scraper.prefetch(fake_roster((False, ["Shared"]), (True, ["Third"])))
+			assert home[1][1] is away[0][1]
+			return await scraper.team("Home", home), await scraper.team("Away", away)
+
+	home, away = run(main())
+	assert not home.failed and not away.failed
+	assert home.captain.username == "First" and away.captain.username == "Third"
+	assert [user.username for user in home] == ["First", "Shared"]
+	assert [user.username for user in away] == ["Third", "Shared"]
+	assert client.calls == {"First": 1, "Shared": 1, "Third": 1}
+
+
+def test_session_is_saved_and_reused(tmp_path):
+	path = tmp_path / "nsl.json"
+	browser = _LoginBrowser()
+	first = login(browser, path)
+	assert browser.logins == 1
+	assert not storage_state_expired(str(path))
+
+	second = login(browser, path)
+	assert browser.logins == 1
+	assert browser.loaded == [None, str(path)]
+	assert second.context.state == first.context.state
+
+
+def test_rejected_session_logs_in_again(tmp_path):
+	path = tmp_path / "nsl.json"
+	save_storage_state(storage_state(("nsl.leaguespot.gg", time() + 3600)), str(path))
+	browser = _LoginBrowser()
+	page = login(browser, path)
+	assert browser.logins == 1
+	with open(path, encoding="utf-8") as f:
+		assert load(f) == page.context.state
+
+
+def test_expired_session_is_not_loaded(tmp_path):
+	path = tmp_path / "nsl.json"
+	expired = storage_state(("nsl.leaguespot.gg", time() - 1))
+	save_storage_state(expired, str(path))
+	browser = _LoginBrowser(expired)
+	login(browser, path)
+	assert browser.loaded == [None]
+	assert browser.logins == 1
@@ -0,0 +1,55 @@
+from json import dump, loads
+from os import listdir
+from time import time
+from rlpy.tools import save_storage_state, storage_state_expired
+
+
+def storage_state(*cookies:tuple[str, float]) -> dict:
+	"""A Playwright storage state holding a cookie for each domain and expiry time."""
+	return {"cookies": [{"name": "session", "value": "abc", "domain": domain, "path": "/", "expires": expires}
+						for domain, expires in cookies], "origins": []}
+
+
+def write_state(path, state) -> str:
+	with open(path, "w", encoding="utf-8") as f:
+		dump(state, f)
+	return str(path)
+
+
+def test_saved_state_round_trips(tmp_path):
+	state = storage_state((".leaguespot.gg", time() + 3600))
+	path = tmp_path / "sessions" / "nsl.json"
+	save_storage_state(state, str(path))
+	assert loads(path.read_text(encoding="utf-8")) == state
+	assert listdir(path.parent) == ["nsl.json"]
+
+
+def test_saving_replaces_the_old_state(tmp_path):
+	path = str(tmp_path / "nsl.json")
+	save_storage_state(storage_state(("nsl.leaguespot.gg", 1)), path)
+	save_storage_state(storage_state(("nsl.leaguespot.gg", time() + 3600)), path)
+	assert not storage_state_expired(path)
+	assert sorted(listdir(tmp_path)) == ["nsl.json"]
+
+
+def test_fresh_and_session_cookies_are_not_expired(tmp_path):
+	assert not storage_state_expired(write_state(tmp_path / "fresh.json", storage_state((".leaguespot.gg", time() + 3600))))
+	assert not storage_state_expired(write_state(tmp_path / "session.json", storage_state(("nsl.leaguespot.gg", -1))))
+
+
+def test_expired_cookie(tmp_path):
+	path = write_state(tmp_path / "nsl.json", storage_state(("nsl.leaguespot.gg", time() + 3600), (".leaguespot.gg", time() - 1)))
+	assert storage_state_expired(path)
+
+
+def test_other_domains_are_ignored(tmp_path):
+	assert storage_state_expired(write_state(tmp_path / "other.json", storage_state(("example.com", time() + 3600))))
+	path = write_state(tmp_path / "mixed.json", storage_state(("example.com", time() - 1), ("nsl.leaguespot.gg", time() + 3600)))
+	assert not storage_state_expired(path)
+
+
+def test_missing_or_unreadable_state_is_expired(tmp_path):
+	assert storage_state_expired(str(tmp_path / "missing.json"))
+	(tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+	assert storage_state_expired(str(tmp_path / "broken.json"))
+	assert storage_state_expired(write_state(tmp_path / "list.json", []))
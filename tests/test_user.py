@@ -0,0 +1,57 @@
+from pytest import mark
+from rlpy import SCRAPE_PROFILES, Console, RateLimiter
+from rlpy.user import BaseUser, parse_profile
+from rlpy.sync_api.user import User
+from .conftest import load_fixture
+
+
+class _FixtureClient(object):
+	"""Stands in for a RequestClient, returning the same saved page for every request."""
+	def __init__(self, page:str):
+		self.html = load_fixture(page)
+		self.calls = 0
+
+	def get(self, url:str, rate_limiter:RateLimiter=None) -> str:
+		self.calls += 1
+		return self.html
+
+
+def scrape(client:_FixtureClient, **kwargs) -> User:
+	return User("SomePlayer", Console.EPIC_GAMES).get_data(use_request_api=True, client=client,
+														   rate_limiter=RateLimiter(base_delay=0), **kwargs)
+
+
+@mark.parametrize("page", ["ranked", "unranked", "casual_only"])
+def test_scraping_twice_uses_the_default_cache(page):
+	client = _FixtureClient(page)
+	first = scrape(client)
+	second = scrape(client)
+	assert client.calls == 1
+	assert second.to_dict() == first.to_dict()
+	assert BaseUser.CACHE.stats["hits"] == 1
+
+
+@mark.parametrize("page", ["ranked", "unranked", "casual_only"])
+def test_unchanged_page_loads_the_cached_snapshot(page):
+	client = _FixtureClient(page)
+	first = scrape(client)
+	second = scrape(client, cache_ttl=0)
+	assert client.calls == 2
+	assert second.to_dict() == first.to_dict()
+
+
+def scraped_data(user:User) -> dict:
+	"""The user's data, without the update time that is worked out from when the page was processed."""
+	data = user.to_dict()
+	del data["updated_at"]
+	return data
+
+
+@mark.parametrize("profile", list(SCRAPE_PROFILES) + [SCRAPE_PROFILES["fast"]])
+def test_named_scrape_profile_is_processed(profile):
+	html = load_fixture("ranked")
+	expected = scraped_data(User("SomePlayer", Console.EPIC_GAMES)._process_html(html))
+
+	assert scraped_data(User("SomePlayer", Console.EPIC_GAMES)._process_html(html, profile=profile)) == expected
+	assert scraped_data(User("SomePlayer", Console.EPIC_GAMES)._process_extracted(parse_profile(html), profile=profile)) == expected
+	assert scraped_data(scrape(_FixtureClient("ranked"), profile=profile, cache=None)) == expected
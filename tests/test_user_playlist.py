@@ -0,0 +1,36 @@
+from pytest import mark
+from rlpy import Playlist, UserPlaylist
+
+
+PLAYLIST_NAMES = list(Playlist.PLAYLISTS.keys())
+
+
+def round_trip(user_playlist:UserPlaylist) -> UserPlaylist:
+	return UserPlaylist.from_dict(user_playlist.to_dict())
+
+
+@mark.parametrize("playlist_name", PLAYLIST_NAMES)
+def test_every_rank_round_trips(playlist_name):
+	playlist = Playlist.PLAYLISTS[playlist_name]
+	for rank in list(playlist.ranks.values()):
+		for division in (rank.division_1, rank.division_2, rank.division_3, rank.division_4):
+			if division is None:
+				continue
+			user_playlist = UserPlaylist(playlist, rank, division, 1000, 2, 30)
+			rebuilt = round_trip(user_playlist)
+			assert rebuilt.to_dict() == user_playlist.to_dict()
+			assert rebuilt.rank is rank
+
+
+@mark.parametrize("playlist_name", PLAYLIST_NAMES)
+def test_unranked_round_trips(playlist_name):
+	user_playlist = UserPlaylist.from_text(playlist_name, "Unranked", "Division I", "600", "0", "0")
+	rebuilt = round_trip(user_playlist)
+	assert rebuilt.to_dict() == user_playlist.to_dict()
+	assert round_trip(rebuilt).to_dict() == user_playlist.to_dict()
+
+
+def test_unranked_tournament_round_trips():
+	user_playlist = UserPlaylist.from_text("3v3 Tournament", "Unranked", "Division I", "600", "0", "0")
+	assert user_playlist.to_dict()["rank"] == "Un-Ranked"
+	assert round_trip(user_playlist).to_dict() == user_playlist.to_dict()